@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks Brlok (génération, stockage, exports) sur données synthétiques.
+
+    python -m benchmarks.run -o benchmarks/baseline.json
+    python -m benchmarks.run -o current.json
+    python -m benchmarks.compare benchmarks/baseline.json current.json --threshold 0.2
+"""
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Cas mesurés : génération, stockage et exports.
+
+Chaque ``Case`` a une préparation (non mesurée) qui reçoit le répertoire de
+données de la mesure, y écrit les fichiers nécessaires et retourne la
+fonction à chronométrer. Le runner redirige ``get_data_dir`` vers ce
+répertoire : les fichiers de l'utilisateur ne sont jamais touchés.
+"""
+from __future__ import annotations
+
+import itertools
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.factories import (
+    CATALOG_SIZES,
+    FAVORITES_SIZE,
+    HISTORY_SIZE,
+    make_block,
+    make_catalog,
+    make_collection,
+    make_favorites,
+    make_history,
+    make_session,
+)
+from brlok.config.difficulty import DISTRIBUTION_PATTERNS
+from brlok.models import Catalog, CompletedSession
+
+GROUP_GENERATOR = "generator"
+GROUP_STORAGE = "storage"
+GROUP_EXPORTS = "exports"
+
+# Séances du livret PDF mesuré
+BOOKLET_SIZE = 50
+
+
+@dataclass(frozen=True)
+class Case:
+    """Un benchmark : nom unique, groupe, préparation et nombre de répétitions."""
+
+    name: str
+    group: str
+    setup: Callable[[Path], Callable[[], object]]
+    repeat: int = 5
+
+
+@lru_cache(maxsize=None)
+def _catalog(n_holds: int) -> Catalog:
+    return make_catalog(n_holds, seed=n_holds)
+
+
+@lru_cache(maxsize=None)
+def _history(n_sessions: int) -> tuple[CompletedSession, ...]:
+    return tuple(make_history(_catalog(CATALOG_SIZES[0]), n_sessions))
+
+
+def _generator_cases(sizes: tuple[int, ...]) -> list[Case]:
+    from brlok.generator import generate_session
+
+    cases = []
+    for n in sizes:
+        for pattern, _ in DISTRIBUTION_PATTERNS:
+            def setup(_data: Path, n: int = n, pattern: str = pattern) -> Callable[[], object]:
+                catalog = _catalog(n)
+                seeds = itertools.count(1)
+                return lambda: generate_session(
+                    catalog, 3, seed=next(seeds), distribution_pattern=pattern
+                )
+            cases.append(Case(f"generate/{pattern}/{n}", GROUP_GENERATOR, setup))
+
+        def setup_variety(_data: Path, n: int = n) -> Callable[[], object]:
+            catalog = _catalog(n)
+            seeds = itertools.count(1)
+            return lambda: generate_session(catalog, 3, seed=next(seeds), variety=True)
+        cases.append(Case(f"generate/variety/{n}", GROUP_GENERATOR, setup_variety))
+    return cases
+
+
+def _storage_cases(sizes: tuple[int, ...], history_size: int, favorites_size: int) -> list[Case]:
+    from brlok.storage.best_times_store import record_time_if_best
+    from brlok.storage.catalog_collection_store import load_collection, save_collection
+    from brlok.storage.favorites_store import load_favorites, save_favorites
+    from brlok.storage.history_store import add_to_history, load_history, save_history
+
+    def setup_load_collection(_data: Path) -> Callable[[], object]:
+        save_collection(make_collection(sizes))
+        return load_collection
+
+    def setup_save_collection(_data: Path) -> Callable[[], object]:
+        collection = make_collection(sizes)
+        return lambda: save_collection(collection)
+
+    def setup_history(_data: Path) -> Callable[[], object]:
+        save_history(list(_history(history_size)))
+        return load_history
+
+    def setup_add_to_history(_data: Path) -> Callable[[], object]:
+        save_history(list(_history(history_size)))
+        session = make_session(_catalog(sizes[0]), seed=1)
+        statuses = {i: "success" for i in range(len(session.blocks))}
+        return lambda: add_to_history(session, statuses, catalog_id=f"cat{sizes[0]}")
+
+    def setup_load_favorites(_data: Path) -> Callable[[], object]:
+        for n in sizes:
+            save_favorites(f"cat{n}", make_favorites(_catalog(n), favorites_size, seed=n))
+        cid = f"cat{sizes[-1]}"
+        return lambda: load_favorites(cid)
+
+    def setup_record_time(_data: Path) -> Callable[[], object]:
+        catalog = _catalog(sizes[0])
+        rng = random.Random(0)
+        for _ in range(favorites_size):
+            record_time_if_best(make_block(catalog, rng), 60.0)
+        block = make_block(catalog, rng)
+        # Temps toujours meilleur : chaque appel réécrit le fichier (chemin coûteux)
+        times = itertools.count(10_000.0, -0.001)
+        return lambda: record_time_if_best(block, next(times))
+
+    return [
+        Case("storage/load_collection", GROUP_STORAGE, setup_load_collection),
+        Case("storage/save_collection", GROUP_STORAGE, setup_save_collection),
+        Case(f"storage/load_history/{history_size}", GROUP_STORAGE, setup_history, repeat=3),
+        Case(f"storage/add_to_history/{history_size}", GROUP_STORAGE, setup_add_to_history, repeat=3),
+        Case(f"storage/load_favorites/{favorites_size}", GROUP_STORAGE, setup_load_favorites),
+        Case(f"storage/record_time_if_best/{favorites_size}", GROUP_STORAGE, setup_record_time),
+    ]
+
+
+def _export_cases(sizes: tuple[int, ...], history_size: int) -> list[Case]:
+    from brlok.exports import (
+        export_json,
+        export_markdown,
+        export_pdf,
+        export_pdf_booklet,
+        export_session,
+        export_stream,
+        export_txt,
+    )
+
+    catalog = _catalog(sizes[0])
+
+    def _single(fn: Callable, suffix: str, with_catalog: bool = True) -> Callable[[Path], Callable[[], object]]:
+        def setup(data: Path) -> Callable[[], object]:
+            session = make_session(catalog, seed=2)
+            out = data / f"session{suffix}"
+            if with_catalog:
+                return lambda: fn(session, out, catalog=catalog)
+            return lambda: fn(session, out)
+        return setup
+
+    def setup_booklet(data: Path) -> Callable[[], object]:
+        sessions = [make_session(catalog, seed=i) for i in range(BOOKLET_SIZE)]
+        out = data / "booklet.pdf"
+        return lambda: export_pdf_booklet(sessions, out, catalog=catalog)
+
+    def setup_jsonl(data: Path) -> Callable[[], object]:
+        history = _history(history_size)
+        out = data / "history.jsonl"
+        return lambda: export_stream(history, out)
+
+    def setup_cached(data: Path) -> Callable[[], object]:
+        session = make_session(catalog, seed=3)
+        out = data / "cached.pdf"
+        export_session(session, out, catalog=catalog)
+        return lambda: export_session(session, out, catalog=catalog)
+
+    return [
+        Case("export/txt", GROUP_EXPORTS, _single(export_txt, ".txt")),
+        Case("export/markdown", GROUP_EXPORTS, _single(export_markdown, ".md")),
+        Case("export/json", GROUP_EXPORTS, _single(export_json, ".json", with_catalog=False)),
+        Case("export/pdf", GROUP_EXPORTS, _single(export_pdf, ".pdf")),
+        Case(f"export/pdf_booklet/{BOOKLET_SIZE}", GROUP_EXPORTS, setup_booklet, repeat=3),
+        Case(f"export/jsonl/{history_size}", GROUP_EXPORTS, setup_jsonl, repeat=3),
+        Case("export/pdf_cached", GROUP_EXPORTS, setup_cached),
+    ]
+
+
+def build_cases(
+    sizes: tuple[int, ...] = CATALOG_SIZES,
+    history_size: int = HISTORY_SIZE,
+    favorites_size: int = FAVORITES_SIZE,
+) -> list[Case]:
+    """Tous les cas, pour les tailles de catalogue, d'historique et de favoris données."""
+    return (
+        _generator_cases(sizes)
+        + _storage_cases(sizes, history_size, favorites_size)
+        + _export_cases(sizes, history_size)
+    )
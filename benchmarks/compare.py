@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Compare des résultats de benchmarks à une référence.
+
+    python -m benchmarks.compare benchmarks/baseline.json current.json --threshold 0.2
+
+Un cas régresse si son temps dépasse celui de la référence de plus de
+``threshold`` (0.2 = +20 %). Code de sortie 1 s'il y a au moins une
+régression, 0 sinon. Les cas absents de l'un des deux fichiers sont listés
+sans être comptés.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_THRESHOLD = 0.2
+METRICS = ("best_s", "median_s")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Un cas présent dans les deux fichiers."""
+
+    name: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else float("inf")
+
+
+def compare(baseline: dict, current: dict, metric: str = "best_s") -> tuple[list[Comparison], list[str], list[str]]:
+    """(cas communs, cas absents du courant, nouveaux cas) de deux documents de résultats."""
+    base, cur = baseline["results"], current["results"]
+    common = [Comparison(name, base[name][metric], cur[name][metric]) for name in base if name in cur]
+    missing = [name for name in base if name not in cur]
+    added = [name for name in cur if name not in base]
+    return common, missing, added
+
+
+def regressions(comparisons: list[Comparison], threshold: float = DEFAULT_THRESHOLD) -> list[Comparison]:
+    """Cas plus lents que la référence de plus de ``threshold``."""
+    return [c for c in comparisons if c.ratio > 1 + threshold]
+
+
+def _load(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare des résultats de benchmarks à une référence.")
+    parser.add_argument("baseline", type=Path, help="Résultats de référence (JSON)")
+    parser.add_argument("current", type=Path, help="Résultats à comparer (JSON)")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Écart relatif toléré avant régression (défaut : 0.2 = +20 %%)",
+    )
+    parser.add_argument("--metric", choices=METRICS, default="best_s", help="Temps comparé (défaut : best_s)")
+    args = parser.parse_args(argv)
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    if baseline.get("config") != current.get("config"):
+        print("Attention : tailles de données différentes entre les deux fichiers.", file=sys.stderr)
+    common, missing, added = compare(baseline, current, args.metric)
+    slow = {c.name for c in regressions(common, args.threshold)}
+    for c in common:
+        flag = "RÉGRESSION" if c.name in slow else ""
+        print(
+            f"{c.name:<40} {c.baseline_s * 1e3:>10.3f} ms {c.current_s * 1e3:>10.3f} ms "
+            f"{(c.ratio - 1) * 100:>+8.1f} %  {flag}"
+        )
+    for name in missing:
+        print(f"{name:<40} absent des résultats courants")
+    for name in added:
+        print(f"{name:<40} nouveau (pas de référence)")
+    print(f"{len(slow)} régression(s) au-delà de +{args.threshold * 100:.0f} % sur {len(common)} cas.")
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
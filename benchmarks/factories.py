@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Données synthétiques reproductibles pour les benchmarks.
+
+Catalogues en grille libre (pas de normalisation 7×6), séances, historiques
+et favoris tirés d'un ``random.Random`` à graine fixe : deux exécutions
+mesurent exactement les mêmes données.
+"""
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime, timedelta
+
+from brlok.models import (
+    Block,
+    Catalog,
+    CatalogCollection,
+    CatalogEntry,
+    CompletedSession,
+    GridDimensions,
+    Hold,
+    Position,
+    Session,
+    SessionConstraints,
+)
+
+# Tailles de catalogue mesurées (42 = pan par défaut 7×6)
+CATALOG_SIZES = (42, 500, 5000)
+HISTORY_SIZE = 10_000
+FAVORITES_SIZE = 1_000
+
+TAGS = ("réglette", "bac", "pince", "inversée", "plat", "trou")
+_EPOCH = datetime(2025, 1, 1, 18, 0)
+
+
+def make_catalog(n_holds: int, seed: int = 0) -> Catalog:
+    """Catalogue de ``n_holds`` prises sur une grille libre ~ 7:6."""
+    rng = random.Random(seed)
+    cols = max(6, round(math.sqrt(n_holds * 6 / 7)))
+    rows = math.ceil(n_holds / cols)
+    holds = [
+        Hold(
+            id=f"H{i}",
+            level=rng.randint(1, 5),
+            tags=rng.sample(TAGS, rng.randint(0, 2)),
+            position=Position(row=i // cols, col=i % cols),
+        )
+        for i in range(n_holds)
+    ]
+    return Catalog(holds=holds, grid=GridDimensions(rows=rows, cols=cols), free_grid=True)
+
+
+def make_block(catalog: Catalog, rng: random.Random, n_holds: int = 10) -> Block:
+    """Bloc de ``n_holds`` prises du catalogue avec deux pieds."""
+    holds = rng.sample(catalog.holds, min(n_holds, len(catalog.holds)))
+    feet = [(rng.randrange(4), rng.randrange(6)) for _ in range(2)]
+    return Block(holds=holds, foot_positions=feet)
+
+
+def make_session(catalog: Catalog, seed: int = 0, blocks: int = 5, holds_per_block: int = 10) -> Session:
+    """Séance de ``blocks`` blocs (taille par défaut de la génération)."""
+    rng = random.Random(seed)
+    return Session(
+        blocks=[make_block(catalog, rng, holds_per_block) for _ in range(blocks)],
+        constraints=SessionConstraints(target_level=3, enchainements=holds_per_block),
+    )
+
+
+def make_history(catalog: Catalog, n_sessions: int = HISTORY_SIZE, seed: int = 0) -> list[CompletedSession]:
+    """Historique de ``n_sessions`` séances, de la plus récente à la plus ancienne."""
+    rng = random.Random(seed)
+    history = []
+    for i in range(n_sessions):
+        session = make_session(catalog, seed=rng.getrandbits(32))
+        history.append(
+            CompletedSession(
+                id=f"s{i}",
+                date=_EPOCH - timedelta(days=i // 2, hours=rng.randrange(6)),
+                session=session,
+                block_statuses={b: rng.choice(("success", "fail")) for b in range(len(session.blocks))},
+            )
+        )
+    return history
+
+
+def make_favorites(catalog: Catalog, n_blocks: int = FAVORITES_SIZE, seed: int = 0) -> list[Block]:
+    """``n_blocks`` blocs favoris titrés."""
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(n_blocks):
+        block = make_block(catalog, rng, rng.randint(4, 12))
+        blocks.append(block.model_copy(update={"title": f"Favori {i}"}))
+    return blocks
+
+
+def make_collection(sizes: tuple[int, ...] = CATALOG_SIZES) -> CatalogCollection:
+    """Collection d'un catalogue par taille ; le premier est actif."""
+    entries = [
+        CatalogEntry(id=f"cat{n}", name=f"Pan {n}", catalog=make_catalog(n, seed=n)) for n in sizes
+    ]
+    return CatalogCollection(catalogs=entries, active_id=entries[0].id)
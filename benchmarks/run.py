@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Exécute les benchmarks et écrit les résultats en JSON.
+
+    python -m benchmarks.run -o benchmarks/baseline.json
+    python -m benchmarks.run --quick -k generate/ -o current.json
+
+Chaque cas est chronométré avec ``timeit`` : calibrage du nombre de boucles
+(``autorange``, ≥ 0,2 s par mesure, sert aussi d'échauffement) puis
+``repeat`` mesures ; on garde le meilleur temps et la médiane par appel.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.cases import Case, build_cases
+from benchmarks.factories import CATALOG_SIZES, FAVORITES_SIZE, HISTORY_SIZE
+
+RESULTS_VERSION = 1
+
+# Tailles réduites (--quick) : vérification rapide, pas de comparaison avec la référence complète
+QUICK_SIZES = (42, 500)
+QUICK_HISTORY_SIZE = 500
+QUICK_FAVORITES_SIZE = 100
+
+
+def run_case(case: Case, data_dir: Path) -> dict:
+    """Mesure un cas dans ``data_dir`` (répertoire de données isolé)."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with patch("brlok.config.paths.get_data_dir", return_value=data_dir):
+        fn = case.setup(data_dir)
+        timer = timeit.Timer(fn)
+        number, _ = timer.autorange()
+        per_call = [t / number for t in timer.repeat(case.repeat, number)]
+    return {
+        "group": case.group,
+        "best_s": min(per_call),
+        "median_s": statistics.median(per_call),
+        "loops": number,
+        "repeat": case.repeat,
+    }
+
+
+def run(cases: list[Case], config: dict, echo=print) -> dict:
+    """Mesure ``cases`` et retourne le document de résultats."""
+    results: dict[str, dict] = {}
+    root = Path(tempfile.mkdtemp(prefix="brlok-bench-"))
+    try:
+        for i, case in enumerate(cases):
+            result = run_case(case, root / str(i))
+            results[case.name] = result
+            echo(f"{case.name:<40} {result['best_s'] * 1e3:>10.3f} ms  (×{result['loops']})")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks Brlok (génération, stockage, exports).")
+    parser.add_argument("-o", "--output", type=Path, help="Fichier JSON des résultats")
+    parser.add_argument("-k", "--filter", default="", help="Ne mesurer que les cas dont le nom contient ce texte")
+    parser.add_argument("--quick", action="store_true", help="Tailles réduites (vérification rapide)")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        config = {"sizes": list(QUICK_SIZES), "history": QUICK_HISTORY_SIZE, "favorites": QUICK_FAVORITES_SIZE}
+    else:
+        config = {"sizes": list(CATALOG_SIZES), "history": HISTORY_SIZE, "favorites": FAVORITES_SIZE}
+    cases = [
+        c for c in build_cases(tuple(config["sizes"]), config["history"], config["favorites"])
+        if args.filter in c.name
+    ]
+    if not cases:
+        print(f"Aucun cas ne correspond à {args.filter!r}", file=sys.stderr)
+        return 1
+    doc = run(cases, config)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(doc, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Résultats écrits dans {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
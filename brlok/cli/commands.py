@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
 """Application Typer et sous-commandes CLI."""
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import typer
 from pydantic import ValidationError
 
-from brlok.exports import export_json as export_json_fn
-from brlok.exports import export_markdown
-from brlok.exports import export_pdf
-from brlok.exports import export_txt
+from brlok.exports import export_pdf_booklet
+from brlok.exports import export_session
+from brlok.exports import export_stream
+from brlok.exports.cache import FORMAT_JSON, FORMAT_MD, FORMAT_PDF, FORMAT_TXT
+from brlok.config.difficulty import block_level_to_target
 from brlok.generator import generate_session
-from brlok.models import Session
-from brlok.storage.catalog_store import load_catalog, save_catalog
+from brlok.generator.plan import compile_template
+from brlok import profiling
+from brlok.models import DEFAULT_GRID, GridDimensions, Session
+from brlok.storage.catalog_store import MAX_GRID_SIZE, create_default_catalog, load_catalog, save_catalog
 from brlok.storage.import_ods import import_catalog_from_ods
 from brlok.storage.catalog_ops import update_hold_active, update_hold_level, update_hold_tags, _parse_tags_input
 from brlok.storage.catalog_collection_store import (
@@ -21,12 +25,24 @@ from brlok.storage.catalog_collection_store import (
     set_active_catalog,
 )
 from brlok.storage.favorites_store import load_favorites
-from brlok.storage.history_store import get_by_id, load_history
+from brlok.storage.hold_usage_store import load_usage_prior
+from brlok.storage.history_store import get_by_id, iter_history, load_history
 from brlok.storage.templates_store import get_template_by_name, load_templates, remove_template, rename_template
 
 app = typer.Typer(help="Brlok - Application d'entraînement bloc et pan.")
 
-_LEVEL_MAP = {"facile": 1, "modéré": 2, "modere": 2, "difficile": 3}
+@app.callback()
+def main_options(
+    profile: bool = typer.Option(
+        False, "--profile", help="Mesure les temps (stockage, génération, exports) ; récapitulatif à la sortie"
+    ),
+    profile_trace: Path | None = typer.Option(
+        None, "--profile-trace", help="Mesure les temps et écrit une trace Chrome (JSON) dans ce fichier"
+    ),
+) -> None:
+    """Brlok - Application d'entraînement bloc et pan."""
+    if profile or profile_trace:
+        profiling.enable(trace_path=profile_trace)
 
 
 @app.command()
@@ -38,6 +54,17 @@ def generate(
     tags: str | None = typer.Option(None, "--tags", "-t", help="Tags à inclure (filtrer), ex. crimp,sloper"),
     exclude_tags: str | None = typer.Option(None, "--exclude-tags", help="Tags exclus (filtrer), ex. sloper"),
     variety: bool = typer.Option(False, "--variety", "-v", help="Éviter les répétitions de prises dans les blocs"),
+    avoid_recent: int | None = typer.Option(
+        None, "--avoid-recent", help="Re-tirer les blocs déjà grimpés dans les N derniers jours"
+    ),
+    max_reach: float | None = typer.Option(
+        None, "--max-reach", min=0, help="Distance max (en cases) entre prises consécutives"
+    ),
+    min_reach: float | None = typer.Option(
+        None, "--min-reach", min=0, help="Distance min (en cases) entre prises consécutives"
+    ),
+    seed: int | None = typer.Option(None, "--seed", help="Graine : même séance sur toute machine"),
+    best_of: int = typer.Option(1, "--best-of", min=1, max=1024, help="Tirer K séances et garder la mieux notée"),
     output: Path | None = typer.Option(None, "--output", "-o", help="Fichier de sortie (txt, md ou json)"),
 ) -> None:
     """Génère une séance d'entraînement."""
@@ -45,6 +72,7 @@ def generate(
     blocks_count = blocks
     n_enchainements = enchainements
     target_level = level
+    plan = None
 
     if not template and level is None:
         typer.echo("Indiquez --level ou --template", err=True)
@@ -60,15 +88,10 @@ def generate(
             raise typer.Exit(1)
         blocks_count = blocks_count if blocks_count is not None else tpl.blocks_count
         n_enchainements = n_enchainements if n_enchainements is not None else tpl.holds_per_block
+        # Même plan que la GUI : niveau et répartition propres à chaque bloc du template
+        plan = compile_template(tpl, blocks_count)
         if target_level is None and tpl.blocks_config:
-            cfg = tpl.blocks_config[0]
-            val = cfg.level
-            if isinstance(val, int):
-                target_level = val
-            else:
-                target_level = _LEVEL_MAP.get(str(val).lower().strip(), 2)
-    else:
-        target_level = level
+            target_level = block_level_to_target(tpl.blocks_config[0].level)
 
     if target_level is None:
         target_level = 2
@@ -99,7 +122,15 @@ def generate(
         required_tags=required_tags if required_tags else None,
         excluded_tags=excluded_tags if excluded_tags else None,
         variety=variety,
+        usage_prior=load_usage_prior(load_collection().active_id) if variety else None,
+        avoid_recent_days=avoid_recent,
+        best_of=best_of,
+        seed=seed,
+        max_reach=max_reach,
+        min_reach=min_reach,
         favorite_blocks=favorites if favorites else None,
+        distribution_pattern=plan.distribution_pattern if plan else "uniforme",
+        plan=plan,
     )
     if blocks_count and blocks_count > 0 and len(session.blocks) <= n_favorites:
         typer.echo(
@@ -115,6 +146,12 @@ def generate(
         parts.append(f"exclu: {','.join(excluded_tags)}")
     if variety:
         parts.append("variété")
+    if avoid_recent:
+        parts.append(f"hors blocs des {avoid_recent} derniers jours")
+    if best_of > 1:
+        parts.append(f"meilleure de {best_of}")
+    if seed is not None:
+        parts.append(f"graine: {seed}")
     if template:
         parts.append(f"template: {template}")
     if favorites:
@@ -125,15 +162,7 @@ def generate(
         typer.echo(f"  Bloc {i}: {ids}")
 
     if output:
-        suffix = output.suffix.lower()
-        if suffix == ".pdf":
-            export_pdf(session, output)
-        elif suffix == ".txt":
-            export_txt(session, output)
-        elif suffix in (".md", ".markdown"):
-            export_markdown(session, output)
-        else:
-            export_json_fn(session, output)
+        export_session(session, output, catalog=catalog)
         typer.echo(f"Exporté dans {output}")
 
 
@@ -181,6 +210,18 @@ def catalog_use(
     raise typer.Exit(1)
 
 
+@catalog_app.command("new")
+def catalog_new(
+    name: str = typer.Argument(..., help="Nom du catalogue"),
+    rows: int = typer.Option(DEFAULT_GRID.rows, "--rows", min=1, max=MAX_GRID_SIZE, help="Nombre de lignes"),
+    cols: int = typer.Option(DEFAULT_GRID.cols, "--cols", min=1, max=MAX_GRID_SIZE, help="Nombre de colonnes"),
+) -> None:
+    """Crée un catalogue (toutes les cases remplies) ; hors 7×6 : grille libre (board, spray wall)."""
+    catalog = create_default_catalog(GridDimensions(rows=rows, cols=cols))
+    entry = add_catalog(name, catalog)
+    typer.echo(f"Catalogue créé : {entry.name} (id: {entry.id}), {len(catalog.holds)} prises, grille {rows}×{cols}")
+
+
 @catalog_app.command("list")
 def catalog_list() -> None:
     """Affiche la liste des prises du catalogue."""
@@ -248,7 +289,7 @@ def favorites_list() -> None:
         typer.echo(f"  {i}. {ids}")
 
 
-export_app = typer.Typer(help="Export de séances (TXT, Markdown, JSON, PDF).")
+export_app = typer.Typer(help="Export de séances (TXT, Markdown, JSON, PDF, JSON Lines).")
 
 
 @export_app.command("txt")
@@ -258,7 +299,7 @@ def export_txt_cmd(
 ) -> None:
     """Exporte une séance en TXT."""
     session = _load_session(input_file)
-    export_txt(session, output)
+    export_session(session, output, FORMAT_TXT)
     typer.echo(f"Exporté dans {output}")
 
 
@@ -269,7 +310,7 @@ def export_md_cmd(
 ) -> None:
     """Exporte une séance en Markdown."""
     session = _load_session(input_file)
-    export_markdown(session, output)
+    export_session(session, output, FORMAT_MD)
     typer.echo(f"Exporté dans {output}")
 
 
@@ -280,21 +321,82 @@ def export_json_cmd(
 ) -> None:
     """Exporte une séance en JSON (copie ou conversion)."""
     session = _load_session(input_file)
-    export_json_fn(session, output)
+    export_session(session, output, FORMAT_JSON)
     typer.echo(f"Exporté dans {output}")
 
 
 @export_app.command("pdf")
 def export_pdf_cmd(
-    input_file: Path = typer.Argument(..., help="Fichier JSON de la séance"),
+    input_file: Path | None = typer.Argument(None, help="Fichier JSON de la séance (sans --history)"),
     output: Path = typer.Option(..., "--output", "-o", help="Fichier PDF de sortie"),
+    history: bool = typer.Option(False, "--history", help="Livret des séances de l'historique"),
+    since: str | None = typer.Option(
+        None, "--since", help="Avec --history : depuis une date (AAAA-MM-JJ) ou N jours (ex. 7d, 30d)"
+    ),
 ) -> None:
-    """Exporte une séance en PDF."""
+    """Exporte une séance en PDF, ou un livret de séances de l'historique.
+
+    Le livret est chronologique alors que l'historique est stocké du plus
+    récent au plus ancien : les séances de la période sont gardées en mémoire
+    pour être inversées (tout l'historique sans ``--since``), les autres sont
+    écartées au fil de la lecture.
+    """
+    if history:
+        start = _parse_since(since) if since else None
+        entries = [cs for cs in iter_history() if start is None or cs.date >= start]
+        if not entries:
+            typer.echo("(aucune séance sur la période)")
+            raise typer.Exit(1)
+        entries.reverse()
+        count = export_pdf_booklet(entries, output, catalog=load_catalog())
+        typer.echo(f"{count} séance(s) exportée(s) dans {output}")
+        return
+    if input_file is None:
+        typer.echo("Fichier de séance ou --history requis.", err=True)
+        raise typer.Exit(1)
     session = _load_session(input_file)
-    export_pdf(session, output)
+    export_session(session, output, FORMAT_PDF)
     typer.echo(f"Exporté dans {output}")
 
 
+@export_app.command("jsonl")
+def export_jsonl_cmd(
+    output: str = typer.Option("-", "--output", "-o", help="Fichier de sortie (- : sortie standard)"),
+    favorites: bool = typer.Option(False, "--favorites", help="Blocs favoris au lieu de l'historique"),
+    blocks: bool = typer.Option(False, "--blocks", help="Un bloc par ligne (défaut : une séance)"),
+    since: str | None = typer.Option(None, "--since", help="Historique depuis une date (AAAA-MM-JJ) ou N jours"),
+    as_array: bool = typer.Option(False, "--array", help="Tableau JSON au lieu de JSON Lines"),
+    gzip_out: bool = typer.Option(False, "--gzip", help="Compresser (gzip ; automatique si .gz)"),
+) -> None:
+    """Exporte l'historique (ou les favoris) en flux JSON Lines, pour fichiers ou tubes."""
+    if favorites:
+        items = load_favorites()
+    else:
+        start = _parse_since(since) if since else None
+        items = (cs for cs in iter_history() if start is None or cs.date >= start)
+    count = export_stream(
+        items,
+        output,
+        fmt="json" if as_array else "jsonl",
+        unit="block" if blocks else "session",
+        compress=gzip_out or None,
+    )
+    # Résumé sur stderr : la sortie standard reste exploitable par un tube
+    typer.echo(f"{count} enregistrement(s) exporté(s)", err=True)
+
+
+def _parse_since(value: str) -> datetime:
+    """« 7d » (il y a 7 jours) ou date ISO « AAAA-MM-JJ »."""
+    text = value.strip().lower()
+    try:
+        if text.endswith("d") and text[:-1].isdigit():
+            return datetime.now() - timedelta(days=int(text[:-1]))
+        return datetime.fromisoformat(text)
+    except ValueError:
+        typer.echo(f"Période invalide : {value} (attendu AAAA-MM-JJ ou Nd)", err=True)
+        raise typer.Exit(1)
+
+
 def _load_session(path: Path) -> Session:
     """Charge une Session depuis un fichier JSON."""
     if not path.exists():
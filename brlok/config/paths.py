@@ -46,6 +46,16 @@ def get_best_times_path() -> Path:
     return get_data_dir() / "best_times.json"
 
 
+def get_hold_usage_path() -> Path:
+    """Chemin du fichier hold_usage.json (usage des prises, variété inter-séances)."""
+    return get_data_dir() / "hold_usage.json"
+
+
+def get_export_cache_dir() -> Path:
+    """Dossier du cache des exports déjà rendus (export_cache/)."""
+    return get_data_dir() / "export_cache"
+
+
 def get_catalog_collection_path() -> Path:
     """Chemin du fichier catalog_collection.json (7.1)."""
     return get_data_dir() / "catalog_collection.json"
@@ -1,5 +1,15 @@
 # -*- coding: utf-8 -*-
 """Exports TXT, MD, JSON, PDF (FR18, FR19, FR20, FR41)."""
-from brlok.exports.exporters import export_json, export_markdown, export_pdf, export_txt
+from brlok.exports.exporters import export_json, export_markdown, export_pdf, export_pdf_booklet, export_txt
+from brlok.exports.cache import export_session
+from brlok.exports.jsonl import export_stream
 
-__all__ = ["export_txt", "export_markdown", "export_json", "export_pdf"]
+__all__ = [
+    "export_txt",
+    "export_markdown",
+    "export_json",
+    "export_pdf",
+    "export_pdf_booklet",
+    "export_session",
+    "export_stream",
+]
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Cache des exports : réutilise un fichier déjà rendu pour une séance identique.
+
+Clé : empreinte (contenu de la séance, format, empreinte du catalogue,
+version de l'exporteur, options). Un export déjà produit est recopié depuis
+le cache au lieu d'être rendu à nouveau (le PDF est le cas coûteux). Le
+cache est borné en taille : les fichiers les moins récemment utilisés sont
+supprimés au-delà de ``MAX_CACHE_BYTES``.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from brlok.exports.diagram import THEME_LIGHT, catalog_fingerprint
+from brlok.exports.exporters import export_json, export_markdown, export_pdf, export_txt
+from brlok.models import Catalog, Session
+from brlok.profiling import count, profiled
+
+logger = logging.getLogger(__name__)
+
+FORMAT_PDF = "pdf"
+FORMAT_TXT = "txt"
+FORMAT_MD = "md"
+FORMAT_JSON = "json"
+
+# À incrémenter quand la sortie d'un exporteur change (invalide le cache du format)
+EXPORTER_VERSIONS = {FORMAT_PDF: 2, FORMAT_TXT: 2, FORMAT_MD: 2, FORMAT_JSON: 1}
+
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+_SUFFIX_FORMATS = {".pdf": FORMAT_PDF, ".txt": FORMAT_TXT, ".md": FORMAT_MD, ".markdown": FORMAT_MD}
+
+
+def _get_cache_dir() -> Path:
+    from brlok.config.paths import get_export_cache_dir
+    return get_export_cache_dir()
+
+
+def format_for_path(path: Path) -> str:
+    """Format d'export d'après l'extension (JSON par défaut)."""
+    return _SUFFIX_FORMATS.get(path.suffix.lower(), FORMAT_JSON)
+
+
+def export_cache_key(session: Session, fmt: str, catalog: Catalog | None = None, options: str = "") -> str:
+    """Empreinte (séance, format, catalogue, version de l'exporteur, options)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(session.model_dump_json().encode("utf-8"))
+    h.update(f"|{fmt}|v{EXPORTER_VERSIONS.get(fmt, 0)}|{options}|".encode())
+    h.update((catalog_fingerprint(catalog) if catalog is not None else "-").encode())
+    return h.hexdigest()
+
+
+def _render(session: Session, path: Path, fmt: str, catalog: Catalog | None, theme: str) -> None:
+    if fmt == FORMAT_PDF:
+        export_pdf(session, path, catalog=catalog, theme=theme)
+    elif fmt == FORMAT_TXT:
+        export_txt(session, path, catalog=catalog)
+    elif fmt == FORMAT_MD:
+        export_markdown(session, path, catalog=catalog)
+    else:
+        export_json(session, path)
+
+
+@profiled
+def export_session(
+    session: Session,
+    path: Path,
+    fmt: str | None = None,
+    catalog: Catalog | None = None,
+    *,
+    theme: str = THEME_LIGHT,
+    use_cache: bool = True,
+) -> bool:
+    """Exporte ``session`` dans ``path`` (format déduit de l'extension si ``fmt`` est None).
+
+    Retourne True si le fichier vient du cache. Une erreur du cache (lecture
+    ou écriture) n'empêche jamais l'export.
+    """
+    fmt = fmt or format_for_path(path)
+    if not use_cache:
+        _render(session, path, fmt, catalog, theme)
+        return False
+    key = export_cache_key(session, fmt, catalog, theme if fmt == FORMAT_PDF else "")
+    cache_dir = _get_cache_dir()
+    cached = cache_dir / f"{key}.{fmt}"
+    try:
+        if cached.is_file():
+            shutil.copyfile(cached, path)
+            os.utime(cached)  # récence pour l'éviction LRU
+            count("export_cache.hit")
+            return True
+    except OSError as e:
+        logger.warning("Cache d'export illisible (%s): %s", cached, e)
+    count("export_cache.miss")
+    _render(session, path, fmt, catalog, theme)
+    _store(path, cached)
+    return False
+
+
+def _store(rendered: Path, cached: Path) -> None:
+    """Copie atomique du fichier rendu dans le cache, puis éviction."""
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cached.parent, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(rendered, tmp)
+        os.replace(tmp, cached)
+        evict(cached.parent)
+    except OSError as e:
+        logger.warning("Impossible d'écrire le cache d'export (%s): %s", cached, e)
+
+
+def evict(cache_dir: Path | None = None, max_bytes: int = MAX_CACHE_BYTES) -> int:
+    """Supprime les exports les moins récemment utilisés au-delà de ``max_bytes``. Retourne le nombre supprimé."""
+    cache_dir = cache_dir or _get_cache_dir()
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total += st.st_size
+    except OSError:
+        return 0
+    removed = 0
+    entries.sort()
+    for _, size, file_path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear_export_cache() -> None:
+    """Vide le cache des exports."""
+    evict(max_bytes=0)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""Schéma du pan dans les exports : fond commun + surimpression par bloc.
+
+Le fond (grille des prises, couleurs de niveau, grille pieds) ne dépend que
+du catalogue et du thème. Il est produit une fois par empreinte de
+catalogue et thème :
+
+- texte : lignes de fond en cache, chaque bloc ne remplace que ses cellules ;
+- PDF : Form XObject reportlab défini une fois par document, puis réutilisé
+  (``doForm``) sous les numéros et pieds de chaque bloc.
+
+``RENDER_COUNTS`` compte les rendus de fond effectifs (tests, benchmarks).
+"""
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
+from brlok.gui.colors import (
+    BORDER_DEFAULT,
+    EMPTY_COLOR,
+    INACTIVE_COLOR,
+    LEVEL_COLORS_PALE,
+    LEVEL_COLORS_SATURATED,
+)
+from brlok.models import Block, Catalog
+from brlok.storage.catalog_ops import _column_letters
+
+THEME_LIGHT = "light"
+THEME_MONO = "mono"  # noir et blanc (impression économe)
+DIAGRAM_THEMES = (THEME_LIGHT, THEME_MONO)
+
+# Largeur d'une cellule du schéma texte (caractères)
+TEXT_CELL_WIDTH = 7
+# Fonds texte gardés en cache (un par catalogue)
+_TEXT_CACHE_SIZE = 8
+
+RENDER_COUNTS = {"text": 0, "pdf": 0}
+
+_text_bases: OrderedDict[str, tuple[list[str], list[list[str]], list[list[str]]]] = OrderedDict()
+_pdf_forms: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def catalog_fingerprint(catalog: Catalog) -> str:
+    """Empreinte de ce que dessine le fond : grille, prises (niveau, actif), pieds."""
+    h = hashlib.blake2b(digest_size=10)
+    h.update(f"{catalog.grid.rows}x{catalog.grid.cols}".encode())
+    for hold in catalog.holds:
+        h.update(f"|{hold.id},{hold.position.row},{hold.position.col},{hold.level},{hold.active}".encode())
+    h.update(repr(catalog.foot_grid).encode())
+    h.update(repr(catalog.foot_levels).encode())
+    return h.hexdigest()
+
+
+def _text_base(catalog: Catalog, key: str) -> tuple[list[str], list[list[str]], list[list[str]]]:
+    """(en-tête, cellules des prises, cellules des pieds) du fond texte, en cache."""
+    base = _text_bases.get(key)
+    if base is not None:
+        _text_bases.move_to_end(key)
+        return base
+    RENDER_COUNTS["text"] += 1
+    w = TEXT_CELL_WIDTH
+    rows, cols = catalog.grid.rows, catalog.grid.cols
+    index = catalog.hold_index()
+    header = ["     " + "".join(_column_letters(c).center(w) for c in range(cols))]
+    cells = []
+    for r in range(rows):
+        row = []
+        for c in range(cols):
+            hold = index.at(r, c)
+            mark = " " if hold is None else ("·" if hold.active else "x")
+            row.append(mark.center(w))
+        cells.append(row)
+    feet = [
+        [(spec or "")[: w - 1].center(w) for spec in (catalog.foot_grid[r] + [""] * cols)[:cols]]
+        for r in range(len(catalog.foot_grid))
+    ]
+    base = (header, cells, feet)
+    _text_bases[key] = base
+    if len(_text_bases) > _TEXT_CACHE_SIZE:
+        _text_bases.popitem(last=False)
+    return base
+
+
+def text_diagram(catalog: Catalog, block: Block) -> list[str]:
+    """Schéma texte du bloc : numéros d'ordre sur le pan, pieds du bloc marqués « * »."""
+    header, base_cells, base_feet = _text_base(catalog, catalog_fingerprint(catalog))
+    w = TEXT_CELL_WIDTH
+    cells = [list(row) for row in base_cells]
+    for order, hold in enumerate(block.holds, 1):
+        r, c = hold.position.row, hold.position.col
+        if r < len(cells) and c < len(cells[r]):
+            cells[r][c] = str(order).center(w)
+    feet = [list(row) for row in base_feet]
+    for r, c in block.foot_positions:
+        if r < len(feet) and c < len(feet[r]):
+            label = feet[r][c].strip() or "•"
+            feet[r][c] = f"*{label}"[:w].center(w)
+    lines = list(header)
+    lines.extend(f"{r + 1:>3}  " + "".join(row) for r, row in enumerate(cells))
+    if feet:
+        lines.append("     " + "-" * (w * catalog.grid.cols))
+        lines.extend(f" P{r + 1}  " + "".join(row) for r, row in enumerate(feet))
+    return [line.rstrip() for line in lines]
+
+
+def _theme_colors(theme: str, level: int, active: bool, highlighted: bool) -> str:
+    if theme == THEME_MONO:
+        return "#555555" if highlighted else ("#dddddd" if not active else "#ffffff")
+    if highlighted:
+        return LEVEL_COLORS_SATURATED.get(level, "#e3f2fd")
+    if not active:
+        return INACTIVE_COLOR
+    return LEVEL_COLORS_PALE.get(level, EMPTY_COLOR)
+
+
+def pdf_diagram_flowable(
+    catalog: Catalog,
+    block: Block,
+    theme: str = THEME_LIGHT,
+    cell: float = 26.0,
+    fingerprint: str | None = None,
+):
+    """Flowable reportlab du schéma d'un bloc (fond partagé en Form XObject).
+
+    ``fingerprint`` : empreinte du catalogue déjà calculée (livret de séances).
+    """
+    return _pan_diagram_class()(catalog, block, theme, cell, fingerprint or catalog_fingerprint(catalog))
+
+
+@lru_cache(maxsize=1)
+def _pan_diagram_class():
+    """Classe Flowable (reportlab importé à la première utilisation)."""
+    from reportlab.platypus import Flowable
+
+    class PanDiagram(Flowable):
+        """Schéma d'un bloc : fond du catalogue (Form XObject) + numéros et pieds."""
+
+        def __init__(self, catalog: Catalog, block: Block, theme: str, cell: float, fingerprint: str) -> None:
+            super().__init__()
+            self._catalog = catalog
+            self._block = block
+            self._theme = theme
+            self._cell = cell
+            # Un fond par catalogue, thème et taille de case
+            self._key = f"brlokPan{fingerprint}{theme}{cell:g}".replace(".", "_")
+            self._rows, self._cols = catalog.grid.rows, catalog.grid.cols
+            self._feet = len(catalog.foot_grid)
+            self.width = self._cols * cell
+            self.height = (self._rows + self._feet) * cell + (cell / 2 if self._feet else 0)
+
+        def wrap(self, avail_width: float, avail_height: float) -> tuple[float, float]:
+            return self.width, self.height
+
+        def _hold_origin(self, r: int, c: int) -> tuple[float, float]:
+            return c * self._cell, self.height - (r + 1) * self._cell
+
+        def _foot_origin(self, r: int, c: int) -> tuple[float, float]:
+            return c * self._cell, (self._feet - 1 - r) * self._cell
+
+        def _draw_base(self) -> None:
+            canv = self.canv
+            RENDER_COUNTS["pdf"] += 1
+            canv.beginForm(self._key, 0, 0, self.width, self.height)
+            index = self._catalog.hold_index()
+            canv.setStrokeColor(BORDER_DEFAULT)
+            canv.setLineWidth(0.6)
+            canv.setFont("Helvetica", 6)
+            for r in range(self._rows):
+                for c in range(self._cols):
+                    x, y = self._hold_origin(r, c)
+                    hold = index.at(r, c)
+                    fill = EMPTY_COLOR if hold is None else _theme_colors(self._theme, hold.level, hold.active, False)
+                    canv.setFillColor(fill)
+                    canv.rect(x, y, self._cell, self._cell, stroke=1, fill=1)
+                    if hold is not None:
+                        canv.setFillColor("#777777")
+                        canv.drawString(x + 2, y + 2, hold.id)
+            levels = self._catalog.foot_levels
+            for r in range(self._feet):
+                for c in range(self._cols):
+                    x, y = self._foot_origin(r, c)
+                    spec = self._catalog.foot_grid[r][c] if c < len(self._catalog.foot_grid[r]) else ""
+                    lev = levels[r][c] if r < len(levels) and c < len(levels[r]) else 1
+                    canv.setFillColor(_theme_colors(self._theme, lev, True, False) if spec else EMPTY_COLOR)
+                    canv.rect(x, y, self._cell, self._cell, stroke=1, fill=1)
+                    if spec:
+                        canv.setFillColor("#777777")
+                        canv.drawCentredString(x + self._cell / 2, y + self._cell / 2 - 2, spec)
+            canv.endForm()
+
+        def draw(self) -> None:
+            canv = self.canv
+            defined = _pdf_forms.setdefault(canv, set())
+            if self._key not in defined:
+                self._draw_base()
+                defined.add(self._key)
+            canv.doForm(self._key)
+            canv.setFont("Helvetica-Bold", self._cell * 0.45)
+            for order, hold in enumerate(self._block.holds, 1):
+                r, c = hold.position.row, hold.position.col
+                if r >= self._rows or c >= self._cols:
+                    continue
+                x, y = self._hold_origin(r, c)
+                canv.setFillColor(_theme_colors(self._theme, hold.level, True, True))
+                canv.setStrokeColor("#1565c0" if self._theme == THEME_LIGHT else "#000000")
+                canv.setLineWidth(2 if order == 1 else 1)
+                canv.rect(x + 1, y + 1, self._cell - 2, self._cell - 2, stroke=1, fill=1)
+                canv.setFillColor("#ffffff")
+                canv.drawCentredString(x + self._cell / 2, y + self._cell * 0.32, str(order))
+            canv.setStrokeColor("#000000")
+            canv.setLineWidth(1.5)
+            for r, c in self._block.foot_positions:
+                if r < self._feet and c < self._cols:
+                    x, y = self._foot_origin(r, c)
+                    canv.circle(x + self._cell / 2, y + self._cell / 2, self._cell * 0.4, stroke=1, fill=0)
+
+    return PanDiagram
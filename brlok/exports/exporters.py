@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator
 
-from brlok.models import Catalog, Session
+from brlok.exports.diagram import THEME_LIGHT, catalog_fingerprint, pdf_diagram_flowable, text_diagram
+from brlok.models import Catalog, CompletedSession, Session
 
 
 def _format_foot_grid_section(catalog: Catalog) -> list[str]:
@@ -25,8 +28,11 @@ def _format_foot_grid_section(catalog: Catalog) -> list[str]:
     return lines
 
 
-def export_txt(session: Session, path: Path, catalog: Catalog | None = None) -> None:
-    """Exporte une séance en TXT lisible (FR18). UTF-8."""
+def export_txt(session: Session, path: Path, catalog: Catalog | None = None, *, diagram: bool = True) -> None:
+    """Exporte une séance en TXT lisible (FR18). UTF-8.
+
+    Avec un catalogue, chaque bloc est suivi du schéma du pan (``diagram``).
+    """
     lines: list[str] = ["Séance d'entraînement Brlok", "=" * 40]
     if session.constraints.target_level is not None:
         lines.append(f"Niveau cible: {session.constraints.target_level}")
@@ -52,6 +58,9 @@ def export_txt(session: Session, path: Path, catalog: Catalog | None = None) ->
                 lines.append(f"  Pieds: {', '.join(foot_specs)}")
         if block.comment:
             lines.append(f"  # {block.comment}")
+        if catalog and diagram:
+            lines.append("")
+            lines.extend(f"  {line}".rstrip() for line in text_diagram(catalog, block))
         lines.append("")
     if catalog:
         lines.extend(_format_foot_grid_section(catalog))
@@ -61,8 +70,10 @@ def export_txt(session: Session, path: Path, catalog: Catalog | None = None) ->
     path.write_text(text, encoding="utf-8")
 
 
-def export_markdown(session: Session, path: Path, catalog: Catalog | None = None) -> None:
-    """Exporte une séance en Markdown (FR19)."""
+def export_markdown(
+    session: Session, path: Path, catalog: Catalog | None = None, *, diagram: bool = True
+) -> None:
+    """Exporte une séance en Markdown (FR19). Schéma du pan par bloc si catalogue fourni."""
     lines: list[str] = ["# Séance d'entraînement Brlok", ""]
     if session.constraints.target_level is not None:
         lines.append(f"- **Niveau cible:** {session.constraints.target_level}")
@@ -93,6 +104,11 @@ def export_markdown(session: Session, path: Path, catalog: Catalog | None = None
         if block.comment:
             lines.append("")
             lines.append(f"*{block.comment}*")
+        if catalog and diagram:
+            lines.append("")
+            lines.append("```text")
+            lines.extend(text_diagram(catalog, block))
+            lines.append("```")
         lines.append("")
     if catalog and catalog.foot_grid:
         lines.append("## Pieds")
@@ -115,14 +131,30 @@ def export_json(session: Session, path: Path) -> None:
     )
 
 
-def export_pdf(session: Session, path: Path) -> None:
-    """Exporte une séance en PDF (FR41). Lisible, encodage UTF-8, prêt pour impression."""
-    from reportlab.lib.pagesizes import A4
+# Flowables tirés d'avance du générateur pendant la construction d'un livret
+_BOOKLET_LOOKAHEAD = 64
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> dict:
+    """Styles PDF (créés une fois, partagés par toutes les séances)."""
     from reportlab.lib.styles import getSampleStyleSheet
+
+    sheet = getSampleStyleSheet()
+    return {
+        "title": sheet["Title"],
+        "session": sheet["Heading1"],
+        "block": sheet["Heading2"],
+        "normal": sheet["Normal"],
+    }
+
+
+def _pdf_doc(path: Path):
+    from reportlab.lib.pagesizes import A4
     from reportlab.lib.units import cm
-    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+    from reportlab.platypus import SimpleDocTemplate
 
-    doc = SimpleDocTemplate(
+    return SimpleDocTemplate(
         str(path),
         pagesize=A4,
         rightMargin=2 * cm,
@@ -130,57 +162,147 @@ def export_pdf(session: Session, path: Path) -> None:
         topMargin=2 * cm,
         bottomMargin=2 * cm,
     )
-    styles = getSampleStyleSheet()
-    story = []
 
-    title = Paragraph(
-        "<b>Séance d'entraînement Brlok</b>",
-        styles["Title"],
-    )
-    story.append(title)
-    story.append(Spacer(1, 0.5 * cm))
 
-    if session.constraints.target_level is not None:
-        story.append(
-            Paragraph(
-                f"<b>Niveau cible :</b> {session.constraints.target_level}",
-                styles["Normal"],
-            )
-        )
-    if session.constraints.required_tags:
-        story.append(
-            Paragraph(
-                f"<b>Tags à inclure :</b> {', '.join(session.constraints.required_tags)}",
-                styles["Normal"],
-            )
-        )
-    if session.constraints.excluded_tags:
-        story.append(
-            Paragraph(
-                f"<b>Tags exclus :</b> {', '.join(session.constraints.excluded_tags)}",
-                styles["Normal"],
-            )
-        )
-    if session.constraints.variety:
-        story.append(Paragraph("<b>Variété :</b> oui", styles["Normal"]))
-    if any(
-        [
-            session.constraints.target_level is not None,
-            session.constraints.required_tags,
-            session.constraints.excluded_tags,
-            session.constraints.variety,
-        ]
-    ):
-        story.append(Spacer(1, 0.5 * cm))
+def _constraint_lines(session: Session) -> list[str]:
+    """Lignes « libellé : valeur » des contraintes de la séance (balisage reportlab)."""
+    c = session.constraints
+    lines = []
+    if c.target_level is not None:
+        lines.append(f"<b>Niveau cible :</b> {c.target_level}")
+    if c.required_tags:
+        lines.append(f"<b>Tags à inclure :</b> {', '.join(c.required_tags)}")
+    if c.excluded_tags:
+        lines.append(f"<b>Tags exclus :</b> {', '.join(c.excluded_tags)}")
+    if c.variety:
+        lines.append("<b>Variété :</b> oui")
+    return lines
+
+
+def _session_flowables(
+    session: Session,
+    styles: dict,
+    catalog: Catalog | None = None,
+    theme: str = THEME_LIGHT,
+    fingerprint: str | None = None,
+) -> Iterator:
+    """Flowables d'une séance (contraintes puis blocs, avec schéma si catalogue), produits un à un."""
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph, Spacer
 
+    lines = _constraint_lines(session)
+    for line in lines:
+        yield Paragraph(line, styles["normal"])
+    if lines:
+        yield Spacer(1, 0.5 * cm)
     for i, block in enumerate(session.blocks, 1):
-        story.append(
-            Paragraph(f"<b>Bloc {i}</b>", styles["Heading2"]),
-        )
+        yield Paragraph(f"<b>Bloc {i}</b>", styles["block"])
         items = " → ".join(f"{j}. {hold.id}" for j, hold in enumerate(block.holds, 1))
-        story.append(Paragraph(items, styles["Normal"]))
+        yield Paragraph(items, styles["normal"])
         if block.comment:
-            story.append(Paragraph(f"<i>{block.comment}</i>", styles["Normal"]))
-        story.append(Spacer(1, 0.3 * cm))
+            yield Paragraph(f"<i>{block.comment}</i>", styles["normal"])
+        if catalog is not None:
+            yield Spacer(1, 0.2 * cm)
+            yield pdf_diagram_flowable(catalog, block, theme, fingerprint=fingerprint)
+        yield Spacer(1, 0.3 * cm)
+
+
+class _LazyStory(list):
+    """Story reportlab alimentée au fil de la construction.
+
+    Repose sur la boucle de ``BaseDocTemplate.build`` (reportlab 4 et 5), qui
+    consomme la liste par la tête (``len``, ``[0]``, ``del [0]``) : on garde
+    seulement ``lookahead`` flowables d'avance, de sorte que la mémoire des
+    flowables ne dépend pas du nombre de séances. ``drained`` permet de
+    vérifier après coup que tout a bien été consommé.
+    """
+
+    def __init__(self, flowables: Iterator, lookahead: int = _BOOKLET_LOOKAHEAD) -> None:
+        super().__init__()
+        self._source = flowables
+        self._lookahead = lookahead
+        self._exhausted = False
+        self._refill()
+
+    def _refill(self) -> None:
+        while not self._exhausted and list.__len__(self) < self._lookahead:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._exhausted = True
+
+    @property
+    def drained(self) -> bool:
+        """True si la source est épuisée et tous les flowables ont été retirés."""
+        return self._exhausted and list.__len__(self) == 0
+
+    def __len__(self) -> int:
+        self._refill()
+        return list.__len__(self)
+
+
+def export_pdf(
+    session: Session,
+    path: Path,
+    catalog: Catalog | None = None,
+    *,
+    theme: str = THEME_LIGHT,
+) -> None:
+    """Exporte une séance en PDF (FR41). Lisible, encodage UTF-8, prêt pour impression.
+
+    Avec un catalogue, chaque bloc est dessiné sur le pan (``theme`` : light ou mono).
+    """
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph, Spacer
+
+    styles = _pdf_styles()
+    story = [
+        Paragraph("<b>Séance d'entraînement Brlok</b>", styles["title"]),
+        Spacer(1, 0.5 * cm),
+    ]
+    fingerprint = catalog_fingerprint(catalog) if catalog is not None else None
+    story.extend(_session_flowables(session, styles, catalog, theme, fingerprint))
+    _pdf_doc(path).build(story)
+
+
+def export_pdf_booklet(
+    sessions: Iterable[Session | CompletedSession],
+    path: Path,
+    title: str = "Carnet de séances Brlok",
+    catalog: Catalog | None = None,
+    *,
+    theme: str = THEME_LIGHT,
+) -> int:
+    """Exporte plusieurs séances dans un seul PDF, une séance par page. Retourne le nombre de séances.
+
+    Les séances sont lues au fil de la mise en page (itérateur accepté) ; les
+    entrées d'historique sont titrées par leur date.
+    """
+    from reportlab.lib.units import cm
+    from reportlab.platypus import PageBreak, Paragraph, Spacer
+
+    styles = _pdf_styles()
+    fingerprint = catalog_fingerprint(catalog) if catalog is not None else None
+    count = 0
+
+    def _story() -> Iterator:
+        nonlocal count
+        yield Paragraph(f"<b>{title}</b>", styles["title"])
+        yield Spacer(1, 0.5 * cm)
+        for item in sessions:
+            if count:
+                yield PageBreak()
+            count += 1
+            if isinstance(item, CompletedSession):
+                heading = f"Séance du {item.date:%d/%m/%Y %H:%M}"
+                session = item.session
+            else:
+                heading, session = f"Séance {count}", item
+            yield Paragraph(heading, styles["session"])
+            yield from _session_flowables(session, styles, catalog, theme, fingerprint)
 
-    doc.build(story)
+    story = _LazyStory(_story())
+    _pdf_doc(path).build(story)
+    if not story.drained:
+        raise RuntimeError("Livret PDF incomplet : reportlab n'a pas consommé toute la story")
+    return count
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Exports en flux : JSON Lines (un enregistrement par ligne) ou tableau JSON.
+
+Les enregistrements sont sérialisés un par un depuis un itérateur de
+séances, d'entrées d'historique ou de blocs : la mémoire ne dépend pas du
+nombre d'éléments exportés. Sortie vers un fichier (compressé gzip si
+demandé ou si le nom finit par ``.gz``) ou vers la sortie standard (tubes).
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from brlok.models import Block, CompletedSession, Session
+
+FORMAT_JSONL = "jsonl"
+FORMAT_JSON = "json"
+
+UNIT_SESSION = "session"
+UNIT_BLOCK = "block"
+
+# Chemin désignant la sortie standard
+STDOUT = "-"
+
+_SEPARATORS = (",", ":")
+
+
+@contextmanager
+def open_output(path: Path | str | None, compress: bool | None = None) -> Iterator[TextIO]:
+    """Flux texte UTF-8 : fichier (gzip si ``compress`` ou suffixe .gz) ou sortie standard."""
+    if path is None or str(path) == STDOUT:
+        if compress:
+            with gzip.open(sys.stdout.buffer, "wt", encoding="utf-8") as out:
+                yield out
+        else:
+            yield sys.stdout
+            sys.stdout.flush()
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress or (compress is None and path.suffix == ".gz"):
+        with gzip.open(path, "wt", encoding="utf-8", newline="\n") as out:
+            yield out
+    else:
+        with open(path, "w", encoding="utf-8", newline="\n") as out:
+            yield out
+
+
+def iter_records(
+    items: Iterable[Session | CompletedSession | Block], unit: str = UNIT_SESSION
+) -> Iterator[dict]:
+    """Enregistrements JSON, un par séance ou un par bloc (``unit``).
+
+    Par bloc, chaque enregistrement rappelle la séance d'origine (id, date,
+    rang, statut) quand elle est connue.
+    """
+    for n, item in enumerate(items):
+        if isinstance(item, Block):
+            yield item.model_dump(mode="json")
+            continue
+        if unit != UNIT_BLOCK:
+            yield item.model_dump(mode="json")
+            continue
+        if isinstance(item, CompletedSession):
+            session, ref = item.session, {"session_id": item.id, "date": item.date.isoformat()}
+            statuses = item.block_statuses
+        else:
+            session, ref, statuses = item, {"session_index": n}, {}
+        for i, block in enumerate(session.blocks):
+            record = dict(ref)
+            record["index"] = i
+            if i in statuses:
+                record["status"] = statuses[i]
+            record["block"] = block.model_dump(mode="json")
+            yield record
+
+
+def write_records(records: Iterable[dict], out: TextIO, fmt: str = FORMAT_JSONL) -> int:
+    """Écrit les enregistrements un à un ; retourne leur nombre."""
+    count = 0
+    if fmt == FORMAT_JSON:
+        out.write("[")
+    for record in records:
+        line = json.dumps(record, ensure_ascii=False, separators=_SEPARATORS)
+        if fmt == FORMAT_JSON:
+            out.write(",\n" if count else "\n")
+            out.write(line)
+        else:
+            out.write(line)
+            out.write("\n")
+        count += 1
+    if fmt == FORMAT_JSON:
+        out.write("\n]\n" if count else "]\n")
+    return count
+
+
+def export_stream(
+    items: Iterable[Session | CompletedSession | Block],
+    path: Path | str | None = None,
+    *,
+    fmt: str = FORMAT_JSONL,
+    unit: str = UNIT_SESSION,
+    compress: bool | None = None,
+) -> int:
+    """Exporte ``items`` en JSON Lines (défaut) ou tableau JSON, en flux.
+
+    ``path`` None ou ``"-"`` : sortie standard. Retourne le nombre d'enregistrements.
+    """
+    with open_output(path, compress) as out:
+        return write_records(iter_records(items, unit), out, fmt)
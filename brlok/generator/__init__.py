@@ -1,5 +1,16 @@
 # -*- coding: utf-8 -*-
 """Logique de génération de séances."""
-from brlok.generator.session_generator import generate_session
+from brlok.generator.feasibility import FeasibilityReport, check_feasibility
+from brlok.generator.plan import GenerationParams
+from brlok.generator.session_generator import generate_session, regenerate_block
+from brlok.generator.stream import BlockStream, iter_blocks
 
-__all__ = ["generate_session"]
+__all__ = [
+    "BlockStream",
+    "FeasibilityReport",
+    "GenerationParams",
+    "check_feasibility",
+    "generate_session",
+    "iter_blocks",
+    "regenerate_block",
+]
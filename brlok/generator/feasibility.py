@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Vérification de faisabilité des contraintes de génération, sans générer.
+
+Reproduit les règles de ``generate_session`` (plage de niveaux globale puis
+par bloc, tags requis / exclus, repli sur toutes les prises éligibles si la
+plage d'un bloc est vide) à partir des comptages pré-calculés de l'index
+(``HoldIndex.count_active``) : quelques dizaines d'additions, quelle que soit
+la taille du catalogue. Utilisé en direct par l'onglet Configuration.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from brlok.config.difficulty import get_distribution_levels
+from brlok.models import Catalog, HoldIndex, SessionConstraints
+
+# Contrainte limitante (BlockFeasibility.binding / FeasibilityReport.binding)
+BINDING_TAGS_CONFLICT = "tags_conflict"
+BINDING_LEVEL = "level"
+BINDING_REQUIRED_TAGS = "required_tags"
+BINDING_EXCLUDED_TAGS = "excluded_tags"
+
+_BINDING_LABELS = {
+    BINDING_TAGS_CONFLICT: "tags à la fois requis et exclus",
+    BINDING_LEVEL: "niveau / tolérance",
+    BINDING_REQUIRED_TAGS: "tags requis",
+    BINDING_EXCLUDED_TAGS: "tags exclus",
+}
+
+# Valeurs par défaut de generate_session
+_DEFAULT_TARGET_LEVEL = 3
+_DEFAULT_HOLDS_PER_BLOCK = 10
+
+
+@dataclass(frozen=True)
+class BlockFeasibility:
+    """Faisabilité d'un bloc : prises éligibles, prises obtenues, par position."""
+
+    target_level: int
+    eligible: int
+    holds_requested: int
+    holds_possible: int
+    per_position: list[int] = field(default_factory=list)
+    binding: str | None = None
+
+
+@dataclass(frozen=True)
+class FeasibilityReport:
+    """Résultat de ``check_feasibility``."""
+
+    eligible: int
+    blocks: list[BlockFeasibility]
+    binding: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True si chaque bloc aura le nombre de prises demandé."""
+        return self.binding is None and all(
+            b.holds_possible == b.holds_requested for b in self.blocks
+        )
+
+    def summary(self) -> str:
+        """Diagnostic court en français (affiché sous le formulaire)."""
+        if self.binding == BINDING_TAGS_CONFLICT:
+            return "Aucune prise : tags à la fois requis et exclus."
+        if self.eligible == 0:
+            return f"Aucune prise éligible (limite : {_BINDING_LABELS[self.binding or BINDING_LEVEL]})."
+        if not self.blocks:
+            return f"{self.eligible} prises éligibles."
+        short = [(i, b) for i, b in enumerate(self.blocks, 1) if b.holds_possible < b.holds_requested]
+        if not short:
+            return f"{self.eligible} prises éligibles — tous les blocs sont complets."
+        i, worst = min(short, key=lambda item: item[1].holds_possible)
+        label = _BINDING_LABELS.get(worst.binding or "", "prises disponibles")
+        return (
+            f"Bloc {i} : {worst.holds_possible} prises sur {worst.holds_requested} demandées "
+            f"(limite : {label}) ; {len(short)} bloc(s) réduit(s)."
+        )
+
+
+def check_feasibility(
+    catalog: Catalog,
+    constraints: SessionConstraints,
+    *,
+    level_tolerance: int = 1,
+    blocks_count: int = 5,
+    per_block_levels: list[tuple[int, int]] | None = None,
+    distribution_pattern: str = "uniforme",
+) -> FeasibilityReport:
+    """Prises éligibles par bloc et par position, et contrainte limitante.
+
+    Args:
+        constraints: Niveau cible, tags requis / exclus et ``enchainements``
+            (prises par bloc), comme dans ``Session.constraints``.
+        level_tolerance, blocks_count, per_block_levels, distribution_pattern:
+            Mêmes paramètres que ``generate_session``.
+    """
+    target_level = constraints.target_level or _DEFAULT_TARGET_LEVEL
+    n_holds = constraints.enchainements or _DEFAULT_HOLDS_PER_BLOCK
+    req = constraints.required_tags
+    exc = constraints.excluded_tags
+    if set(req) & set(exc):
+        return FeasibilityReport(eligible=0, blocks=[], binding=BINDING_TAGS_CONFLICT)
+
+    index = catalog.hold_index()
+    pbl = per_block_levels
+    if pbl:
+        min_level = min(max(1, t - tol) for t, tol in pbl)
+        max_level = max(min(5, t + tol) for t, tol in pbl)
+    else:
+        min_level = max(1, target_level - level_tolerance)
+        max_level = min(5, target_level + level_tolerance)
+    # Comptage filtré (tags) par niveau, une fois ; chaque plage est ensuite une somme
+    by_level = [0] + [index.count_active(lev, lev, req, exc) for lev in range(1, 6)]
+
+    def _count(lo: int, hi: int) -> int:
+        return sum(by_level[lo:hi + 1])
+
+    eligible = _count(min_level, max_level)
+    if eligible == 0:
+        binding = _binding(index, min_level, max_level, req, exc, 1)
+        return FeasibilityReport(eligible=0, blocks=[], binding=binding)
+
+    pattern = distribution_pattern or "uniforme"
+    blocks: list[BlockFeasibility] = []
+    for block_idx in range(blocks_count):
+        block_target, block_tol = (
+            pbl[block_idx] if pbl and block_idx < len(pbl) else (target_level, level_tolerance)
+        )
+        lo = max(1, block_target - block_tol)
+        hi = min(5, block_target + block_tol)
+        block_eligible = _count(lo, hi)
+        if block_eligible == 0:  # repli du générateur : toutes les prises éligibles
+            lo, hi, block_eligible = min_level, max_level, eligible
+        n = min(n_holds, block_eligible)
+        per_position = [
+            _count(max(lo, lev - 1), min(hi, lev + 1))
+            for lev in get_distribution_levels(pattern, n, block_target)[:n]
+        ]
+        blocks.append(
+            BlockFeasibility(
+                target_level=block_target,
+                eligible=block_eligible,
+                holds_requested=n_holds,
+                holds_possible=n,
+                per_position=per_position,
+                binding=_binding(index, lo, hi, req, exc, n_holds) if n < n_holds else None,
+            )
+        )
+    return FeasibilityReport(eligible=eligible, blocks=blocks)
+
+
+def _binding(index: HoldIndex, lo: int, hi: int, req: list[str], exc: list[str], needed: int) -> str:
+    """Premier filtre (niveau, puis tags requis, puis tags exclus) sous ``needed``."""
+    if index.count_active(lo, hi) < needed:
+        return BINDING_LEVEL
+    if req and index.count_active(lo, hi, req) < needed:
+        return BINDING_REQUIRED_TAGS
+    return BINDING_EXCLUDED_TAGS
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Templates compilés en plans de génération (par bloc).
+
+Un ``GenerationPlan`` fige ce que la génération dérivait à chaque appel d'un
+template : niveau cible et plage de niveaux de chaque bloc
+(``block_level_to_target``), niveaux attendus par position
+(``get_distribution_levels``) et timing du premier bloc. Les plans sont mis
+en cache (LRU, ``PLAN_CACHE_SIZE`` plans) par (id du template, empreinte du
+contenu, nombre de blocs) : un template modifié produit un nouveau plan.
+"""
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from brlok.config.difficulty import block_level_to_target, get_distribution_levels
+from brlok.models.session_template import SessionTemplate
+from brlok.profiling import count
+
+# Tolérance de niveau des blocs d'un template (comme l'onglet Configuration)
+TEMPLATE_LEVEL_TOLERANCE = 1
+
+# Plans gardés en mémoire au plus (les moins récemment utilisés sont oubliés)
+PLAN_CACHE_SIZE = 32
+
+_plans: OrderedDict[tuple[str, str, int], "GenerationPlan"] = OrderedDict()
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """Paramètres de génération pré-calculés d'un template."""
+
+    template_id: str
+    content_hash: str
+    blocks_count: int
+    holds_per_block: int
+    distribution_pattern: str
+    # (target_level, tolérance) par bloc ; None si le template ne couvre pas tous les blocs
+    per_block_levels: tuple[tuple[int, int], ...] | None
+    # Niveaux attendus par position pour holds_per_block prises (vide si per_block_levels est None)
+    position_levels: tuple[tuple[int, ...], ...]
+    # (work_s, rest_s, rounds) du premier bloc, None si le template n'a pas de blocs
+    first_timing: tuple[int, int, int] | None
+
+    def levels_for(self, block_idx: int, n_holds: int) -> list[int] | None:
+        """Niveaux pré-calculés du bloc pour ``n_holds`` prises (None si non prévus)."""
+        if block_idx < len(self.position_levels):
+            levels = self.position_levels[block_idx]
+            if len(levels) == n_holds:
+                return list(levels)
+        return None
+
+
+@dataclass(frozen=True)
+class GenerationParams:
+    """Paramètres qui ont produit une séance, pour re-tirer un bloc à l'identique."""
+
+    level_tolerance: int = 1
+    distribution_pattern: str = "uniforme"
+    # (target_level, tolérance) par bloc généré ; None : plan ou niveau de la séance
+    per_block_levels: tuple[tuple[int, int], ...] | None = None
+    # Favoris placés en tête de séance (non couverts par per_block_levels)
+    favorites_count: int = 0
+    usage_prior: dict[str, float] | None = None
+    plan: GenerationPlan | None = None
+
+    def block_level(self, block_idx: int) -> tuple[int, int] | None:
+        """(target_level, tolérance) du bloc ``block_idx`` de la séance (None : niveau de la séance)."""
+        levels = self.per_block_levels
+        if levels is None and self.plan is not None:
+            levels = self.plan.per_block_levels
+        i = block_idx - self.favorites_count
+        if levels and 0 <= i < len(levels):
+            return levels[i]
+        return None
+
+
+def template_hash(template: SessionTemplate) -> str:
+    """Empreinte du contenu d'un template."""
+    return hashlib.blake2b(template.model_dump_json().encode("utf-8"), digest_size=12).hexdigest()
+
+
+def compile_template(template: SessionTemplate, blocks_count: int | None = None) -> GenerationPlan:
+    """Plan du template pour ``blocks_count`` blocs (défaut : ``template.blocks_count``).
+
+    Les niveaux par bloc ne sont utilisés que si le template configure au moins
+    ``blocks_count`` blocs.
+    """
+    n_blocks = blocks_count if blocks_count is not None else template.blocks_count
+    digest = template_hash(template)
+    key = (template.id, digest, n_blocks)
+    plan = _plans.get(key)
+    if plan is not None:
+        _plans.move_to_end(key)
+        count("plan_cache.hit")
+        return plan
+    count("plan_cache.miss")
+
+    configs = template.blocks_config
+    pattern = template.distribution_pattern or "uniforme"
+    per_block: tuple[tuple[int, int], ...] | None = None
+    positions: tuple[tuple[int, ...], ...] = ()
+    if configs and len(configs) >= n_blocks:
+        per_block = tuple(
+            (block_level_to_target(cfg.level), TEMPLATE_LEVEL_TOLERANCE) for cfg in configs[:n_blocks]
+        )
+        positions = tuple(
+            tuple(get_distribution_levels(pattern, template.holds_per_block, t)) for t, _ in per_block
+        )
+    first = configs[0] if configs else None
+    plan = GenerationPlan(
+        template_id=template.id,
+        content_hash=digest,
+        blocks_count=n_blocks,
+        holds_per_block=template.holds_per_block,
+        distribution_pattern=pattern,
+        per_block_levels=per_block,
+        position_levels=positions,
+        first_timing=(first.work_s, first.rest_s, first.rounds) if first else None,
+    )
+    _plans[key] = plan
+    if len(_plans) > PLAN_CACHE_SIZE:
+        _plans.popitem(last=False)
+    return plan
+
+
+def clear_plan_cache() -> None:
+    """Vide le cache des plans."""
+    _plans.clear()
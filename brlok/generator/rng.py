@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Générateur pseudo-aléatoire versionné (graines reproductibles partout).
+
+``random.Random`` ne garantit pas les mêmes tirages entre versions de Python
+(``choices``, ``sample``, ``randint`` reposent sur des détails internes de
+CPython). ``Pcg32`` (PCG-XSH-RR 64/32, O'Neill 2014) et ses routines de
+tirage sont entièrement définis ici : une graine donne la même séance sur
+toute plateforme, tant que ``RNG_VERSION`` ne change pas.
+
+Versions :
+    0 : ``random.Random`` (comportement historique, dépend de CPython) ;
+    1 : ``Pcg32``.
+
+Chaque flux (``stream``) est une séquence indépendante pour une même graine :
+``spawn`` fournit des générateurs indépendants pour les tirages en lot.
+"""
+from __future__ import annotations
+
+import random
+import secrets
+from bisect import bisect
+from itertools import accumulate
+from typing import Sequence, TypeVar
+
+T = TypeVar("T")
+
+RNG_VERSION = 1
+LEGACY_RNG_VERSION = 0
+
+_MASK64 = (1 << 64) - 1
+_MASK32 = 0xFFFFFFFF
+_MULT = 6364136223846793005
+
+
+class Pcg32:
+    """PCG32 : état 64 bits, sortie 32 bits, flux sélectionnable."""
+
+    __slots__ = ("_state", "_inc")
+
+    def __init__(self, seed: int | None = None, stream: int = 0) -> None:
+        if seed is None:
+            seed = secrets.randbits(64)
+        self._inc = ((stream << 1) | 1) & _MASK64
+        self._state = 0
+        self.next_u32()
+        self._state = (self._state + seed) & _MASK64
+        self.next_u32()
+
+    def next_u32(self) -> int:
+        """Entier uniforme sur 32 bits."""
+        old = self._state
+        self._state = (old * _MULT + self._inc) & _MASK64
+        xorshifted = (((old >> 18) ^ old) >> 27) & _MASK32
+        rot = old >> 59
+        return ((xorshifted >> rot) | (xorshifted << (-rot & 31))) & _MASK32
+
+    def getrandbits(self, k: int) -> int:
+        """Entier uniforme de ``k`` bits (mots de 32 bits, poids fort en premier)."""
+        if k <= 0:
+            return 0
+        words = (k + 31) // 32
+        value = 0
+        for _ in range(words):
+            value = (value << 32) | self.next_u32()
+        return value >> (words * 32 - k)
+
+    def randbelow(self, n: int) -> int:
+        """Entier uniforme dans [0, n) (rejet, sans biais)."""
+        if n <= 0:
+            raise ValueError("n doit être > 0")
+        k = n.bit_length()
+        r = self.getrandbits(k)
+        while r >= n:
+            r = self.getrandbits(k)
+        return r
+
+    def random(self) -> float:
+        """Flottant uniforme dans [0, 1) sur 53 bits."""
+        a = self.next_u32() >> 5
+        b = self.next_u32() >> 6
+        return (a * 67108864 + b) / 9007199254740992
+
+    def randint(self, a: int, b: int) -> int:
+        """Entier uniforme dans [a, b]."""
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Élément uniforme de ``seq`` (IndexError si vide)."""
+        if not seq:
+            raise IndexError("Séquence vide")
+        return seq[self.randbelow(len(seq))]
+
+    def choices(
+        self, population: Sequence[T], weights: Sequence[float] | None = None, *, k: int = 1
+    ) -> list[T]:
+        """``k`` tirages avec remise, pondérés par ``weights`` si fournis."""
+        n = len(population)
+        if weights is None:
+            return [population[self.randbelow(n)] for _ in range(k)]
+        cum = list(accumulate(weights))
+        if len(cum) != n:
+            raise ValueError("weights et population de tailles différentes")
+        total = cum[-1] if cum else 0.0
+        if not total > 0.0:
+            raise ValueError("Somme des poids nulle")
+        hi = n - 1
+        return [population[bisect(cum, self.random() * total, 0, hi)] for _ in range(k)]
+
+    def sample(self, population: Sequence[T], k: int) -> list[T]:
+        """``k`` éléments distincts (Fisher-Yates partiel), dans l'ordre du tirage."""
+        pool = list(population)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("Échantillon plus grand que la population")
+        for i in range(k):
+            j = i + self.randbelow(n - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def spawn(self, count: int) -> list["Pcg32"]:
+        """``count`` générateurs indépendants (flux distincts) dérivés de celui-ci."""
+        return [Pcg32(self.getrandbits(64), stream=i + 1) for i in range(count)]
+
+
+def make_rng(seed: int | None = None, version: int = RNG_VERSION) -> Pcg32 | random.Random:
+    """Générateur pour ``seed`` selon la version d'algorithme.
+
+    Sans graine, le générateur est initialisé depuis l'entropie du système.
+    """
+    if version == LEGACY_RNG_VERSION:
+        return random.Random(seed)
+    if version == RNG_VERSION:
+        return Pcg32(seed % (1 << 64) if seed is not None else None)
+    raise ValueError(f"Version de générateur inconnue : {version}")
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Score de qualité des séances candidates (génération « meilleur de K »).
+
+Chaque bloc est réduit à son masque HoldSet (entier, un bit par rang de
+prise dans le catalogue). Les critères ensemblistes sont des opérations
+binaires sur ces masques, exécutées en C : les prises distinctes d'une
+séance sont le popcount du OU de ses blocs, et un tag requis est couvert par
+un bloc si son masque (prises portant le tag, calculé une fois) croise celui
+du bloc. Seuls l'ajustement de niveau et l'étendue restent un passage par
+prise.
+
+Critères (score plus grand = meilleur) :
+    - ajustement de niveau : écart moyen |niveau - niveau attendu| (pénalité) ;
+    - couverture des tags requis : part des tags requis présents par bloc ;
+    - réutilisation : part des prises répétées d'un bloc à l'autre (pénalité) ;
+    - dispersion : étendue moyenne des blocs sur la grille (lignes + colonnes).
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from brlok.config.difficulty import get_distribution_levels
+from brlok.models import Catalog, Session
+from brlok.models.hold_set import popcount
+
+WEIGHT_LEVEL = 1.0
+WEIGHT_TAGS = 0.5
+WEIGHT_REUSE = 1.0
+WEIGHT_SPREAD = 0.5
+
+
+def score_sessions(
+    catalog: Catalog,
+    sessions: Sequence[Session],
+    *,
+    target_level: int,
+    distribution_pattern: str = "uniforme",
+    per_block_levels: list[tuple[int, int]] | None = None,
+    required_tags: list[str] | None = None,
+    skip_blocks: int = 0,
+) -> list[float]:
+    """Score de chaque séance (même ordre que ``sessions``).
+
+    Args:
+        skip_blocks: Blocs de tête ignorés (favoris injectés, identiques partout).
+    """
+    if not sessions:
+        return []
+    index = catalog.hold_index()
+    holds = index.holds
+    level_of = [h.level for h in holds]
+    row_of = [h.position.row for h in holds]
+    col_of = [h.position.col for h in holds]
+    req = list(dict.fromkeys(required_tags or []))
+    # Masque de chaque tag requis : prises du catalogue portant ce tag
+    tag_masks = [sum(1 << slot for slot, h in enumerate(holds) if t in h.tags) for t in req]
+    norm_r = max(1, index.rows - 1)
+    norm_c = max(1, index.cols - 1)
+    pattern = distribution_pattern or "uniforme"
+    expected_cache: dict[tuple[int, int], list[int]] = {}
+
+    scores: list[float] = []
+    for session in sessions:
+        session_mask = 0
+        total = 0
+        n_blocks = 0
+        level_err = 0
+        spread = 0.0
+        coverage = 0.0
+        for b_idx, block in enumerate(session.blocks[skip_blocks:]):
+            if not block.holds:
+                continue
+            target = (
+                per_block_levels[b_idx][0]
+                if per_block_levels and b_idx < len(per_block_levels)
+                else target_level
+            )
+            key = (len(block.holds), target)
+            levels = expected_cache.get(key)
+            if levels is None:
+                levels = get_distribution_levels(pattern, len(block.holds), target)
+                expected_cache[key] = levels
+            n_blocks += 1
+            slots: list[int] = []
+            mask = 0
+            for hold, lev in zip(block.holds, levels):
+                slot = index.slot_of(hold.id)
+                if slot < 0:
+                    continue
+                slots.append(slot)
+                mask |= 1 << slot
+                level_err += abs(level_of[slot] - lev)
+            if not slots:
+                continue
+            total += len(slots)
+            session_mask |= mask
+            rows = [row_of[slot] for slot in slots]
+            cols = [col_of[slot] for slot in slots]
+            spread += ((max(rows) - min(rows)) / norm_r + (max(cols) - min(cols)) / norm_c) / 2
+            if req:
+                coverage += sum(1 for tag_mask in tag_masks if tag_mask & mask) / len(req)
+
+        if total == 0 or n_blocks == 0:
+            scores.append(float("-inf"))
+            continue
+        # Réutilisation : prises tirées moins prises distinctes (bits du OU des blocs)
+        reused = total - popcount(session_mask)
+        scores.append(
+            WEIGHT_TAGS * coverage / n_blocks
+            + WEIGHT_SPREAD * spread / n_blocks
+            - WEIGHT_LEVEL * level_err / total
+            - WEIGHT_REUSE * reused / total
+        )
+    return scores
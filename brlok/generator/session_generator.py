@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING
 
 from brlok.config.difficulty import get_distribution_levels
-from brlok.models import Block, Catalog, Hold, Session, SessionConstraints
+from brlok.generator.plan import GenerationPlan
+from brlok.generator.rng import RNG_VERSION, Pcg32, make_rng
+from brlok.generator.scoring import score_sessions
+from brlok.models import Block, Catalog, Hold, HoldIndex, ReachMatrix, Session, SessionConstraints
+from brlok.profiling import profiled
 
+if TYPE_CHECKING:
+    from brlok.storage.recent_blocks import RecentBlocksFilter
 
+# Re-tirages maximum d'un bloc déjà grimpé récemment (avoid_recent_days)
+MAX_RECENT_REDRAWS = 8
+
+
+@profiled
 def generate_session(
     catalog: Catalog,
     target_level: int,
@@ -23,6 +35,13 @@ def generate_session(
     seed: int | None = None,
     distribution_pattern: str = "uniforme",
     per_block_levels: list[tuple[int, int]] | None = None,
+    usage_prior: dict[str, float] | None = None,
+    avoid_recent_days: int | None = None,
+    best_of: int = 1,
+    max_reach: float | None = None,
+    min_reach: float | None = None,
+    rng_version: int = RNG_VERSION,
+    plan: GenerationPlan | None = None,
 ) -> Session:
     """Génère une séance avec contraintes de niveau, tags et variété.
 
@@ -40,13 +59,72 @@ def generate_session(
         favorite_blocks: Blocs favoris à injecter en tête de séance (FR17).
             Total blocs = len(favorite_blocks) + blocks_count (favoris en tête).
         seed: Graine aléatoire pour reproductibilité (optionnel).
+        rng_version: Algorithme du générateur aléatoire (voir ``rng`` ; 0 = random.Random
+            historique). Une même graine et une même version donnent la même séance
+            sur toute plateforme (version ≥ 1).
+        plan: Template compilé (``plan.compile_template``). Si per_block_levels est
+            None, les niveaux par bloc du plan sont utilisés ; ses niveaux par
+            position remplacent get_distribution_levels quand ils correspondent.
         distribution_pattern: Répartition des prises (uniforme, progressive, pyramide, etc.).
         per_block_levels: (target_level, tolerance) par bloc. Si None, utilise target_level global.
+        usage_prior: Usage passé des prises {id: score} (voir hold_usage_store). Avec
+            variety, sert de compteur initial : les prises souvent grimpées récemment
+            sont moins tirées. Ignoré sans variety.
+        avoid_recent_days: Si > 0, un bloc déjà grimpé dans les N derniers jours
+            (même séquence ou mêmes prises, voir recent_blocks) est re-tiré, au plus
+            ``MAX_RECENT_REDRAWS`` fois ; le dernier tirage est gardé sinon.
+        best_of: Si > 1, tire ``best_of`` séances (graines dérivées de ``seed``) et
+            retourne la mieux notée par ``scoring.score_sessions`` (niveau, tags,
+            réutilisation, dispersion).
+        max_reach: Distance maximale (en cases) entre deux prises consécutives d'un
+            bloc ; les pieds sont pris à au plus cette distance de la prise de départ.
+        min_reach: Distance minimale (en cases) entre deux prises consécutives.
+            Les candidates sont filtrées par la matrice ``catalog.reach_matrix()``
+            (tirage contraint, pas de rejet) ; un bloc s'arrête si aucune prise
+            éligible n'est à portée.
 
     Returns:
         Session avec blocs et contraintes utilisées.
     """
-    rng = random.Random(seed) if seed is not None else random
+    rng = make_rng(seed, rng_version)
+    if plan is not None and per_block_levels is None and plan.per_block_levels:
+        per_block_levels = list(plan.per_block_levels)
+
+    if best_of > 1:
+        candidates = [
+            generate_session(
+                catalog,
+                target_level,
+                blocks_count=blocks_count,
+                holds_per_block=holds_per_block,
+                enchainements=enchainements,
+                level_tolerance=level_tolerance,
+                required_tags=required_tags,
+                excluded_tags=excluded_tags,
+                variety=variety,
+                favorite_blocks=favorite_blocks,
+                seed=rng.getrandbits(64),
+                distribution_pattern=distribution_pattern,
+                per_block_levels=per_block_levels,
+                usage_prior=usage_prior,
+                avoid_recent_days=avoid_recent_days,
+                max_reach=max_reach,
+                min_reach=min_reach,
+                rng_version=rng_version,
+                plan=plan,
+            )
+            for _ in range(best_of)
+        ]
+        scores = score_sessions(
+            catalog,
+            candidates,
+            target_level=target_level,
+            distribution_pattern=distribution_pattern,
+            per_block_levels=per_block_levels,
+            required_tags=required_tags,
+            skip_blocks=len(favorite_blocks or []),
+        )
+        return candidates[max(range(len(candidates)), key=scores.__getitem__)]
 
     req_tags = required_tags or []
     exc_tags = excluded_tags or []
@@ -65,9 +143,6 @@ def generate_session(
             ),
         )
 
-    # FR9 : exclure les prises inactives
-    eligible = [h for h in catalog.holds if h.active]
-
     # Filtrer par niveau : union des plages si per_block_levels, sinon globale
     pbl = per_block_levels
     if pbl and len(pbl) > 0:
@@ -76,15 +151,8 @@ def generate_session(
     else:
         min_level = max(1, target_level - level_tolerance)
         max_level = min(5, target_level + level_tolerance)
-    eligible = [h for h in eligible if min_level <= h.level <= max_level]
-
-    # FR7 : contraintes de tags — forcer (required)
-    if req_tags:
-        eligible = [h for h in eligible if any(t in h.tags for t in req_tags)]
-
-    # FR7 : contraintes de tags — filtrer (excluded)
-    if exc_tags:
-        eligible = [h for h in eligible if not any(t in h.tags for t in exc_tags)]
+    index = catalog.hold_index()
+    eligible = _filter_eligible(index, min_level, max_level, req_tags, exc_tags)
 
     constraints = SessionConstraints(
         target_level=target_level,
@@ -99,9 +167,75 @@ def generate_session(
     if not eligible:
         return Session(blocks=blocks, constraints=constraints)
 
-    usage_count: dict[str, int] = {h.id: 0 for h in eligible}
+    prior = usage_prior if variety and usage_prior else {}
+    usage_count: dict[str, float] = {h.id: prior.get(h.id, 0.0) for h in eligible}
+
+    eligible_feet = _eligible_feet(catalog, min_level, max_level)
+
+    pattern = distribution_pattern or "uniforme"
+    # Niveaux par position du plan, valables pour le même motif et les mêmes blocs
+    plan_levels = (
+        plan
+        if plan is not None
+        and plan.distribution_pattern == pattern
+        and pbl is not None
+        and tuple(pbl) == plan.per_block_levels
+        else None
+    )
+
+    reach = catalog.reach_matrix() if max_reach is not None or min_reach is not None else None
+    recent = None
+    if avoid_recent_days and avoid_recent_days > 0:
+        from brlok.storage.recent_blocks import recent_blocks_filter
+        recent = recent_blocks_filter(avoid_recent_days)
+
+    blocks.extend(_pick_blocks(
+        index,
+        eligible,
+        eligible_feet,
+        rng,
+        blocks_count=blocks_count,
+        n_holds=n_holds,
+        target_level=target_level,
+        level_tolerance=level_tolerance,
+        per_block_levels=pbl,
+        pattern=pattern,
+        plan_levels=plan_levels,
+        variety=variety,
+        usage_count=usage_count,
+        reach=reach,
+        min_reach=min_reach,
+        max_reach=max_reach,
+        recent=recent,
+    ))
+    return Session(blocks=blocks, constraints=constraints)
+
 
-    # Pieds éligibles : union [min_level, max_level]
+@profiled("generator.filter")
+def _filter_eligible(
+    index: HoldIndex,
+    min_level: int,
+    max_level: int,
+    req_tags: list[str],
+    exc_tags: list[str],
+) -> list[Hold]:
+    """Prises actives de niveau [min_level, max_level] respectant les tags (ordre du catalogue)."""
+    # FR9 : exclure les prises inactives — seaux par niveau de l'index (ordre du catalogue)
+    eligible = index.active_in_levels(min_level, max_level)
+
+    # FR7 : contraintes de tags — forcer (required)
+    if req_tags:
+        eligible = [h for h in eligible if any(t in h.tags for t in req_tags)]
+
+    # FR7 : contraintes de tags — filtrer (excluded)
+    if exc_tags:
+        eligible = [h for h in eligible if not any(t in h.tags for t in exc_tags)]
+    return eligible
+
+
+@profiled("generator.feet")
+def _eligible_feet(catalog: Catalog, min_level: int, max_level: int) -> list[tuple[int, int]]:
+    """Pieds éligibles (ligne, colonne) : union [min_level, max_level]."""
     foot_levels = getattr(catalog, "foot_levels", None) or [[1] * 6 for _ in range(4)]
     eligible_feet: list[tuple[int, int]] = []
     for r in range(min(4, len(catalog.foot_grid or []))):
@@ -111,9 +245,48 @@ def generate_session(
                 lev = foot_levels[r][c] if r < len(foot_levels) and c < len(foot_levels[r]) else 1
                 if min_level <= lev <= max_level:
                     eligible_feet.append((r, c))
+    return eligible_feet
 
-    pattern = distribution_pattern or "uniforme"
+
+@profiled("generator.pick")
+def _pick_blocks(
+    index: HoldIndex,
+    eligible: list[Hold],
+    eligible_feet: list[tuple[int, int]],
+    rng: Pcg32 | random.Random,
+    *,
+    blocks_count: int,
+    n_holds: int,
+    target_level: int,
+    level_tolerance: int,
+    per_block_levels: list[tuple[int, int]] | None,
+    pattern: str,
+    plan_levels: GenerationPlan | None,
+    variety: bool,
+    usage_count: dict[str, float],
+    reach: ReachMatrix | None,
+    min_reach: float | None,
+    max_reach: float | None,
+    recent: RecentBlocksFilter | None,
+) -> list[Block]:
+    """Tire les ``blocks_count`` blocs de la séance (voir generate_session).
+
+    ``usage_count`` est mis à jour avec les prises tirées.
+    """
     pbl = per_block_levels
+    blocks: list[Block] = []
+    # Prises éligibles (avec leur bit HoldSet) par plage de niveaux, calculées une
+    # fois par plage ; l'exclusion des prises déjà choisies est un ET binaire.
+    eligible_bits: list[tuple[Hold, int]] = [(h, index.bit(h.id)) for h in eligible]
+    window_cache: dict[tuple[int, int, int], list[tuple[Hold, int]]] = {}
+
+    def _window(lo: int, hi: int, pool: list[tuple[Hold, int]]) -> list[tuple[Hold, int]]:
+        key = (lo, hi, id(pool))
+        found = window_cache.get(key)
+        if found is None:
+            found = [item for item in pool if lo <= item[0].level <= hi]
+            window_cache[key] = found
+        return found
 
     for block_idx in range(blocks_count):
         block_target, block_tol = (
@@ -121,34 +294,125 @@ def generate_session(
         )
         block_min = max(1, block_target - block_tol)
         block_max = min(5, block_target + block_tol)
-        block_eligible = [h for h in eligible if block_min <= h.level <= block_max]
+        block_eligible = _window(block_min, block_max, eligible_bits)
         if not block_eligible:
-            block_eligible = eligible
+            block_eligible = eligible_bits
 
         n = min(n_holds, len(block_eligible))
         if n < 1:
             break
 
-        pos_levels = get_distribution_levels(pattern, n, block_target)
-        chosen_holds: list[Hold] = []
-        for pos in range(n):
-            req_level = pos_levels[pos] if pos < len(pos_levels) else block_target
-            req_min = max(1, req_level - 1)
-            req_max = min(5, req_level + 1)
-            at_level = [h for h in block_eligible if h.id not in {x.id for x in chosen_holds} and req_min <= h.level <= req_max]
-            candidates = at_level if at_level else [h for h in block_eligible if h.id not in {x.id for x in chosen_holds}]
-            if not candidates:
+        pos_levels = (plan_levels.levels_for(block_idx, n) if plan_levels else None) or (
+            get_distribution_levels(pattern, n, block_target)
+        )
+        for _attempt in range(MAX_RECENT_REDRAWS + 1):
+            chosen_holds: list[Hold] = []
+            chosen = index.hold_set()
+            allowed = -1  # masque des prises à portée de la précédente (-1 : toutes)
+            for pos in range(n):
+                req_level = pos_levels[pos] if pos < len(pos_levels) else block_target
+                req_min = max(1, req_level - 1)
+                req_max = min(5, req_level + 1)
+                at_level = [
+                    h for h, bit in _window(req_min, req_max, block_eligible)
+                    if bit & allowed and not chosen.bits & bit
+                ]
+                candidates = at_level if at_level else [
+                    h for h, bit in block_eligible if bit & allowed and not chosen.bits & bit
+                ]
+                if not candidates:
+                    break
+                if variety:
+                    weights = [1 / (1 + usage_count[h.id]) for h in candidates]
+                    pick = rng.choices(candidates, weights=weights, k=1)[0]
+                else:
+                    pick = rng.choice(candidates)
+                chosen_holds.append(pick)
+                chosen.add(pick.id)
+                if reach is not None:
+                    allowed = reach.reach_mask(index.slot_of(pick.id), min_reach, max_reach)
+            if recent is None or not recent.contains([h.id for h in chosen_holds]):
                 break
-            if variety:
-                weights = [1 / (1 + usage_count[h.id]) for h in candidates]
-                pick = rng.choices(candidates, weights=weights, k=1)[0]
-            else:
-                pick = rng.choice(candidates)
-            chosen_holds.append(pick)
-            usage_count[pick.id] += 1
-
-        n_feet = min(rng.randint(2, 4), len(eligible_feet)) if eligible_feet else 0
-        feet = rng.sample(eligible_feet, n_feet) if n_feet > 0 else []
+        # Une prise n'est tirée qu'une fois par bloc : compter après le tirage est équivalent
+        for hold in chosen_holds:
+            usage_count[hold.id] += 1
+
+        block_feet = eligible_feet
+        if reach is not None and max_reach is not None and chosen_holds:
+            block_feet = reach.feet_within(chosen_holds[0].id, eligible_feet, max_reach)
+        n_feet = min(rng.randint(2, 4), len(block_feet)) if block_feet else 0
+        feet = rng.sample(block_feet, n_feet) if n_feet > 0 else []
         blocks.append(Block(holds=chosen_holds, foot_positions=feet))
 
-    return Session(blocks=blocks, constraints=constraints)
+    return blocks
+
+
+# Tirages maximum pour obtenir un bloc différent de celui remplacé
+MAX_REGENERATE_ATTEMPTS = 8
+
+
+def regenerate_block(
+    session: Session,
+    index: int,
+    catalog: Catalog,
+    constraints: SessionConstraints | None = None,
+    seed: int | None = None,
+    *,
+    level_tolerance: int = 1,
+    block_level: tuple[int, int] | None = None,
+    distribution_pattern: str = "uniforme",
+    usage_prior: dict[str, float] | None = None,
+    rng_version: int = RNG_VERSION,
+) -> Session:
+    """Remplace le bloc ``index`` de la séance ; les autres blocs sont inchangés.
+
+    Reprend les contraintes de la séance (niveau, tags, variété, prises par
+    bloc). Avec variety, les prises des autres blocs comptent comme déjà
+    utilisées (en plus de ``usage_prior``). Un tirage identique au bloc
+    remplacé est refait, au plus ``MAX_REGENERATE_ATTEMPTS`` fois.
+
+    Args:
+        constraints: Contraintes à utiliser (défaut : ``session.constraints``).
+        block_level: (target_level, tolérance) du bloc ; défaut : niveau de la séance.
+
+    Returns:
+        Nouvelle séance (la séance d'origine n'est pas modifiée). Inchangée si
+        aucune prise n'est éligible.
+    """
+    if not 0 <= index < len(session.blocks):
+        raise IndexError(f"Bloc {index} hors séance ({len(session.blocks)} blocs)")
+    cons = constraints or session.constraints
+    old = session.blocks[index]
+    usage: dict[str, float] = dict(usage_prior or {})
+    for i, block in enumerate(session.blocks):
+        if i != index:
+            for hold in block.holds:
+                usage[hold.id] = usage.get(hold.id, 0.0) + 1
+    rng = make_rng(seed, rng_version)
+    new_block: Block | None = None
+    for _attempt in range(MAX_REGENERATE_ATTEMPTS):
+        drawn = generate_session(
+            catalog,
+            cons.target_level or 3,
+            blocks_count=1,
+            holds_per_block=cons.enchainements or len(old.holds),
+            level_tolerance=level_tolerance,
+            required_tags=cons.required_tags or None,
+            excluded_tags=cons.excluded_tags or None,
+            variety=cons.variety,
+            seed=rng.getrandbits(64),
+            distribution_pattern=distribution_pattern,
+            per_block_levels=[block_level] if block_level else None,
+            usage_prior=usage,
+            rng_version=rng_version,
+        )
+        if not drawn.blocks:
+            break
+        new_block = drawn.blocks[0]
+        if [h.id for h in new_block.holds] != [h.id for h in old.holds]:
+            break
+    if new_block is None:
+        return session
+    blocks = list(session.blocks)
+    blocks[index] = new_block
+    return session.model_copy(update={"blocks": blocks})
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Séance continue : blocs produits à la demande par un générateur Python.
+
+``iter_blocks`` tire un bloc à la fois (mêmes règles que ``generate_session``)
+sans fin ; ``BlockStream`` garde d'avance les ``PREFETCH`` prochains blocs.
+Mémoire et temps par bloc ne dépendent pas de la durée de la séance : l'état
+se limite à l'usage des prises (borné par le catalogue) et au tampon.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterator
+
+from brlok.generator.rng import RNG_VERSION, make_rng
+from brlok.generator.session_generator import generate_session
+from brlok.models import Block, Catalog, SessionConstraints
+
+# Blocs tirés d'avance par BlockStream
+PREFETCH = 3
+# Facteur d'oubli de l'usage à chaque bloc (variété sur les blocs récents)
+USAGE_DECAY = 0.9
+
+
+def iter_blocks(
+    catalog: Catalog,
+    constraints: SessionConstraints,
+    seed: int | None = None,
+    *,
+    level_tolerance: int = 1,
+    distribution_pattern: str = "uniforme",
+    usage_prior: dict[str, float] | None = None,
+    rng_version: int = RNG_VERSION,
+) -> Iterator[Block]:
+    """Blocs à la demande, sans fin ; s'arrête si aucune prise n'est éligible.
+
+    Avec ``constraints.variety``, les prises des blocs précédents sont moins
+    tirées (usage atténué de ``USAGE_DECAY`` à chaque bloc).
+    """
+    rng = make_rng(seed, rng_version)
+    usage: dict[str, float] = dict(usage_prior or {})
+    while True:
+        drawn = generate_session(
+            catalog,
+            constraints.target_level or 3,
+            blocks_count=1,
+            holds_per_block=constraints.enchainements or 10,
+            level_tolerance=level_tolerance,
+            required_tags=constraints.required_tags or None,
+            excluded_tags=constraints.excluded_tags or None,
+            variety=constraints.variety,
+            seed=rng.getrandbits(64),
+            distribution_pattern=distribution_pattern,
+            usage_prior=usage,
+            rng_version=rng_version,
+        )
+        if not drawn.blocks:
+            return
+        block = drawn.blocks[0]
+        if constraints.variety:
+            for hold_id in list(usage):
+                usage[hold_id] *= USAGE_DECAY
+            for hold in block.holds:
+                usage[hold.id] = usage.get(hold.id, 0.0) + 1
+        yield block
+
+
+class BlockStream:
+    """Tampon de ``prefetch`` blocs devant un itérateur de blocs."""
+
+    def __init__(self, blocks: Iterator[Block], prefetch: int = PREFETCH) -> None:
+        self._blocks = blocks
+        self._prefetch = max(1, prefetch)
+        self._buffer: deque[Block] = deque()
+        self._exhausted = False
+
+    def fill(self) -> None:
+        """Complète le tampon jusqu'à ``prefetch`` blocs."""
+        while not self._exhausted and len(self._buffer) < self._prefetch:
+            try:
+                self._buffer.append(next(self._blocks))
+            except StopIteration:
+                self._exhausted = True
+
+    def has_next(self) -> bool:
+        """True si un bloc suivant est disponible."""
+        self.fill()
+        return bool(self._buffer)
+
+    def next_block(self) -> Block | None:
+        """Bloc suivant (None si le flux est épuisé)."""
+        self.fill()
+        return self._buffer.popleft() if self._buffer else None
+
+    def __len__(self) -> int:
+        """Blocs actuellement en tampon."""
+        return len(self._buffer)
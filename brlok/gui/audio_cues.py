@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Banque de signaux sonores préchargés du timer (QSoundEffect)."""
+from __future__ import annotations
+
+import logging
+
+from PySide6.QtCore import QObject, QUrl
+
+from brlok.timer.cues import CUE_TONES, ensure_cue_files
+
+logger = logging.getLogger(__name__)
+
+CUE_VOLUME = 0.4
+
+
+class AudioCueBank(QObject):
+    """Un QSoundEffect chargé par signal ; ``preload`` avant la séance, ``play`` sans délai."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._effects: dict = {}
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """True une fois ``preload`` effectué."""
+        return self._loaded
+
+    def preload(self) -> None:
+        """Génère les fichiers si besoin et charge chaque son (une seule fois)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            from PySide6.QtMultimedia import QSoundEffect
+
+            from brlok.config.paths import get_data_dir
+            paths = ensure_cue_files(get_data_dir() / "sounds")
+        except (ImportError, OSError) as e:
+            logger.warning("Signaux sonores indisponibles: %s", e)
+            return
+        for cue in CUE_TONES:
+            effect = QSoundEffect(self)
+            effect.setVolume(CUE_VOLUME)
+            effect.setSource(QUrl.fromLocalFile(str(paths[cue])))
+            self._effects[cue] = effect
+
+    def play(self, cue: str) -> None:
+        """Joue le signal ``cue`` (préchargé à la première demande si besoin)."""
+        if not self._loaded:
+            self.preload()
+        effect = self._effects.get(cue)
+        if effect is not None and effect.source().isValid():
+            effect.play()
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Modèle Qt de la liste des prises (vue catalogue) et proxy de recherche."""
+from __future__ import annotations
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor
+
+from brlok.gui.colors import INACTIVE_COLOR, LEVEL_COLORS_PALE
+from brlok.models import Catalog, Hold
+from brlok.storage.catalog_ops import _parse_tags_input
+
+COL_ID = 0
+COL_LEVEL = 1
+COL_TAGS = 2
+COL_ACTIVE = 3
+HEADERS = ("ID", "Niveau", "Tags", "Actif")
+
+_Index = QModelIndex | QPersistentModelIndex
+
+
+def _sort_key(hold: Hold) -> tuple[int, int]:
+    return (hold.position.row, hold.position.col)
+
+
+class HoldTableModel(QAbstractTableModel):
+    """Prises du catalogue triées par position (ligne, colonne).
+
+    Le modèle ne modifie pas le catalogue : une édition émet ``holdEdited``
+    (id, colonne, valeur) et le widget applique le changement puis appelle
+    ``set_catalog`` ; seules les lignes modifiées émettent ``dataChanged``.
+    """
+
+    holdEdited = Signal(str, int, object)
+
+    def __init__(self, catalog: Catalog | None = None, parent: object | None = None) -> None:
+        super().__init__(parent)
+        self._holds: list[Hold] = []
+        self._row_by_id: dict[str, int] = {}
+        self._search_text: list[str] = []
+        self._brushes: dict[tuple[int, bool], QColor] = {}
+        if catalog is not None:
+            self.set_catalog(catalog)
+
+    # --- Accès -----------------------------------------------------------
+
+    def hold_at(self, row: int) -> Hold | None:
+        """Prise de la ligne ``row`` (index source), ou None."""
+        if 0 <= row < len(self._holds):
+            return self._holds[row]
+        return None
+
+    def row_of(self, hold_id: str) -> int:
+        """Ligne de la prise ``hold_id`` (O(1)), -1 si absente."""
+        return self._row_by_id.get(hold_id, -1)
+
+    def search_text(self, row: int) -> str:
+        """Texte de recherche pré-calculé (id + tags, minuscules)."""
+        return self._search_text[row]
+
+    # --- Mise à jour -----------------------------------------------------
+
+    def set_catalog(self, catalog: Catalog) -> None:
+        """Synchronise le modèle avec le catalogue.
+
+        Même liste d'IDs dans le même ordre : ``dataChanged`` sur les seules
+        lignes modifiées. Sinon (ajout, suppression, déplacement) : reset.
+        """
+        holds = sorted(catalog.holds, key=_sort_key)
+        same_rows = len(holds) == len(self._holds) and all(
+            new.id == old.id for new, old in zip(holds, self._holds)
+        )
+        if not same_rows:
+            self.beginResetModel()
+            self._holds = holds
+            self._row_by_id = {h.id: i for i, h in enumerate(holds)}
+            self._search_text = [self._make_search_text(h) for h in holds]
+            self.endResetModel()
+            return
+        last_col = len(HEADERS) - 1
+        for row, hold in enumerate(holds):
+            if hold == self._holds[row]:
+                continue
+            self._holds[row] = hold
+            self._search_text[row] = self._make_search_text(hold)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+
+    @staticmethod
+    def _make_search_text(hold: Hold) -> str:
+        return f"{hold.id.lower()}\x00{','.join(hold.tags).lower()}"
+
+    def _background(self, hold: Hold) -> QColor:
+        key = (hold.level, hold.active)
+        color = self._brushes.get(key)
+        if color is None:
+            color = (
+                QColor(INACTIVE_COLOR)
+                if not hold.active
+                else QColor(LEVEL_COLORS_PALE.get(hold.level, "#f5f5f5"))
+            )
+            self._brushes[key] = color
+        return color
+
+    # --- API QAbstractTableModel -----------------------------------------
+
+    def rowCount(self, parent: _Index = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._holds)
+
+    def columnCount(self, parent: _Index = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> object:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: _Index) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        col = index.column()
+        if col in (COL_LEVEL, COL_TAGS):
+            return base | Qt.ItemFlag.ItemIsEditable
+        if col == COL_ACTIVE:
+            return base | Qt.ItemFlag.ItemIsUserCheckable
+        return base
+
+    def data(self, index: _Index, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        hold = self._holds[index.row()]
+        col = index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == COL_ID:
+                return hold.id
+            if col == COL_LEVEL:
+                return str(hold.level)
+            if col == COL_TAGS:
+                return ", ".join(hold.tags)
+            return None
+        if role == Qt.ItemDataRole.CheckStateRole and col == COL_ACTIVE:
+            return Qt.CheckState.Checked if hold.active else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._background(hold)
+        if role == Qt.ItemDataRole.UserRole:
+            return hold.id
+        return None
+
+    def setData(self, index: _Index, value: object, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Valide la saisie puis émet ``holdEdited`` ; le catalogue reste inchangé ici."""
+        if not index.isValid():
+            return False
+        hold = self._holds[index.row()]
+        col = index.column()
+        if col == COL_ACTIVE and role == Qt.ItemDataRole.CheckStateRole:
+            active = Qt.CheckState(value) == Qt.CheckState.Checked
+            if active == hold.active:
+                return False
+            self.holdEdited.emit(hold.id, col, active)
+            return True
+        if role != Qt.ItemDataRole.EditRole:
+            return False
+        if col == COL_LEVEL:
+            try:
+                level = int(str(value).strip())
+            except ValueError:
+                return False
+            if not 1 <= level <= 5 or level == hold.level:
+                return False
+            self.holdEdited.emit(hold.id, col, level)
+            return True
+        if col == COL_TAGS:
+            tags = _parse_tags_input(str(value or ""))
+            if tags == hold.tags:
+                return False
+            self.holdEdited.emit(hold.id, col, tags)
+            return True
+        return False
+
+
+class HoldFilterProxyModel(QSortFilterProxyModel):
+    """Filtre les prises par sous-chaîne de l'ID ou des tags (insensible à la casse)."""
+
+    def __init__(self, parent: object | None = None) -> None:
+        super().__init__(parent)
+        self._search = ""
+
+    def set_search(self, text: str) -> None:
+        """Met à jour la recherche ; ne refiltre que si le texte change."""
+        search = text.strip().lower()
+        if search == self._search:
+            return
+        if hasattr(self, "beginFilterChange"):  # Qt ≥ 6.10
+            self.beginFilterChange()
+            self._search = search
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self._search = search
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: _Index) -> bool:
+        if not self._search:
+            return True
+        model = self.sourceModel()
+        if not isinstance(model, HoldTableModel):
+            return True
+        return self._search in model.search_text(source_row)
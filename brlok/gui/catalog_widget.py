@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Callable
 
 from pydantic import ValidationError
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import QModelIndex, QPoint, Qt, Signal
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -26,18 +26,27 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QSplitter,
     QSpinBox,
-    QToolButton,
+    QAbstractItemView,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
+    QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
-from PySide6.QtGui import QColor
-
-from brlok.models import Catalog, GridDimensions, Hold
+from brlok.models import DEFAULT_GRID, Catalog, GridDimensions, Hold
 from brlok.models.catalog import FOOT_GRID_COLS, FOOT_GRID_ROWS, FOOT_GRID_SPECS
-from brlok.gui.colors import LEVEL_COLORS_PALE, INACTIVE_COLOR, get_cell_style
+from brlok.profiling import profiled
+from brlok.gui.catalog_model import (
+    COL_ACTIVE,
+    COL_ID,
+    COL_LEVEL,
+    COL_TAGS,
+    HoldFilterProxyModel,
+    HoldTableModel,
+)
+from brlok.gui.colors import get_cell_style
 
 
 class _DoubleClickLabel(QLabel):
@@ -58,8 +67,9 @@ from brlok.storage.catalog_ops import (
     update_hold_level,
     update_hold_tags,
     _parse_tags_input,
+    _position_to_id,
 )
-from brlok.storage.catalog_store import create_default_catalog
+from brlok.storage.catalog_store import MAX_GRID_SIZE, create_default_catalog
 
 
 class CatalogWidget(QWidget):
@@ -83,7 +93,6 @@ class CatalogWidget(QWidget):
         self._on_set_default = on_set_default
         self._on_remove_catalog = on_remove_catalog
         self._catalog_combo = catalog_combo
-        self._sorted_holds: list = []
         self._list_panel_expanded = True
         self._list_panel_saved_width = 350
         self._build_ui()
@@ -201,51 +210,28 @@ class CatalogWidget(QWidget):
         self._search_edit.textChanged.connect(self._on_catalog_search_changed)
         list_layout.addWidget(self._search_edit)
 
-        self._table = QTableWidget()
-        self._table.setColumnCount(4)
-        self._table.setHorizontalHeaderLabels(["ID", "Niveau", "Tags", "Actif"])
+        self._model = HoldTableModel(self._catalog, self)
+        self._model.holdEdited.connect(self._on_hold_edited)
+        self._proxy = HoldFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._table = QTableView()
+        self._table.setModel(self._proxy)
+        self._table.verticalHeader().setVisible(False)
         header = self._table.horizontalHeader()
         for c in range(4):
             header.setSectionResizeMode(c, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # Tags prend l'espace restant
         self._table.setEditTriggers(
-            QTableWidget.EditTrigger.DoubleClicked
-            | QTableWidget.EditTrigger.SelectedClicked
-            | QTableWidget.EditTrigger.EditKeyPressed
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
         )
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self._table.cellChanged.connect(self._on_cell_changed)
-        self._table.itemChanged.connect(self._on_item_changed)
-        self._table.itemDoubleClicked.connect(self._on_table_double_click)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._table.doubleClicked.connect(self._on_table_double_click)
         self._table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self._table.customContextMenuRequested.connect(self._on_table_context_menu)
 
-        self._sorted_holds = sorted(self._catalog.holds, key=lambda h: (h.position.row, h.position.col))
-        for row, hold in enumerate(self._sorted_holds):
-            self._table.insertRow(row)
-            id_item = QTableWidgetItem(hold.id)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(row, 0, id_item)
-            level_item = QTableWidgetItem(str(hold.level))
-            level_item.setFlags(level_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(row, 1, level_item)
-            tags_item = QTableWidgetItem(", ".join(hold.tags) if hold.tags else "")
-            tags_item.setFlags(tags_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(row, 2, tags_item)
-            actif_item = QTableWidgetItem("")
-            actif_item.setFlags(
-                (actif_item.flags() | Qt.ItemFlag.ItemIsUserCheckable) & ~Qt.ItemFlag.ItemIsEditable
-            )
-            actif_item.setCheckState(Qt.CheckState.Checked if hold.active else Qt.CheckState.Unchecked)
-            actif_item.setData(Qt.ItemDataRole.UserRole, hold.id)
-            self._table.setItem(row, 3, actif_item)
-            bg = QColor(INACTIVE_COLOR) if not hold.active else QColor(LEVEL_COLORS_PALE.get(hold.level, "#f5f5f5"))
-            for col in range(4):
-                cell = self._table.item(row, col)
-                if cell:
-                    cell.setBackground(bg)
-
         list_layout.addWidget(self._table)
         right_layout.addWidget(self._list_frame)
 
@@ -400,7 +386,7 @@ class CatalogWidget(QWidget):
 
     def _position_to_id(self, row: int, col: int) -> str:
         """Génère l'id A1, B2... à partir de (row, col)."""
-        return chr(ord("A") + col) + str(row + 1)
+        return _position_to_id(row, col)
 
     def _show_modify_holds_dialog(self) -> None:
         """Fenêtre : liste des 42 prises (A1..F7) avec colonne difficulté éditable."""
@@ -463,15 +449,13 @@ class CatalogWidget(QWidget):
 
     def _on_add_hold_clicked(self) -> None:
         """Ouvre un dialogue pour ajouter une prise à une position libre."""
-        occupied = {(h.position.row, h.position.col) for h in self._catalog.holds}
-        rows, cols = self._catalog.grid.rows, self._catalog.grid.cols
-        free_positions = [(r, c) for r in range(rows) for c in range(cols) if (r, c) not in occupied]
+        free_positions = list(self._catalog.hold_index().free_positions())
         if not free_positions:
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Ajouter une prise",
-                "Toutes les positions sont occupées (grille 7×6).\n\n"
+                f"Toutes les positions sont occupées (grille {self._catalog.grid.rows}×{self._catalog.grid.cols}).\n\n"
                 "Pour ajouter une prise :\n"
                 "1. Clic droit sur une prise dans la grille → « Supprimer la prise »\n"
                 "2. Puis recliquez sur « Ajouter une prise » pour choisir la position libérée.",
@@ -670,7 +654,20 @@ class CatalogWidget(QWidget):
                     "Le nom ne peut pas être vide.",
                 )
                 return
-            new_cat = create_default_catalog()
+            # Grille du pan : 7×6 par défaut, autre taille → grille libre
+            rows, ok = QInputDialog.getInt(
+                parent, "Nouveau catalogue", "Nombre de lignes :",
+                DEFAULT_GRID.rows, 1, MAX_GRID_SIZE,
+            )
+            if not ok:
+                return
+            cols, ok = QInputDialog.getInt(
+                parent, "Nouveau catalogue", "Nombre de colonnes :",
+                DEFAULT_GRID.cols, 1, MAX_GRID_SIZE,
+            )
+            if not ok:
+                return
+            new_cat = create_default_catalog(GridDimensions(rows=rows, cols=cols))
             self._cb_new_catalog(new_cat, name)
             return
 
@@ -701,148 +698,50 @@ class CatalogWidget(QWidget):
             "Activez ou désactivez les prises selon vos besoins pour les séances.",
         )
 
+    @profiled
     def _refresh_table(self) -> None:
-        """Reconstruit la table des prises."""
-        self._table.blockSignals(True)
-        self._table.setRowCount(0)
-        self._sorted_holds = sorted(self._catalog.holds, key=lambda h: (h.position.row, h.position.col))
-        for row, hold in enumerate(self._sorted_holds):
-            self._table.insertRow(row)
-            id_item = QTableWidgetItem(hold.id)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(row, 0, id_item)
-            level_item = QTableWidgetItem(str(hold.level))
-            level_item.setFlags(level_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(row, 1, level_item)
-            tags_item = QTableWidgetItem(", ".join(hold.tags) if hold.tags else "")
-            tags_item.setFlags(tags_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self._table.setItem(row, 2, tags_item)
-            actif_item = QTableWidgetItem("")
-            actif_item.setFlags(
-                (actif_item.flags() | Qt.ItemFlag.ItemIsUserCheckable) & ~Qt.ItemFlag.ItemIsEditable
-            )
-            actif_item.setCheckState(Qt.CheckState.Checked if hold.active else Qt.CheckState.Unchecked)
-            actif_item.setData(Qt.ItemDataRole.UserRole, hold.id)
-            self._table.setItem(row, 3, actif_item)
-            bg = QColor(INACTIVE_COLOR) if not hold.active else QColor(LEVEL_COLORS_PALE.get(hold.level, "#f5f5f5"))
-            for col in range(4):
-                cell = self._table.item(row, col)
-                if cell:
-                    cell.setBackground(bg)
-        self._table.blockSignals(False)
-        self._apply_catalog_search_filter()
+        """Synchronise la table des prises (dataChanged sur les lignes modifiées)."""
+        self._model.set_catalog(self._catalog)
 
     def _on_catalog_search_changed(self, text: str) -> None:
         self._apply_catalog_search_filter()
 
     def _apply_catalog_search_filter(self) -> None:
         """Filtre la table des prises par ID ou tags."""
-        if not hasattr(self, "_search_edit") or not hasattr(self, "_sorted_holds"):
-            return
-        search = self._search_edit.text().strip().lower()
-        for i in range(self._table.rowCount()):
-            if i >= len(self._sorted_holds):
-                break
-            hold = self._sorted_holds[i]
-            match = (
-                not search
-                or search in hold.id.lower()
-                or search in ",".join(hold.tags).lower()
-            )
-            self._table.setRowHidden(i, not match)
-
-    def _on_item_changed(self, item: QTableWidgetItem) -> None:
-        """Checkbox Actif toggle → mise à jour et sauvegarde."""
-        if self._table.column(item) != 3:
-            return
-        hold_id = item.data(Qt.ItemDataRole.UserRole)
-        if not hold_id:
-            return
-        new_active = item.checkState() == Qt.CheckState.Checked
-        for i, h in enumerate(self._sorted_holds):
-            if h.id == hold_id and h.active != new_active:
-                try:
-                    self._table.blockSignals(True)
-                    self._catalog = update_hold_active(self._catalog, hold_id, new_active)
-                    self._sorted_holds = sorted(self._catalog.holds, key=lambda x: (x.position.row, x.position.col))
-                    item.setText("")
-                    row = self._table.row(item)
-                    self._refresh_grid()
-                    self._update_table_row_style(row)
-                    if self._on_save:
-                        self._on_save(self._catalog)
-                finally:
-                    self._table.blockSignals(False)
-                break
-
-    def _on_cell_changed(self, row: int, col: int) -> None:
-        """Niveau ou tags modifié → mise à jour hold et sauvegarde."""
-        if row >= len(self._sorted_holds):
+        if not hasattr(self, "_search_edit"):
             return
-        hold_id = self._sorted_holds[row].id
+        self._proxy.set_search(self._search_edit.text())
 
-        if col == 1:
-            self._apply_level_change(row, hold_id)
-        elif col == 2:
-            self._apply_tags_change(row, hold_id)
+    def _hold_at_proxy_index(self, index: QModelIndex) -> Hold | None:
+        """Prise correspondant à un index de la vue (proxy)."""
+        if not index.isValid():
+            return None
+        return self._model.hold_at(self._proxy.mapToSource(index).row())
 
-    def _apply_level_change(self, row: int, hold_id: str) -> None:
-        item = self._table.item(row, 1)
-        if not item:
-            return
+    def _on_hold_edited(self, hold_id: str, column: int, value: object) -> None:
+        """Édition dans la table (niveau, tags, actif) → mise à jour et sauvegarde."""
         try:
-            new_level = int(item.text())
-        except ValueError:
-            return
-        if not 1 <= new_level <= 5:
-            self._table.blockSignals(True)
-            item.setText(str(self._sorted_holds[row].level))
-            self._table.blockSignals(False)
-            return
-        if self._sorted_holds[row].level == new_level:
-            return
-        try:
-            self._catalog = update_hold_level(self._catalog, hold_id, new_level)
-            self._sorted_holds = sorted(self._catalog.holds, key=lambda h: (h.position.row, h.position.col))
-            self._refresh_grid()
-            self._update_table_row_style(row)
-            if self._on_save:
-                self._on_save(self._catalog)
+            if column == COL_LEVEL:
+                self._catalog = update_hold_level(self._catalog, hold_id, value)
+            elif column == COL_TAGS:
+                self._catalog = update_hold_tags(self._catalog, hold_id, value)
+            elif column == COL_ACTIVE:
+                self._catalog = update_hold_active(self._catalog, hold_id, value)
+            else:
+                return
         except ValueError:
-            self._table.blockSignals(True)
-            item.setText(str(self._sorted_holds[row].level))
-            self._table.blockSignals(False)
-
-    def _apply_tags_change(self, row: int, hold_id: str) -> None:
-        item = self._table.item(row, 2)
-        if not item:
             return
-        new_tags = _parse_tags_input(item.text() or "")
-        current_tags = self._sorted_holds[row].tags
-        if new_tags == current_tags:
-            return
-        try:
-            self._catalog = update_hold_tags(self._catalog, hold_id, new_tags)
-            self._sorted_holds = sorted(self._catalog.holds, key=lambda h: (h.position.row, h.position.col))
-            self._refresh_grid()
-            self._update_table_row_style(row)
-            if self._on_save:
-                self._on_save(self._catalog)
-        except ValueError:
-            self._table.blockSignals(True)
-            item.setText(", ".join(current_tags) if current_tags else "")
-            self._table.blockSignals(False)
+        self._model.set_catalog(self._catalog)
+        self._refresh_grid()
+        if self._on_save:
+            self._on_save(self._catalog)
 
     def _make_grid_view(self) -> QWidget:
         """Représentation 2D de la grille avec positions occupées + grille pieds (même forme)."""
         from brlok.gui.pan_widget import GRID_SPACING, SEPARATOR_HEIGHT
 
         rows, cols = self._catalog.grid.rows, self._catalog.grid.cols
-        positions: dict[tuple[int, int], str] = {}
-        hold_info: dict[str, tuple[int, bool]] = {}
-        for h in self._catalog.holds:
-            positions[(h.position.row, h.position.col)] = h.id
-            hold_info[h.id] = (h.level, h.active)
+        index = self._catalog.hold_index()
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -858,8 +757,9 @@ class CatalogWidget(QWidget):
 
         for r in range(rows):
             for c in range(cols):
-                hold_id = positions.get((r, c), "·")
-                level, active = hold_info.get(hold_id, (2, True))
+                hold = index.at(r, c)
+                hold_id = hold.id if hold is not None else "·"
+                level, active = (hold.level, hold.active) if hold is not None else (2, True)
                 label = _DoubleClickLabel(hold_id)
                 label.setFixedSize(cell_w, cell_h)
                 label.setToolTip("Double-clic pour modifier" if hold_id != "·" else "Double-clic pour ajouter une prise")
@@ -907,7 +807,7 @@ class CatalogWidget(QWidget):
 
     def _on_grid_double_click(self, row: int, col: int) -> None:
         """Double-clic sur une cellule : ouvre le dialogue d'édition."""
-        hold = next((h for h in self._catalog.holds if h.position.row == row and h.position.col == col), None)
+        hold = self._catalog.hold_index().at(row, col)
         if hold:
             self._show_edit_hold_dialog(hold)
         else:
@@ -951,7 +851,7 @@ class CatalogWidget(QWidget):
 
     def _on_grid_context_menu(self, row: int, col: int) -> None:
         """Menu contextuel sur une cellule de la grille."""
-        hold = next((h for h in self._catalog.holds if h.position.row == row and h.position.col == col), None)
+        hold = self._catalog.hold_index().at(row, col)
         menu = QMenu(self)
         if hold:
             act_mod_level = menu.addAction("Modifier le niveau…")
@@ -974,38 +874,25 @@ class CatalogWidget(QWidget):
             if menu.exec(QCursor.pos()) == act_add:
                 self._do_add_hold_at(row, col)
 
-    def _on_table_double_click(self, item: QTableWidgetItem) -> None:
-        """Double-clic : Niveau/Tags -> editItem ; autres colonnes -> dialog."""
-        col = self._table.column(item)
-        if col == 1 or col == 2:
-            self._table.setCurrentItem(item)
-            idx = self._table.indexFromItem(item)
-            QTimer.singleShot(0, lambda: self._table.edit(idx))
-            return
-        if col == 3:
-            return  # Checkbox géré par itemChanged
-        row = self._table.row(item)
-        if 0 <= row < len(self._sorted_holds):
-            hold = self._sorted_holds[row]
+    def _on_table_double_click(self, index: QModelIndex) -> None:
+        """Double-clic : Niveau/Tags/Actif -> édition en place ; ID -> dialog."""
+        if index.column() != COL_ID:
+            return  # Édition gérée par la vue (editTriggers, case à cocher)
+        hold = self._hold_at_proxy_index(index)
+        if hold is not None:
             self._show_edit_hold_dialog(hold)
 
-    def _on_table_context_menu(self, pos: "QPoint") -> None:
+    def _on_table_context_menu(self, pos: QPoint) -> None:
         """Menu contextuel sur une ligne de la table."""
-        from PySide6.QtCore import QPoint
-
-        item = self._table.itemAt(pos)
-        if not item:
+        hold = self._hold_at_proxy_index(self._table.indexAt(pos))
+        if hold is None:
             return
-        row = self._table.row(item)
-        if row < 0 or row >= len(self._sorted_holds):
-            return
-        hold = self._sorted_holds[row]
         menu = QMenu(self)
         act_mod_level = menu.addAction("Modifier le niveau…")
         act_mod_tags = menu.addAction("Modifier les tags…")
         act_toggle = menu.addAction("Désactiver" if hold.active else "Activer")
         act_del = menu.addAction("Supprimer la prise")
-        action = menu.exec(self._table.mapToGlobal(pos))
+        action = menu.exec(self._table.viewport().mapToGlobal(pos))
         if action == act_mod_level:
             self._do_modify_level(hold.id)
         elif action == act_mod_tags:
@@ -1052,7 +939,7 @@ class CatalogWidget(QWidget):
         """Ouvre une boîte pour modifier le niveau."""
         from PySide6.QtWidgets import QMessageBox
 
-        hold = next(h for h in self._catalog.holds if h.id == hold_id)
+        hold = self._catalog.hold_index().get(hold_id)
         dlg = QDialog(self.window() or self)
         dlg.setWindowTitle("Modifier le niveau")
         layout = QVBoxLayout(dlg)
@@ -1081,7 +968,7 @@ class CatalogWidget(QWidget):
         """Ouvre une boîte pour modifier les tags."""
         from PySide6.QtWidgets import QLineEdit, QMessageBox
 
-        hold = next(h for h in self._catalog.holds if h.id == hold_id)
+        hold = self._catalog.hold_index().get(hold_id)
         dlg = QDialog(self.window() or self)
         dlg.setWindowTitle("Modifier les tags")
         layout = QVBoxLayout(dlg)
@@ -1107,7 +994,7 @@ class CatalogWidget(QWidget):
 
     def _do_toggle_active(self, hold_id: str) -> None:
         """Inverse le statut actif de la prise."""
-        hold = next(h for h in self._catalog.holds if h.id == hold_id)
+        hold = self._catalog.hold_index().get(hold_id)
         self._catalog = update_hold_active(self._catalog, hold_id, not hold.active)
         self._refresh_table()
         self._refresh_grid()
@@ -1139,27 +1026,13 @@ class CatalogWidget(QWidget):
         """Met à jour l'affichage de la grille : texte, style (background), tooltip."""
         if not hasattr(self, "_grid_labels") or not self._grid_labels:
             return
-        positions: dict[tuple[int, int], str] = {}
-        hold_info: dict[str, tuple[int, bool]] = {}
-        for h in self._catalog.holds:
-            positions[(h.position.row, h.position.col)] = h.id
-            hold_info[h.id] = (h.level, h.active)
+        index = self._catalog.hold_index()
         for (r, c), label in self._grid_labels.items():
-            hold_id = positions.get((r, c), "·")
+            hold = index.at(r, c)
+            hold_id = hold.id if hold is not None else "·"
             label.setText(hold_id)
-            level, active = hold_info.get(hold_id, (2, True))
+            level, active = (hold.level, hold.active) if hold is not None else (2, True)
             label.setStyleSheet(get_cell_style(hold_id, level, active, False))
             label.setToolTip(
                 "Double-clic pour modifier" if hold_id != "·" else "Double-clic pour ajouter une prise"
             )
-
-    def _update_table_row_style(self, row: int) -> None:
-        """Met à jour la couleur de fond de la ligne de la table."""
-        if row < 0 or row >= len(self._sorted_holds):
-            return
-        hold = self._sorted_holds[row]
-        bg = QColor(INACTIVE_COLOR) if not hold.active else QColor(LEVEL_COLORS_PALE.get(hold.level, "#f5f5f5"))
-        for col in range(4):
-            cell = self._table.item(row, col)
-            if cell:
-                cell.setBackground(bg)
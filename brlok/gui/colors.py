@@ -36,17 +36,27 @@ TEXT_ON_INACTIVE = "#444"  # fond gris inactif
 TEXT_ON_SATURATED = "#fff"  # fonds saturés (highlighted)
 
 
-def get_cell_style(
-    hold_id: str,
+# Épaisseur de bordure : 4px pour la première prise du bloc (départ)
+BORDER_WIDTH = 2
+BORDER_WIDTH_FIRST = 4
+
+# Niveaux précalculés dans la table (1–5 prises, 6 pieds)
+_STYLE_LEVELS = (1, 2, 3, 4, 5, 6)
+
+# Table des styles : (empty, level, active, highlighted, first, theme) → CSS
+_style_table: dict[tuple[bool, int, bool, bool, bool, str], str] = {}
+_style_theme = "light"
+
+
+def _format_cell_style(
+    empty: bool,
     level: int,
     active: bool,
     highlighted: bool,
+    first: bool,
 ) -> str:
-    """Retourne le style CSS pour une cellule du pan.
-    Toujours définit color pour lisibilité (clair/sombre).
-    Pas de margin (spacing géré par QGridLayout).
-    """
-    if hold_id == "·":
+    """Construit le CSS d'une cellule (appelé uniquement pour remplir la table)."""
+    if empty:
         bg = EMPTY_COLOR
         border = BORDER_DEFAULT
         color = TEXT_ON_LIGHT
@@ -63,5 +73,50 @@ def get_cell_style(
         border = BORDER_DEFAULT
         color = TEXT_ON_LIGHT
 
+    width = BORDER_WIDTH_FIRST if first and highlighted else BORDER_WIDTH
     weight = "bold" if highlighted else "normal"
-    return f"border: 2px solid {border}; background: {bg}; color: {color}; font-weight: {weight};"
+    return f"border: {width}px solid {border}; background: {bg}; color: {color}; font-weight: {weight};"
+
+
+def rebuild_cell_styles(theme: str) -> None:
+    """Précalcule la table des styles pour un thème (appelé au changement de thème)."""
+    global _style_theme
+    _style_theme = theme
+    _style_table.clear()
+    for level in _STYLE_LEVELS:
+        for active in (True, False):
+            for highlighted in (True, False):
+                for first in (True, False):
+                    _style_table[(False, level, active, highlighted, first, theme)] = _format_cell_style(
+                        False, level, active, highlighted, first
+                    )
+    for highlighted in (True, False):
+        for first in (True, False):
+            _style_table[(True, 0, True, highlighted, first, theme)] = _format_cell_style(
+                True, 0, True, highlighted, first
+            )
+
+
+def get_cell_style(
+    hold_id: str,
+    level: int,
+    active: bool,
+    highlighted: bool,
+    first: bool = False,
+) -> str:
+    """Retourne le style CSS pour une cellule du pan (lecture dans la table précalculée).
+    Toujours définit color pour lisibilité (clair/sombre).
+    Pas de margin (spacing géré par QGridLayout).
+    first : première prise du bloc surligné (bordure épaisse).
+    """
+    empty = hold_id == "·"
+    key = (empty, 0 if empty else level, True if empty else active, highlighted, first, _style_theme)
+    style = _style_table.get(key)
+    if style is None:
+        # Niveau hors table (fallback gris) : calculé une fois puis mémorisé
+        style = _format_cell_style(*key[:5])
+        _style_table[key] = style
+    return style
+
+
+rebuild_cell_styles(_style_theme)
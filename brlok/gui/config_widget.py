@@ -26,9 +26,15 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from brlok.generator import check_feasibility
+from brlok.models import SessionConstraints
 from brlok.storage.templates_store import export_templates_to_file, merge_templates_from_file
 
 
+def _parse_tags(s: str) -> list[str]:
+    return [t.strip() for t in s.split(",") if t.strip()]
+
+
 class ConfigWidget(QWidget):
     """Panneau de configuration avancée : template/séquence et difficulté."""
 
@@ -44,11 +50,14 @@ class ConfigWidget(QWidget):
         self._catalog = catalog
         self._on_generate = on_generate
         self._on_templates_changed = on_templates_changed
+        # Niveaux cibles par bloc du template sélectionné (vide si aucun)
+        self._template_levels: list[int] = []
         self._build_ui()
 
     def set_catalog(self, catalog) -> None:
         """Met à jour le catalogue (appelé lors du changement de catalogue actif)."""
         self._catalog = catalog
+        self._update_feasibility()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -86,6 +95,10 @@ class ConfigWidget(QWidget):
         self._holds_spin.setRange(1, 20)
         self._holds_spin.setValue(10)
         seq_layout.addRow("Prises par bloc :", self._holds_spin)
+        self._endless_check = QCheckBox("Séance continue (blocs générés à la demande)")
+        self._endless_check.setToolTip("Nouveau bloc à chaque « Suivant », sans limite de nombre")
+        self._endless_check.toggled.connect(lambda on: self._blocks_spin.setEnabled(not on))
+        seq_layout.addRow("", self._endless_check)
         self._work_spin = QSpinBox()
         self._work_spin.setRange(5, 300)
         self._work_spin.setValue(40)
@@ -126,6 +139,13 @@ class ConfigWidget(QWidget):
         self._variety_check = QCheckBox("Variété (éviter répétitions)")
         self._variety_check.setChecked(False)
         diff_layout.addRow("", self._variety_check)
+        self._best_of_spin = QSpinBox()
+        self._best_of_spin.setRange(1, 256)
+        self._best_of_spin.setValue(1)
+        self._best_of_spin.setToolTip(
+            "Nombre de séances tirées ; la mieux notée (niveau, tags, variété, dispersion) est gardée"
+        )
+        diff_layout.addRow("Tirages :", self._best_of_spin)
         self._required_tags_edit = QLineEdit()
         self._required_tags_edit.setPlaceholderText("crimp, sloper (vide = aucun)")
         self._required_tags_edit.setToolTip("Tags à inclure : ne garder que les prises ayant au moins un de ces tags")
@@ -153,8 +173,47 @@ class ConfigWidget(QWidget):
         self._generate_btn.clicked.connect(self._on_generate_clicked)
         layout.addWidget(self._generate_btn)
 
+        # Diagnostic de faisabilité, recalculé à chaque modification du formulaire
+        self._feasibility_label = QLabel()
+        self._feasibility_label.setWordWrap(True)
+        layout.addWidget(self._feasibility_label)
+        for spin in (self._blocks_spin, self._holds_spin, self._tolerance_spin):
+            spin.valueChanged.connect(self._update_feasibility)
+        for combo in (self._template_combo, self._difficulty_combo, self._distribution_combo):
+            combo.currentIndexChanged.connect(self._update_feasibility)
+        for edit in (self._required_tags_edit, self._excluded_tags_edit):
+            edit.textChanged.connect(self._update_feasibility)
+
         layout.addStretch()
         self._update_save_buttons_state()
+        self._update_feasibility()
+
+    def _update_feasibility(self) -> None:
+        """Met à jour le diagnostic (comptages de l'index, sans générer)."""
+        if self._catalog is None:
+            self._feasibility_label.clear()
+            return
+        from brlok.config.difficulty import get_difficulty_params
+        target_level, _ = get_difficulty_params(self._difficulty_combo.currentText())
+        blocks_count = self._blocks_spin.value()
+        per_block_levels = None
+        if self._template_levels and len(self._template_levels) >= blocks_count:
+            per_block_levels = [(t, 1) for t in self._template_levels[:blocks_count]]
+        report = check_feasibility(
+            self._catalog,
+            SessionConstraints(
+                target_level=target_level,
+                required_tags=_parse_tags(self._required_tags_edit.text()),
+                excluded_tags=_parse_tags(self._excluded_tags_edit.text()),
+                enchainements=self._holds_spin.value(),
+            ),
+            level_tolerance=self._tolerance_spin.value(),
+            blocks_count=blocks_count,
+            per_block_levels=per_block_levels,
+            distribution_pattern=self._distribution_combo.currentData() or "uniforme",
+        )
+        self._feasibility_label.setText(report.summary())
+        self._feasibility_label.setStyleSheet("" if report.ok else "color: #c62828;")
 
     def _on_generate_clicked(self) -> None:
         if not self._on_generate:
@@ -162,9 +221,6 @@ class ConfigWidget(QWidget):
         from brlok.config.difficulty import get_difficulty_params
         name = self._difficulty_combo.currentText()
         target_level, _ = get_difficulty_params(name)
-        def _parse_tags(s: str) -> list[str]:
-            return [t.strip() for t in s.split(",") if t.strip()]
-
         self._on_generate(
             target_level=target_level,
             level_tolerance=self._tolerance_spin.value(),
@@ -172,6 +228,8 @@ class ConfigWidget(QWidget):
             holds_per_block=self._holds_spin.value(),
             template_id=self._template_combo.currentData(),
             variety=self._variety_check.isChecked(),
+            best_of=self._best_of_spin.value(),
+            endless=self._endless_check.isChecked(),
             distribution_pattern=self._distribution_combo.currentData() or "uniforme",
             work_s=self._work_spin.value(),
             rest_s=self._rest_spin.value(),
@@ -257,12 +315,14 @@ class ConfigWidget(QWidget):
     def _on_template_changed(self) -> None:
         tid = self._template_combo.currentData()
         self._update_save_buttons_state()
+        self._template_levels = []
         if not tid:
             return
-        from brlok.config.difficulty import get_difficulty_display_name
+        from brlok.config.difficulty import block_level_to_target, get_difficulty_display_name
         from brlok.storage.templates_store import get_template
         t = get_template(tid)
         if t:
+            self._template_levels = [block_level_to_target(cfg.level) for cfg in t.blocks_config]
             self._blocks_spin.setValue(t.blocks_count)
             self._holds_spin.setValue(t.holds_per_block)
             if t.blocks_config:
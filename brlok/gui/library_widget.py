@@ -28,6 +28,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from brlok.gui.similar_blocks_dialog import show_similar_blocks
 from brlok.models import Block, CompletedSession, Session
 from brlok.storage.favorites_store import (
     add_favorite,
@@ -435,6 +436,7 @@ class LibraryWidget(QWidget):
         menu = QMenu(self)
         act_load = menu.addAction("▶ Charger en Séance")
         act_export = menu.addAction("Exporter…")
+        act_similar = menu.addAction("Blocs similaires…")
         menu.addSeparator()
         act_comment = menu.addAction("Modifier le commentaire…")
         act_remove = menu.addAction("Retirer des favoris")
@@ -443,6 +445,10 @@ class LibraryWidget(QWidget):
             self._on_load_clicked()
         elif action == act_export:
             self._on_export_clicked()
+        elif action == act_similar:
+            show_similar_blocks(
+                self, block, catalog_id=self._get_catalog_id(), exclude_identical=True
+            )
         elif action == act_comment:
             new_comment, ok = QInputDialog.getText(
                 self, "Commentaire", "Commentaire pour ce bloc :",
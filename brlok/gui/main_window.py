@@ -20,13 +20,14 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from brlok.generator import generate_session
-from brlok.models import Catalog, Session
+from brlok.generator import BlockStream, generate_session, iter_blocks
+from brlok.generator.plan import GenerationParams, compile_template
+from brlok.models import Catalog, Session, SessionConstraints
 from brlok.storage.catalog_store import save_catalog
 from brlok.storage.catalog_collection_store import get_active_catalog, load_collection, remove_catalog, set_active_catalog
 from brlok.storage.favorites_store import load_favorites
 from brlok.storage.history_store import add_to_history
-from brlok.config.difficulty import block_level_to_target
+from brlok.storage.hold_usage_store import load_usage_prior
 from brlok.storage.templates_store import get_template
 
 from brlok.gui.catalog_widget import CatalogWidget
@@ -223,7 +224,12 @@ class BrlokMainWindow(QMainWindow):
 
     def _on_end_session(self, session: Session, block_statuses: dict[int, str]) -> None:
         """Enregistre la séance terminée dans l'historique (7.4)."""
-        add_to_history(session, block_statuses)
+        add_to_history(
+            session,
+            block_statuses,
+            catalog_id=self._catalog_combo.currentData(),
+            timings=self._session_widget.session_timings(),
+        )
 
     def _on_restart(self) -> None:
         """Relance l'application (nouvelle instance après sauvegarde)."""
@@ -255,8 +261,12 @@ class BrlokMainWindow(QMainWindow):
         blocks: int,
         enchainements: int,
         template_id: str | None,
-    ) -> tuple[Session, object] | None:
-        """Génère une séance (paramètres fournis par le formulaire intégré)."""
+    ) -> tuple[Session, object, GenerationParams] | None:
+        """Génère une séance (paramètres fournis par le formulaire intégré).
+
+        Retourne (séance, template, paramètres de génération) ; le template choisi
+        fixe les niveaux par bloc et la répartition, réutilisés par « Refaire ».
+        """
         active = [h for h in self._catalog.holds if h.active]
         if not active:
             from PySide6.QtWidgets import QMessageBox
@@ -268,6 +278,14 @@ class BrlokMainWindow(QMainWindow):
             return None
         catalog_id = self._catalog_combo.currentData()
         favorites = load_favorites(catalog_id)
+        template = get_template(template_id) if template_id else None
+        plan = compile_template(template, blocks) if template else None
+        params = GenerationParams(
+            level_tolerance=level_tolerance,
+            distribution_pattern=plan.distribution_pattern if plan else "uniforme",
+            favorites_count=len(favorites or []),
+            plan=plan,
+        )
         self._session = generate_session(
             self._catalog,
             target_level=level,
@@ -275,6 +293,8 @@ class BrlokMainWindow(QMainWindow):
             blocks_count=blocks,
             enchainements=enchainements,
             favorite_blocks=favorites if favorites else None,
+            distribution_pattern=params.distribution_pattern,
+            plan=plan,
         )
         if not self._session.blocks:
             from PySide6.QtWidgets import QMessageBox
@@ -284,8 +304,7 @@ class BrlokMainWindow(QMainWindow):
                 "Aucune prise active au niveau 1–3. Modifiez le catalogue ou les niveaux.",
             )
             return None
-        template = get_template(template_id) if template_id else None
-        return (self._session, template)
+        return (self._session, template, params)
 
     def _generate_session_from_config(
         self,
@@ -303,6 +322,8 @@ class BrlokMainWindow(QMainWindow):
         required_tags: list[str] | None = None,
         excluded_tags: list[str] | None = None,
         chrono_mode: str = "countdown",
+        best_of: int = 1,
+        endless: bool = False,
     ) -> None:
         """Génère une séance depuis l'onglet Configuration (per-block, répartition)."""
         active = [h for h in self._catalog.holds if h.active]
@@ -315,28 +336,60 @@ class BrlokMainWindow(QMainWindow):
             )
             return
         template = get_template(template_id) if template_id else None
-        per_block_levels: list[tuple[int, int]] | None = None
-        if template and template.blocks_config and len(template.blocks_config) >= blocks_count:
-            per_block_levels = [
-                (block_level_to_target(cfg.level), 1)
-                for cfg in template.blocks_config[:blocks_count]
-            ]
+        # Template compilé une fois (niveaux par bloc, niveaux par position, timing)
+        plan = compile_template(template, blocks_count) if template else None
+        per_block_levels = list(plan.per_block_levels) if plan and plan.per_block_levels else None
         catalog_id = self._catalog_combo.currentData()
         favorites = load_favorites(catalog_id)
-        self._session = generate_session(
-            self._catalog,
-            target_level=target_level,
+        usage_prior = load_usage_prior(catalog_id) if variety else None
+        params = GenerationParams(
             level_tolerance=level_tolerance,
-            blocks_count=blocks_count,
-            holds_per_block=holds_per_block,
-            enchainements=holds_per_block,
-            variety=variety,
-            favorite_blocks=favorites if favorites else None,
             distribution_pattern=distribution_pattern,
-            per_block_levels=per_block_levels,
-            required_tags=required_tags or None,
-            excluded_tags=excluded_tags or None,
+            per_block_levels=tuple(per_block_levels) if per_block_levels else None,
+            favorites_count=len(favorites or []),
+            usage_prior=usage_prior,
+            plan=plan,
         )
+        stream: BlockStream | None = None
+        if endless:
+            # Séance continue : favoris en tête puis blocs tirés à la demande
+            constraints = SessionConstraints(
+                target_level=target_level,
+                required_tags=required_tags or [],
+                excluded_tags=excluded_tags or [],
+                variety=variety,
+                enchainements=holds_per_block,
+            )
+            stream = BlockStream(
+                iter_blocks(
+                    self._catalog,
+                    constraints,
+                    level_tolerance=level_tolerance,
+                    distribution_pattern=distribution_pattern,
+                    usage_prior=usage_prior,
+                )
+            )
+            first = stream.next_block()
+            blocks = list(favorites or []) + ([first] if first else [])
+            self._session = Session(blocks=blocks, constraints=constraints) if first else Session()
+        else:
+            self._session = generate_session(
+                self._catalog,
+                target_level=target_level,
+                level_tolerance=level_tolerance,
+                blocks_count=blocks_count,
+                holds_per_block=holds_per_block,
+                enchainements=holds_per_block,
+                variety=variety,
+                usage_prior=usage_prior,
+                favorite_blocks=favorites if favorites else None,
+                distribution_pattern=distribution_pattern,
+                per_block_levels=per_block_levels,
+                required_tags=required_tags or None,
+                excluded_tags=excluded_tags or None,
+                best_of=best_of,
+                plan=plan,
+            )
         if not self._session.blocks:
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(
@@ -345,10 +398,9 @@ class BrlokMainWindow(QMainWindow):
                 "Aucune prise active dans la plage. Modifiez le catalogue ou la difficulté.",
             )
             return
-        self._session_widget.set_session(self._session)
-        if template and template.blocks_config:
-            cfg = template.blocks_config[0]
-            self._session_widget.set_timer_params(cfg.work_s, cfg.rest_s, cfg.rounds, chrono_mode=chrono_mode)
+        self._session_widget.set_session(self._session, stream=stream, params=params)
+        if plan and plan.first_timing:
+            self._session_widget.set_timer_params(*plan.first_timing, chrono_mode=chrono_mode)
         else:
             self._session_widget.set_timer_params(work_s, rest_s, rounds, chrono_mode=chrono_mode)
         self._tabs.setCurrentIndex(0)
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Callable
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QEvent, Qt, QTimer
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QFrame, QGridLayout, QLabel, QScrollArea, QVBoxLayout, QWidget
 
-from brlok.models import Catalog
+from brlok.models import Catalog, HoldSet
+from brlok.profiling import profiled
 
 from brlok.gui.colors import get_cell_style
 
@@ -19,6 +21,9 @@ GRID_MARGINS = 0  # Spacing géré par QGridLayout, pas de margin dans les cellu
 SEPARATOR_HEIGHT = 8
 FOOT_GRID_ROWS = 4
 FOOT_GRID_COLS = 6
+# Redimensionnement : recalcul des cellules RESIZE_COALESCE_MS après le dernier
+# événement d'une rafale (anti-rebond, ~1 frame à 60 Hz)
+RESIZE_COALESCE_MS = 16
 
 
 class PanWidget(QWidget):
@@ -46,6 +51,15 @@ class PanWidget(QWidget):
         self._highlight = highlight_hold_ids or set()
         self._block_hold_order = block_hold_order or {}
         self._on_context_menu = on_context_menu
+        # Rafraîchissement des tailles regroupé : les événements Resize d'une
+        # même frame ne déclenchent qu'un seul _update_cell_sizes
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_COALESCE_MS)
+        self._resize_timer.timeout.connect(self._update_cell_sizes)
+        self._applied_cell_size: tuple[int, int] | None = None
+        self._font_cache: dict[tuple[int, bool], QFont] = {}
+        self._layout_passes = 0  # recalculs effectifs des cellules (tests)
         self._build_ui()
 
     def set_catalog(self, catalog: Catalog) -> None:
@@ -55,7 +69,6 @@ class PanWidget(QWidget):
 
     def _refresh_foot_labels(self) -> None:
         """Remplit les labels pieds depuis catalog.foot_grid, couleur selon foot_levels."""
-        from brlok.gui.colors import get_cell_style, EMPTY_COLOR, BORDER_DEFAULT, TEXT_ON_LIGHT
         grid = self._catalog.foot_grid
         foot_levels = getattr(self._catalog, "foot_levels", None) or [[1] * 6 for _ in range(4)]
         for (r, c), lbl in self._foot_labels.items():
@@ -64,15 +77,12 @@ class PanWidget(QWidget):
                 val = str(grid[r][c]) if grid[r][c] else ""
             lev = foot_levels[r][c] if r < len(foot_levels) and c < len(foot_levels[r]) else 1
             lbl.setText(val)
-            if val:
-                lbl.setStyleSheet(get_cell_style(val, lev, True, False))
-            else:
-                lbl.setStyleSheet(
-                    f"border: 2px solid {BORDER_DEFAULT}; background: {EMPTY_COLOR}; color: {TEXT_ON_LIGHT};"
-                )
+            lbl.setStyleSheet(get_cell_style(val if val else "·", lev, True, False))
 
-    def set_highlight(self, hold_ids: set[str], block_hold_order: dict[str, int] | None = None) -> None:
-        """Met à jour les prises à surligner et l'ordre dans le bloc."""
+    def set_highlight(
+        self, hold_ids: set[str] | HoldSet, block_hold_order: dict[str, int] | None = None
+    ) -> None:
+        """Met à jour les prises à surligner (ids ou HoldSet) et l'ordre dans le bloc."""
         self._highlight = hold_ids
         self._block_hold_order = block_hold_order or {}
         self._refresh_cells()
@@ -82,6 +92,7 @@ class PanWidget(QWidget):
         self._grid_inner = None
         self._rebuild_grid()
 
+    @profiled
     def _rebuild_grid(self) -> None:
         """Construit ou reconstruit la grille."""
         if self._grid_inner is not None:
@@ -94,13 +105,7 @@ class PanWidget(QWidget):
             self._grid_inner.deleteLater()
 
         rows, cols = self._catalog.grid.rows, self._catalog.grid.cols
-        positions: dict[tuple[int, int], str] = {}
-        hold_info: dict[str, tuple[int, bool]] = {}
-        for h in self._catalog.holds:
-            positions[(h.position.row, h.position.col)] = h.id
-            hold_info[h.id] = (h.level, h.active)
-
-        self._hold_info = hold_info
+        index = self._catalog.hold_index()
         self._rows = rows
         self._cols = cols
         self._scroll = QScrollArea()
@@ -113,6 +118,7 @@ class PanWidget(QWidget):
         self._grid_layout.setVerticalSpacing(GRID_SPACING)
         self._grid_layout.setContentsMargins(GRID_MARGINS, GRID_MARGINS, GRID_MARGINS, GRID_MARGINS)
         self._labels: dict[tuple[int, int], QLabel] = {}
+        self._label_styles: dict[tuple[int, int], str] = {}
 
         init_w = init_h = self._cell_size
         if isinstance(self._fixed_cell_size, tuple):
@@ -121,8 +127,9 @@ class PanWidget(QWidget):
             init_w = init_h = self._fixed_cell_size
         for r in range(rows):
             for c in range(cols):
-                hold_id = positions.get((r, c), "·")
-                level, active = hold_info.get(hold_id, (2, True))
+                hold = index.at(r, c)
+                hold_id = hold.id if hold is not None else "·"
+                level, active = (hold.level, hold.active) if hold is not None else (2, True)
                 highlighted = hold_id in self._highlight
                 order = self._block_hold_order.get(hold_id)
                 text = f"{order}. {hold_id}" if order else hold_id
@@ -133,7 +140,9 @@ class PanWidget(QWidget):
                 font.setPointSize(max(12, self._cell_size // 3))
                 font.setBold(highlighted)
                 label.setFont(font)
-                label.setStyleSheet(get_cell_style(hold_id, level, active, highlighted))
+                style = get_cell_style(hold_id, level, active, highlighted, first=order == 1)
+                label.setStyleSheet(style)
+                self._label_styles[(r, c)] = style
                 if self._on_context_menu:
                     label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
                     label.customContextMenuRequested.connect(
@@ -165,8 +174,8 @@ class PanWidget(QWidget):
         self._scroll.setWidget(self._grid_inner)
 
         # Taille initiale et réactive au redimensionnement
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(0, self._update_cell_sizes)
+        self._applied_cell_size = None
+        self.schedule_cell_sizes_update()
 
         layout = self.layout()
         if layout is None:
@@ -176,12 +185,31 @@ class PanWidget(QWidget):
         self._scroll.installEventFilter(self)
 
     def eventFilter(self, obj: object, event: object) -> bool:
-        """Recalcule la taille des cellules au redimensionnement (ratio 1:1, bornes)."""
-        from PySide6.QtCore import QEvent
+        """Programme le recalcul des cellules au redimensionnement (anti-rebond)."""
         if obj == self._scroll and event.type() == QEvent.Type.Resize:
-            self._update_cell_sizes()
+            self.schedule_cell_sizes_update()
         return super().eventFilter(obj, event)
 
+    def schedule_cell_sizes_update(self) -> None:
+        """Demande un recalcul des tailles.
+
+        Chaque demande relance le minuteur : une rafale de redimensionnements
+        (glisser du bord de fenêtre) donne une seule passe, avec la taille
+        finale, RESIZE_COALESCE_MS après le dernier événement.
+        """
+        self._resize_timer.start()
+
+    def _cell_font(self, base: QFont, point_size: int, bold: bool) -> QFont:
+        """Police mise en cache par (taille, gras) : évite de recréer une QFont par label."""
+        key = (point_size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = QFont(base)
+            font.setPointSize(point_size)
+            font.setBold(bold)
+            self._font_cache[key] = font
+        return font
+
     def _update_cell_sizes(self) -> None:
         """Met à jour la taille des cellules (rectangles, fit-to-window)."""
         if not hasattr(self, "_labels") or not self._labels:
@@ -208,46 +236,40 @@ class PanWidget(QWidget):
             cell_h = available_h // total_rows if total_rows > 0 else CELL_SIZE_MIN
             cell_w = max(CELL_SIZE_MIN, min(CELL_SIZE_MAX, cell_w))
             cell_h = max(CELL_SIZE_MIN, min(CELL_SIZE_MAX, cell_h))
+        if self._applied_cell_size == (cell_w, cell_h):
+            return
+        self._applied_cell_size = (cell_w, cell_h)
+        self._layout_passes += 1
+        point_size = max(12, min(cell_w, cell_h) // 3)
         for label in self._labels.values():
             label.setFixedSize(cell_w, cell_h)
-            font = label.font()
-            font.setPointSize(max(12, min(cell_w, cell_h) // 3))
-            label.setFont(font)
+            label.setFont(self._cell_font(label.font(), point_size, label.font().bold()))
         for label in self._foot_labels.values():
             label.setFixedSize(cell_w, cell_h)
-            font = label.font()
-            font.setPointSize(max(12, min(cell_w, cell_h) // 3))
-            label.setFont(font)
+            label.setFont(self._cell_font(label.font(), point_size, False))
 
     def _on_cell_context(self, pos: object, row: int, col: int) -> None:
         """Menu contextuel sur une cellule."""
         if not self._on_context_menu:
             return
-        positions: dict[tuple[int, int], str] = {
-            (h.position.row, h.position.col): h.id for h in self._catalog.holds
-        }
-        hold_id = positions.get((row, col)) if (row, col) in positions else None
-        self._on_context_menu(hold_id, row, col)
+        hold = self._catalog.hold_index().at(row, col)
+        self._on_context_menu(hold.id if hold is not None else None, row, col)
 
     def _refresh_cells(self) -> None:
         """Rafraîchit le style des cellules (highlight, couleurs)."""
-        positions: dict[tuple[int, int], str] = {
-            (h.position.row, h.position.col): h.id for h in self._catalog.holds
-        }
-        hold_info: dict[str, tuple[int, bool]] = {
-            h.id: (h.level, h.active) for h in self._catalog.holds
-        }
-        self._hold_info = hold_info
+        index = self._catalog.hold_index()
         for (r, c), label in self._labels.items():
-            hold_id = positions.get((r, c), "·")
-            level, active = hold_info.get(hold_id, (2, True))
+            hold = index.at(r, c)
+            hold_id = hold.id if hold is not None else "·"
+            level, active = (hold.level, hold.active) if hold is not None else (2, True)
             highlighted = hold_id in self._highlight
             order = self._block_hold_order.get(hold_id)
             label.setText(f"{order}. {hold_id}" if order else hold_id)
             font = label.font()
             font.setBold(highlighted)
             label.setFont(font)
-            style = get_cell_style(hold_id, level, active, highlighted)
-            if order == 1 and highlighted:
-                style = style.replace("border: 2px", "border: 4px")
-            label.setStyleSheet(style)
+            style = get_cell_style(hold_id, level, active, highlighted, first=order == 1)
+            # setStyleSheet force un re-polish Qt : uniquement si le style change
+            if self._label_styles.get((r, c)) is not style:
+                label.setStyleSheet(style)
+                self._label_styles[(r, c)] = style
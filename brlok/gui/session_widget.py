@@ -26,12 +26,28 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from brlok.models import Catalog, Hold, Session
+from brlok.generator.plan import GenerationParams
+from brlok.generator.stream import BlockStream
+from brlok.models import Catalog, Hold, Session, SessionTimings
+from brlok.models.session_timings import (
+    EVENT_PAUSE,
+    EVENT_REST,
+    EVENT_RESUME,
+    EVENT_TIMER_STOP,
+    EVENT_WORK,
+    STATUS_EVENTS,
+)
+from brlok.profiling import profiled
+from brlok.timer import TimingRecorder
 
 from brlok.gui.pan_widget import PanWidget
 from brlok.gui.timer_widget import IntervalTimerWidget
 from brlok.storage.best_times_store import get_best_time, record_time_if_best
 
+# Phase du timer → événement de la chronologie ("" : timer arrêté)
+_PHASE_EVENTS = {"work": EVENT_WORK, "rest": EVENT_REST, "countup": EVENT_WORK}
+
+
 class SessionWidget(QWidget):
     """Vue séance : pan dominant (~75%) + sidebar (séquence, timer) + toolbar compacte."""
 
@@ -52,22 +68,46 @@ class SessionWidget(QWidget):
         self._block_index = 0
         self._block_history: list[int] = []
         self._block_statuses: dict[int, str] = {}
+        self._stream: BlockStream | None = None
+        self._generation_params: GenerationParams | None = None
         self._pause_timer: QTimer | None = None
         self._in_pause = False
+        self._timings = TimingRecorder()
         self._on_generate = on_generate
         self._on_favorites_changed = on_favorites_changed
         self._cb_end_session = on_end_session
         self._on_get_catalog_id = on_get_catalog_id
         self._build_ui()
 
-    def set_session(self, session: Session | None) -> None:
-        """Définit ou efface la séance."""
+    def set_session(
+        self,
+        session: Session | None,
+        stream: BlockStream | None = None,
+        params: GenerationParams | None = None,
+    ) -> None:
+        """Définit ou efface la séance.
+
+        Avec ``stream`` (séance continue), « Suivant » sur le dernier bloc ajoute
+        le prochain bloc du flux : la séance ne contient que les blocs vus.
+        ``params`` : paramètres de génération (motif, niveaux par bloc, usage),
+        réutilisés pour re-tirer un bloc.
+        """
         self._session = session
+        self._stream = stream if session is not None else None
+        self._generation_params = params if session is not None else None
         self._block_index = 0
         self._block_history = []
         self._block_statuses = {}
+        if session is not None:
+            self._timings.start(0)
+        else:
+            self._timings.reset()
         self._refresh()
 
+    def session_timings(self) -> SessionTimings | None:
+        """Chronologie de la séance en cours (blocs, rounds, pauses, statuts)."""
+        return self._timings.timings()
+
     def set_catalog(self, catalog: Catalog) -> None:
         """Met à jour le catalogue (après édition dans l'onglet Catalogue)."""
         self._catalog = catalog
@@ -158,6 +198,7 @@ class SessionWidget(QWidget):
         timer_layout = QVBoxLayout(self._timer_panel)
         self._timer_widget = IntervalTimerWidget(work_s=40, rest_s=20, rounds=3, compact=True)
         self._timer_widget.finished.connect(self._on_timer_finished)
+        self._timer_widget.phase_changed.connect(self._on_timer_phase)
         timer_layout.addWidget(self._timer_widget)
         self._timer_panel.setVisible(False)
         sidebar_layout.addWidget(self._timer_panel)
@@ -291,7 +332,8 @@ class SessionWidget(QWidget):
                 return
             session = result[0] if isinstance(result, tuple) else result
             template = result[1] if isinstance(result, tuple) and len(result) > 1 else None
-            self.set_session(session)
+            params = result[2] if isinstance(result, tuple) and len(result) > 2 else None
+            self.set_session(session, params=params or GenerationParams(level_tolerance=form.level_tolerance))
             if template and template.blocks_config:
                 cfg = template.blocks_config[0]
                 self.set_timer_params(cfg.work_s, cfg.rest_s, cfg.rounds)
@@ -306,24 +348,20 @@ class SessionWidget(QWidget):
         )
         if not path:
             return
-        from brlok.exports import export_json, export_markdown, export_pdf, export_txt
+        from brlok.exports import export_session
+        from brlok.exports.cache import FORMAT_JSON, FORMAT_MD, FORMAT_PDF, FORMAT_TXT, format_for_path
         p = Path(path)
+        fmt = format_for_path(p)
+        if fmt == FORMAT_JSON and p.suffix.lower() != ".json":
+            flt = selected_filter or ""
+            if "PDF" in flt:
+                fmt = FORMAT_PDF
+            elif "TXT" in flt:
+                fmt = FORMAT_TXT
+            elif "Markdown" in flt:
+                fmt = FORMAT_MD
         try:
-            if p.suffix.lower() == ".pdf":
-                export_pdf(self._session, p)
-            elif p.suffix.lower() in (".txt",):
-                export_txt(self._session, p, catalog=self._catalog)
-            elif p.suffix.lower() in (".md", ".markdown"):
-                export_markdown(self._session, p, catalog=self._catalog)
-            else:
-                if "PDF" in (selected_filter or ""):
-                    export_pdf(self._session, p)
-                elif "TXT" in (selected_filter or ""):
-                    export_txt(self._session, p, catalog=self._catalog)
-                elif "Markdown" in (selected_filter or ""):
-                    export_markdown(self._session, p, catalog=self._catalog)
-                else:
-                    export_json(self._session, p)
+            export_session(self._session, p, fmt, catalog=self._catalog)
             QMessageBox.information(self, "Export", f"Séance exportée dans {path}")
         except OSError as e:
             QMessageBox.critical(self, "Erreur", f"Impossible d'exporter : {e}")
@@ -375,7 +413,36 @@ class SessionWidget(QWidget):
         if self._on_favorites_changed:
             self._on_favorites_changed()
 
+    def _on_show_similar_blocks(self) -> None:
+        """Blocs passés (favoris, historique) proches du bloc courant."""
+        if not self._session or not self._session.blocks:
+            return
+        from brlok.gui.similar_blocks_dialog import show_similar_blocks
+        catalog_id = self._on_get_catalog_id() if self._on_get_catalog_id else None
+        show_similar_blocks(self, self._session.blocks[self._block_index], catalog_id=catalog_id)
+
     def _on_refaire(self) -> None:
+        """Refaire : régénère le bloc courant (les autres blocs sont conservés)."""
+        self._on_regenerate_block()
+
+    def _on_regenerate_block(self) -> None:
+        """Remplace le bloc courant par un nouveau tirage (mêmes contraintes)."""
+        if not self._session or not self._session.blocks:
+            return
+        from brlok.generator import regenerate_block
+        idx = self._block_index
+        params = self._generation_params or GenerationParams(level_tolerance=self._generate_form.level_tolerance)
+        updated = regenerate_block(
+            self._session,
+            idx,
+            self._catalog,
+            level_tolerance=params.level_tolerance,
+            block_level=params.block_level(idx),
+            distribution_pattern=params.distribution_pattern,
+            usage_prior=params.usage_prior,
+        )
+        self._session.blocks[idx] = updated.blocks[idx]
+        self._block_statuses.pop(idx, None)
         self._refresh()
 
     def _toggle_timer_panel(self) -> None:
@@ -396,27 +463,45 @@ class SessionWidget(QWidget):
             )
         self._refresh()
 
+    def _on_timer_phase(self, phase: str) -> None:
+        self._timings.mark(_PHASE_EVENTS.get(phase, EVENT_TIMER_STOP))
+
     def _on_block_status(self, status: str) -> None:
         if not self._session or not self._session.blocks:
             return
         self._block_statuses[self._block_index] = status
+        if status in STATUS_EVENTS:
+            self._timings.mark(STATUS_EVENTS[status])
         self._refresh()
 
     def _on_previous(self) -> None:
         if not self._block_history:
             return
         self._block_index = self._block_history.pop()
+        self._timings.enter_block(self._block_index)
         self._refresh()
 
     def _on_next(self) -> None:
-        if not self._session or self._block_index >= len(self._session.blocks) - 1:
+        if not self._session:
             return
+        if self._block_index >= len(self._session.blocks) - 1:
+            block = self._stream.next_block() if self._stream else None
+            if block is None:
+                return
+            self._session.blocks.append(block)
+            # Tampon complété hors du clic (prochain tour de boucle d'événements)
+            QTimer.singleShot(0, self._stream.fill)
         pause_s = self._pause_between_spin.value()
         if pause_s > 0 and not self._in_pause:
             self._start_pause_between_blocks(pause_s)
             return
         self._do_block_transition()
 
+    def showEvent(self, event) -> None:
+        """Précharge les signaux sonores du timer à l'ouverture de l'onglet."""
+        super().showEvent(event)
+        QTimer.singleShot(0, self._timer_widget.preload_cues)
+
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
         if self._pause_overlay.isVisible():
@@ -425,6 +510,7 @@ class SessionWidget(QWidget):
 
     def _start_pause_between_blocks(self, pause_s: int) -> None:
         self._in_pause = True
+        self._timings.mark(EVENT_PAUSE)
         self._pause_remaining_s = pause_s
         self._next_btn.setEnabled(False)
         self._pause_overlay.setGeometry(0, 0, self.width(), self.height())
@@ -448,6 +534,7 @@ class SessionWidget(QWidget):
         if self._pause_timer:
             self._pause_timer.stop()
         self._in_pause = False
+        self._timings.mark(EVENT_RESUME)
         self._pause_overlay.setVisible(False)
         self._do_block_transition()
 
@@ -459,6 +546,7 @@ class SessionWidget(QWidget):
     def _do_block_transition(self) -> None:
         self._block_history.append(self._block_index)
         self._block_index += 1
+        self._timings.enter_block(self._block_index)
         self._refresh()
 
     def _on_end_session(self) -> None:
@@ -474,36 +562,47 @@ class SessionWidget(QWidget):
         menu = QMenuWidget(self)
         if self._session and self._session.blocks:
             block = self._session.blocks[self._block_index]
-            current_hold_ids = {h.id for h in block.holds}
+            current_hold_ids = self._catalog.hold_index().hold_set(h.id for h in block.holds)
             if hold_id in current_hold_ids:
                 act_remove = menu.addAction("Retirer cette prise du bloc")
+                act_regen = menu.addAction("↻ Régénérer ce bloc")
                 act_fav = menu.addAction("☆ Ajouter le bloc aux favoris")
+                act_similar = menu.addAction("Blocs similaires…")
                 act_export = menu.addAction("Exporter la séance…")
                 act_end = menu.addAction("Fin de séance")
                 action = menu.exec(QCursor.pos())
                 if action == act_remove:
                     self._remove_hold_from_block(hold_id)
+                elif action == act_regen:
+                    self._on_regenerate_block()
                 elif action == act_fav:
                     self._on_add_favorite()
+                elif action == act_similar:
+                    self._on_show_similar_blocks()
                 elif action == act_export:
                     self._on_export_clicked()
                 elif action == act_end:
                     self._on_end_session()
             else:
-                hold = next((h for h in self._catalog.holds if h.id == hold_id), None)
+                hold = self._catalog.hold_index().get(hold_id)
                 if hold and hold.active:
                     act_add = menu.addAction("Ajouter cette prise au bloc")
                     if menu.exec(QCursor.pos()) == act_add:
                         self._add_hold_to_block(hold)
                 else:
+                    act_regen = menu.addAction("↻ Régénérer ce bloc")
                     act_gen = menu.addAction("Générer une séance")
-                    if menu.exec(QCursor.pos()) == act_gen and self._on_generate:
+                    action = menu.exec(QCursor.pos())
+                    if action == act_regen:
+                        self._on_regenerate_block()
+                    elif action == act_gen and self._on_generate:
                         self._on_generate_clicked()
         else:
             act_gen = menu.addAction("Générer une séance")
             if menu.exec(QCursor.pos()) == act_gen and self._on_generate:
                 self._on_generate_clicked()
 
+    @profiled
     def _refresh(self) -> None:
         if not self._session or not self._session.blocks:
             self._generate_panel.setVisible(True)
@@ -520,16 +619,20 @@ class SessionWidget(QWidget):
         self._toolbar.setVisible(True)
 
         block = self._session.blocks[self._block_index]
-        total = len(self._session.blocks)
+        total = "∞" if self._stream is not None else len(self._session.blocks)
         best = get_best_time(block)
         best_str = f" — Meilleur : {best:.0f} s" if best is not None else ""
         self._block_label.setText(f"Bloc {self._block_index + 1} / {total}{best_str}")
         block_order = {h.id: i + 1 for i, h in enumerate(block.holds)}
-        self._pan.set_highlight({h.id for h in block.holds}, block_hold_order=block_order)
+        self._pan.set_highlight(
+            self._catalog.hold_index().hold_set(block_order), block_hold_order=block_order
+        )
         self._comment_edit.setEnabled(True)
         self._comment_edit.setText(block.comment or "")
         self._prev_btn.setEnabled(bool(self._block_history))
-        self._next_btn.setEnabled(self._block_index < len(self._session.blocks) - 1)
+        self._next_btn.setEnabled(
+            self._stream is not None or self._block_index < len(self._session.blocks) - 1
+        )
         self._success_btn.setEnabled(True)
         self._fail_btn.setEnabled(True)
 
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Dialogue « Blocs similaires » (favoris + historique, index MinHash/LSH)."""
+from __future__ import annotations
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QLabel,
+    QListWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from brlok.models import Block
+from brlok.storage.similarity_index import SOURCE_FAVORITE, SimilarBlock, find_similar_blocks
+
+SIMILAR_BLOCKS_COUNT = 8
+
+
+def format_similar_block(result: SimilarBlock) -> str:
+    """Ligne d'affichage : score, provenance, séquence de prises."""
+    if result.source == SOURCE_FAVORITE:
+        origin = f"Favori « {result.block.title} »" if result.block.title else "Favori"
+    else:
+        date = result.date.strftime("%Y-%m-%d") if result.date else "?"
+        num = (result.block_index or 0) + 1
+        origin = f"Historique {date} — bloc {num}"
+    sequence = " → ".join(h.id for h in result.block.holds)
+    return f"{result.score:.0%}  {origin} : {sequence}"
+
+
+def show_similar_blocks(
+    parent: QWidget,
+    block: Block,
+    *,
+    catalog_id: str | None = None,
+    exclude_identical: bool = False,
+) -> None:
+    """Affiche les blocs passés les plus proches de ``block``."""
+    results = find_similar_blocks(
+        block,
+        SIMILAR_BLOCKS_COUNT,
+        catalog_id=catalog_id,
+        exclude_identical=exclude_identical,
+    )
+    dlg = QDialog(parent.window() or parent)
+    dlg.setWindowTitle("Blocs similaires")
+    dlg.setMinimumWidth(480)
+    layout = QVBoxLayout(dlg)
+    layout.addWidget(QLabel(" → ".join(h.id for h in block.holds)))
+    if results:
+        lst = QListWidget()
+        lst.addItems([format_similar_block(r) for r in results])
+        layout.addWidget(lst)
+    else:
+        layout.addWidget(QLabel("Aucun bloc similaire dans les favoris ou l'historique."))
+    btns = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+    btns.rejected.connect(dlg.reject)
+    layout.addWidget(btns)
+    dlg.exec()
@@ -7,6 +7,8 @@ from typing import Literal
 
 from PySide6.QtCore import QSettings
 
+from brlok.gui.colors import rebuild_cell_styles
+
 ThemeName = Literal["light", "dark"]
 
 _SETTINGS_ORG = "brlok"
@@ -106,7 +108,9 @@ class ThemeManager:
     def __init__(self) -> None:
         self._current: ThemeName = "light"
         self._palette: ThemePalette = LIGHT_PALETTE
+        self._stylesheet: str | None = None
         self._load()
+        rebuild_cell_styles(self._current)
 
     def _load(self) -> None:
         """Charge le thème depuis QSettings."""
@@ -130,14 +134,18 @@ class ThemeManager:
         return self._palette
 
     def set_theme(self, name: ThemeName) -> None:
-        """Définit le thème et persiste."""
+        """Définit le thème, invalide les styles mémorisés et persiste."""
         self._current = name
         self._palette = LIGHT_PALETTE if name == "light" else DARK_PALETTE
+        self._stylesheet = None
+        rebuild_cell_styles(name)
         self._save()
 
     def get_stylesheet(self) -> str:
-        """Retourne le stylesheet pour l'application."""
-        return _build_stylesheet(self._palette)
+        """Retourne le stylesheet pour l'application (construit une fois par thème)."""
+        if self._stylesheet is None:
+            self._stylesheet = _build_stylesheet(self._palette)
+        return self._stylesheet
 
 
 _themed_instance: ThemeManager | None = None
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-"""Widget Timer 40/20, pyramides et EMOM (8.3)."""
+"""Widget Timer 40/20, pyramides, EMOM, Tabata et échelles (8.3)."""
 from __future__ import annotations
 
-from PySide6.QtCore import QTimer, Qt, QUrl, Signal
+import math
+
+from PySide6.QtCore import QTimer, Qt, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QFrame,
@@ -15,15 +17,28 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from brlok.gui.audio_cues import AudioCueBank
+from brlok.timer import IntervalEngine, Schedule, TimerState, build_schedule
+from brlok.timer import schedule as sched
+from brlok.timer.cues import CUE_LOOKAHEAD_S, CueTrack
+
+# Rafraîchissement de l'affichage (ms) ; le temps vient du moteur, pas des ticks
+REFRESH_MS = 200
+# Signal manqué de plus de CUE_LATE_S (UI bloquée) : ignoré plutôt que joué en retard
+CUE_LATE_S = 0.25
+
 
 class IntervalTimerWidget(QWidget):
-    """Timer : 40/20, pyramides ou EMOM. Lisible à 2 m (NFR4)."""
+    """Timer : 40/20, pyramides, EMOM, Tabata ou échelle. Lisible à 2 m (NFR4)."""
 
     finished = Signal(float)  # temps total en secondes lorsque terminé
+    phase_changed = Signal(str)  # "work" | "rest" | "countup" ; "" à l'arrêt
 
-    MODE_40_20 = "40/20"
-    MODE_PYRAMIDE = "pyramide"
-    MODE_EMOM = "emom"
+    MODE_40_20 = sched.MODE_40_20
+    MODE_PYRAMIDE = sched.MODE_PYRAMIDE
+    MODE_EMOM = sched.MODE_EMOM
+    MODE_TABATA = sched.MODE_TABATA
+    MODE_ECHELLE = sched.MODE_ECHELLE
 
     CHRONO_COUNTDOWN = "countdown"
     CHRONO_COUNTUP = "countup"
@@ -50,11 +65,20 @@ class IntervalTimerWidget(QWidget):
         self._mode = self.MODE_40_20
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._tick)
+        self._engine = IntervalEngine()
+        self._interval_index = -1
         self._remaining_s = 0
         self._phase: str = ""  # "work" | "rest"
         self._current_round = 0
         self._total_elapsed_s = 0.0
-        self._sound_effect = None
+        self._cue_bank = AudioCueBank(self)
+        self._cue_track: CueTrack | None = None
+        # Minuteur unique, réarmé sur le prochain signal du CueTrack
+        self._cue_timer = QTimer(self)
+        self._cue_timer.setSingleShot(True)
+        self._cue_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._cue_timer.timeout.connect(self._on_cue_due)
+        self._armed_cues: list[str] = []
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -63,7 +87,7 @@ class IntervalTimerWidget(QWidget):
         self._config_container = QWidget()
         config_inner = QVBoxLayout(self._config_container)
         self._mode_combo = QComboBox()
-        self._mode_combo.addItems([self.MODE_40_20, "Pyramide", "EMOM"])
+        self._mode_combo.addItems([self.MODE_40_20, "Pyramide", "EMOM", "Tabata", "Échelle"])
         self._mode_combo.currentTextChanged.connect(self._on_mode_changed)
         self._work_spin = QSpinBox()
         self._work_spin.setRange(5, 300)
@@ -180,39 +204,36 @@ class IntervalTimerWidget(QWidget):
             return self.MODE_PYRAMIDE
         if text == "EMOM":
             return self.MODE_EMOM
+        if text == "Tabata":
+            return self.MODE_TABATA
+        if text == "Échelle":
+            return self.MODE_ECHELLE
         return self.MODE_40_20
 
     def _on_mode_changed(self, text: str) -> None:
         mode = self._get_mode()
         self._pyramide_widget.setVisible(mode == self.MODE_PYRAMIDE)
+        self._work_spin.setEnabled(mode != self.MODE_TABATA)
         if mode == self.MODE_EMOM:
             self._rest_spin.setValue(max(5, 60 - self._work_spin.value()))
             self._rest_spin.setEnabled(False)
+        elif mode == self.MODE_TABATA:
+            self._work_spin.setValue(sched.TABATA_WORK_S)
+            self._rest_spin.setValue(sched.TABATA_REST_S)
+            self._rest_spin.setEnabled(False)
         else:
             self._rest_spin.setEnabled(True)
 
-    def _get_work_rest_for_round(self, round_index: int) -> tuple[int, int]:
-        """Retourne (work_s, rest_s) pour le round donné (1-based)."""
-        mode = self._get_mode()
-        rounds = self._rounds_spin.value()
-        work_base = self._work_spin.value()
-        rest_base = self._rest_spin.value()
-        if mode == self.MODE_40_20:
-            return (work_base, rest_base)
-        if mode == self.MODE_EMOM:
-            work = min(work_base, 55)
-            rest = 60 - work
-            return (work, rest)
-        if mode == self.MODE_PYRAMIDE:
-            wmin = self._work_min_spin.value()
-            wmax = self._work_max_spin.value()
-            if rounds <= 1:
-                return (wmax, wmax // 2)
-            progress = (round_index - 1) / (rounds - 1)
-            work = int(wmin + (wmax - wmin) * progress)
-            rest = work // 2
-            return (max(5, work), max(5, rest))
-        return (work_base, rest_base)
+    def _build_schedule(self) -> Schedule:
+        """Programme compilé du mode et des valeurs lues au démarrage."""
+        return build_schedule(
+            self._get_mode(),
+            work_s=self._work_s,
+            rest_s=self._rest_s,
+            rounds=self._rounds,
+            work_min=self._work_min,
+            work_max=self._work_max,
+        )
 
     def set_params(
         self,
@@ -258,98 +279,116 @@ class IntervalTimerWidget(QWidget):
         if self._chrono_mode == self.CHRONO_COUNTUP:
             self._start_btn.setEnabled(False)
             self._stop_btn.setEnabled(True)
-            self._current_round = 0
-            self._total_elapsed_s = 0.0
-            self._phase = "countup"
-            self._remaining_s = 0
+            self._engine = IntervalEngine()
+            self._cue_track = None
         else:
-            self._mode_combo.setEnabled(False)
-            self._work_spin.setEnabled(False)
-            self._rest_spin.setEnabled(False)
-            self._rounds_spin.setEnabled(False)
-            self._work_min_spin.setEnabled(False)
-            self._work_max_spin.setEnabled(False)
+            self._set_config_enabled(False)
             self._start_btn.setEnabled(False)
             self._stop_btn.setEnabled(True)
-            self._current_round = 1
-            self._total_elapsed_s = 0.0
-            work, rest = self._get_work_rest_for_round(1)
-            self._remaining_s = work
-            self._phase = "work"
+            schedule = self._build_schedule()
+            self._engine = IntervalEngine(schedule)
+            self._cue_track = CueTrack(schedule)
+        self._engine.start()
+        st = self._apply_state()
+        self._interval_index = st.interval
+        self._schedule_cues(0.0)
+        self.phase_changed.emit(st.phase)
         self._update_display()
-        self._timer.start(1000)
+        self._timer.start(REFRESH_MS)
+
+    def _set_config_enabled(self, enabled: bool) -> None:
+        self._mode_combo.setEnabled(enabled)
+        self._work_spin.setEnabled(enabled)
+        self._rest_spin.setEnabled(enabled)
+        self._rounds_spin.setEnabled(enabled)
+        self._work_min_spin.setEnabled(enabled)
+        self._work_max_spin.setEnabled(enabled)
+
+    def preload_cues(self) -> None:
+        """Charge les signaux sonores (à l'ouverture de l'onglet Séance)."""
+        self._cue_bank.preload()
+
+    def _schedule_cues(self, elapsed: float) -> None:
+        """Arme le minuteur sur le prochain signal s'il tombe dans les CUE_LOOKAHEAD_S secondes."""
+        track = self._cue_track
+        if track is None or self._cue_timer.isActive():
+            return
+        nxt = track.peek()
+        while nxt is not None and nxt[0] < elapsed - CUE_LATE_S:
+            track.take_until(nxt[0])
+            nxt = track.peek()
+        if nxt is None or nxt[0] > elapsed + CUE_LOOKAHEAD_S:
+            return
+        # Signaux du même instant joués ensemble, même si la séance se termine entre-temps
+        self._armed_cues = [cue for _, cue in track.take_until(nxt[0])]
+        self._cue_timer.start(max(0, round((nxt[0] - elapsed) * 1000)))
+
+    def _on_cue_due(self) -> None:
+        cues, self._armed_cues = self._armed_cues, []
+        for cue in cues:
+            self._cue_bank.play(cue)
+        if self._cue_track is not None:
+            self._schedule_cues(self._engine.state().elapsed_s)
+
+    def _cancel_cues(self) -> None:
+        self._cue_timer.stop()
+        self._armed_cues = []
+        self._cue_track = None
 
     def _on_stop(self) -> None:
         self._timer.stop()
+        self._engine.stop()
+        self._cancel_cues()
         if self._chrono_mode != self.CHRONO_COUNTUP:
-            self._mode_combo.setEnabled(True)
-            self._work_spin.setEnabled(True)
-            self._rest_spin.setEnabled(True)
-            self._rounds_spin.setEnabled(True)
-            self._work_min_spin.setEnabled(True)
-            self._work_max_spin.setEnabled(True)
+            self._set_config_enabled(True)
         self._start_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         self._phase = ""
+        self._on_mode_changed(self._mode_combo.currentText())
         self._update_display()
+        self.phase_changed.emit("")
 
-    def _tick(self) -> None:
-        self._total_elapsed_s += 1
+    def _apply_state(self) -> TimerState:
+        """Copie l'état courant du moteur dans les champs affichés."""
+        st = self._engine.state()
+        self._total_elapsed_s = st.elapsed_s
+        self._phase = st.phase
+        self._current_round = st.round
         if self._chrono_mode == self.CHRONO_COUNTUP:
-            self._remaining_s = int(self._total_elapsed_s)
+            self._remaining_s = int(st.elapsed_s)
         else:
-            self._remaining_s -= 1
-            if self._remaining_s <= 0:
-                self._on_interval_end()
-        self._update_display()
+            self._remaining_s = math.ceil(st.remaining_s)
+        return st
 
-    def _on_interval_end(self) -> None:
-        if self._phase == "work":
-            work, rest = self._get_work_rest_for_round(self._current_round)
-            self._remaining_s = rest
-            self._phase = "rest"
-            self._play_signal()
-        elif self._phase == "rest":
-            self._current_round += 1
-            if self._current_round > self._rounds:
-                self._timer.stop()
-                self._mode_combo.setEnabled(True)
-                self._work_spin.setEnabled(True)
-                self._rest_spin.setEnabled(True)
-                self._rounds_spin.setEnabled(True)
-                self._work_min_spin.setEnabled(True)
-                self._work_max_spin.setEnabled(True)
-                self._start_btn.setEnabled(True)
-                self._stop_btn.setEnabled(False)
-                self._phase = ""
-                self._play_signal()
-                self.finished.emit(self._total_elapsed_s)
-                return
-            work, rest = self._get_work_rest_for_round(self._current_round)
-            self._remaining_s = work
-            self._phase = "work"
-            self._play_signal()
-        self._update_display()
+    def _tick(self) -> None:
+        shown = (self._phase, self._current_round, self._remaining_s)
+        st = self._apply_state()
+        self._schedule_cues(st.elapsed_s)
+        if st.finished:
+            self._on_finished()
+            return
+        changed = st.interval != self._interval_index
+        self._interval_index = st.interval
+        if changed:
+            self._flash_display()
+            self.phase_changed.emit(st.phase)
+        if changed or (self._phase, self._current_round, self._remaining_s) != shown:
+            self._update_display()
 
-    def _play_signal(self) -> None:
-        """Signal sonore + visuel à la fin d'un intervalle."""
-        self._play_beep()
+    def _on_finished(self) -> None:
+        self._timer.stop()
+        total = self._engine.total_s or 0.0
+        self._engine.stop()
+        self._set_config_enabled(True)
+        self._on_mode_changed(self._mode_combo.currentText())
+        self._start_btn.setEnabled(True)
+        self._stop_btn.setEnabled(False)
+        self._phase = ""
+        self._cue_track = None
         self._flash_display()
-
-    def _play_beep(self) -> None:
-        """Joue un bip sonore (QSoundEffect ou fallback système)."""
-        try:
-            from PySide6.QtMultimedia import QSoundEffect
-            if self._sound_effect is None:
-                self._sound_effect = QSoundEffect()
-                self._sound_effect.setVolume(0.4)
-                wav_path = _get_beep_path()
-                if wav_path:
-                    self._sound_effect.setSource(QUrl.fromLocalFile(wav_path))
-            if self._sound_effect and self._sound_effect.source().isValid():
-                self._sound_effect.play()
-        except Exception:
-            pass
+        self._update_display()
+        self.phase_changed.emit("")
+        self.finished.emit(total)
 
     def _flash_display(self) -> None:
         """Flash visuel à la fin d'un intervalle."""
@@ -392,33 +431,3 @@ class IntervalTimerWidget(QWidget):
             self._time_label.setStyleSheet(
                 f"font-size: {time_fs}pt; font-weight: bold; color: #eee;"
             )
-
-
-def _get_beep_path() -> str | None:
-    """Retourne le chemin du fichier beep.wav (généré si absent)."""
-    import math
-    import struct
-    import wave
-    try:
-        from brlok.config.paths import get_data_dir
-        cache_dir = get_data_dir() / "sounds"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        beep_path = cache_dir / "beep.wav"
-        if not beep_path.exists():
-            rate, duration, freq = 22050, 0.1, 880
-            n = int(rate * duration)
-            with wave.open(str(beep_path), "wb") as w:
-                w.setnchannels(1)
-                w.setsampwidth(2)
-                w.setframerate(rate)
-                frames = b"".join(
-                    struct.pack(
-                        "<h",
-                        int(32767 * 0.3 * math.sin(2 * math.pi * freq * i / rate)),
-                    )
-                    for i in range(n)
-                )
-                w.writeframes(frames)
-        return str(beep_path)
-    except Exception:
-        return None
\ No newline at end of file
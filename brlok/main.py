@@ -11,8 +11,30 @@ def _has_cli_args() -> bool:
     return len(sys.argv) > _ARGS_BEFORE_USER
 
 
+def _take_profile_args() -> None:
+    """Retire --profile / --profile-trace FICHIER en tête des arguments et active la mesure.
+
+    ``python -m brlok --profile`` lance ainsi la GUI instrumentée.
+    """
+    args = sys.argv[_ARGS_BEFORE_USER:]
+    enabled = False
+    trace: str | None = None
+    while args:
+        if args[0] == "--profile":
+            enabled, args = True, args[1:]
+        elif args[0] == "--profile-trace" and len(args) > 1:
+            enabled, trace, args = True, args[1], args[2:]
+        else:
+            break
+    if enabled:
+        from brlok import profiling
+        profiling.enable(trace_path=trace)
+        sys.argv[_ARGS_BEFORE_USER:] = args
+
+
 def main() -> None:
     """Détecte le mode : sans args → GUI ; avec args → CLI."""
+    _take_profile_args()
     if _has_cli_args():
         _run_cli()
     else:
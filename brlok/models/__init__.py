@@ -4,8 +4,12 @@ from brlok.models.block import Block
 from brlok.models.catalog import Catalog, DEFAULT_GRID, GridDimensions, get_default_grid
 from brlok.models.catalog_collection import CatalogCollection, CatalogEntry
 from brlok.models.hold import Hold, Position
+from brlok.models.hold_index import HoldIndex
+from brlok.models.hold_set import HoldSet
+from brlok.models.reach import ReachMatrix
 from brlok.models.session import Session, SessionConstraints
 from brlok.models.session_history import CompletedSession
+from brlok.models.session_timings import SessionTimings
 
 __all__ = [
     "Block",
@@ -15,8 +19,12 @@ __all__ = [
     "CatalogEntry",
     "GridDimensions",
     "Hold",
+    "HoldIndex",
+    "HoldSet",
     "Position",
+    "ReachMatrix",
     "Session",
     "SessionConstraints",
+    "SessionTimings",
     "CompletedSession",
 ]
@@ -2,12 +2,16 @@
 """Modèle Catalog - catalogue des prises et structure du pan."""
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
-from brlok.models.hold import Hold
+from brlok.models.hold import Hold, hold_edit_count
+from brlok.models.hold_index import HoldIndex
+from brlok.models.reach import ReachMatrix
 
 # Grille fixe : TOUJOURS 6 colonnes × 7 lignes (A1..F7).
 # Source de vérité unique — ne jamais déduire rows/cols des données.
+# Exception opt-in : Catalog.free_grid=True (board 18×11, spray wall…) conserve
+# les dimensions déclarées par le catalogue.
 
 # Grille pieds : 4 lignes × 6 colonnes (positions prises de pied)
 FOOT_GRID_ROWS = 4
@@ -100,6 +104,15 @@ class Catalog(BaseModel):
         default_factory=_default_foot_levels,
         description="Niveaux difficulté pieds 4×6 (1-6)",
     )
+    free_grid: bool = Field(
+        default=False,
+        description="Grille libre (dimensions propres au catalogue, pas de normalisation 7×6)",
+    )
+
+    _hold_index: HoldIndex | None = PrivateAttr(default=None)
+    # (prises, lignes, colonnes, hold_edit_count) au moment de la construction de l'index
+    _hold_index_state: tuple | None = PrivateAttr(default=None)
+    _reach: ReachMatrix | None = PrivateAttr(default=None)
 
     @field_validator("foot_grid", mode="after")
     @classmethod
@@ -132,4 +145,31 @@ class Catalog(BaseModel):
                     f"Hold {hold.id!r}: col {hold.position.col} hors grille "
                     f"(0..{cols - 1})"
                 )
-        return self
\ No newline at end of file
+        return self
+
+    def hold_index(self) -> HoldIndex:
+        """Index spatial des prises (id, position, voisinage, niveaux).
+
+        Mis en cache sur l'instance ; reconstruit si ``holds`` ou ``grid`` a
+        été remplacé ou modifié en place (prise remplacée dans la liste,
+        ``hold.level = …``, position ou état actif changés). Seule la
+        modification en place de la liste ``hold.tags`` n'est pas détectée :
+        réaffecter ``hold.tags``. La vérification compare des identités
+        (tuple des prises, en C) : pas de parcours Python des prises.
+        """
+        state = (tuple(self.holds), self.grid.rows, self.grid.cols, hold_edit_count())
+        idx = self._hold_index
+        if idx is None or idx.holds is not self.holds or self._hold_index_state != state:
+            idx = HoldIndex(self.holds, self.grid.rows, self.grid.cols)
+            self._hold_index = idx
+            self._hold_index_state = state
+        return idx
+
+    def reach_matrix(self) -> ReachMatrix:
+        """Distances main-main / main-pied, mises en cache avec l'index des prises."""
+        idx = self.hold_index()
+        reach = self._reach
+        if reach is None or reach.index is not idx:
+            reach = ReachMatrix(idx)
+            self._reach = reach
+        return reach
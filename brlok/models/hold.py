@@ -6,15 +6,34 @@ from typing import Annotated
 
 from pydantic import BaseModel, Field, field_validator
 
+# Nombre de modifications en place d'une prise ou d'une position depuis le
+# lancement (``hold.level = 3``…) : les index mis en cache (Catalog.hold_index)
+# sont reconstruits quand il change.
+_edit_count = 0
 
-class Position(BaseModel):
+
+def hold_edit_count() -> int:
+    """Compteur des modifications en place de prises (toutes instances confondues)."""
+    return _edit_count
+
+
+class _EditTracked(BaseModel):
+    """Modèle dont chaque affectation d'attribut incrémente ``hold_edit_count``."""
+
+    def __setattr__(self, name: str, value: object) -> None:
+        global _edit_count
+        super().__setattr__(name, value)
+        _edit_count += 1
+
+
+class Position(_EditTracked):
     """Position sur la grille du pan (row, col)."""
 
     row: int = Field(..., ge=0, description="Index de ligne (0-based)")
     col: int = Field(..., ge=0, description="Index de colonne (0-based)")
 
 
-class Hold(BaseModel):
+class Hold(_EditTracked):
     """Prise du pan d'escalade."""
 
     id: str = Field(..., min_length=1, description="Identifiant (ex. A1, C7)")
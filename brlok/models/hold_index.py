@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Index spatial des prises d'un catalogue (grilles de grande taille, spray walls).
+
+Construit une fois par liste de prises (voir ``Catalog.hold_index``) :
+recherche par id ou par position en O(1), requêtes de voisinage par
+seaux (``BUCKET_SIZE`` × ``BUCKET_SIZE`` cases) et prises actives rangées
+par niveau, dans l'ordre du catalogue.
+"""
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from typing import Iterable, Iterator
+
+from brlok.models.hold import Hold
+from brlok.models.hold_set import HoldSet
+
+# Côté d'un seau de voisinage (en cases)
+BUCKET_SIZE = 4
+
+
+class HoldIndex:
+    """Index en lecture seule d'une liste de prises sur une grille rows × cols."""
+
+    __slots__ = (
+        "holds",
+        "rows",
+        "cols",
+        "_slot_by_id",
+        "_by_pos",
+        "_buckets",
+        "_active_by_level",
+        "_tag_profiles",
+    )
+
+    def __init__(self, holds: list[Hold], rows: int, cols: int) -> None:
+        self.holds = holds
+        self.rows = rows
+        self.cols = cols
+        self._slot_by_id: dict[str, int] = {}
+        self._by_pos: dict[tuple[int, int], Hold] = {}
+        self._buckets: dict[tuple[int, int], list[Hold]] = {}
+        # niveau → [(rang dans le catalogue, prise)] ; le rang conserve l'ordre d'origine
+        self._active_by_level: dict[int, list[tuple[int, Hold]]] = {}
+        # niveau → nombre de prises actives par combinaison de tags (comptages de faisabilité)
+        self._tag_profiles: dict[int, Counter[frozenset[str]]] = {}
+        for slot, hold in enumerate(holds):
+            r, c = hold.position.row, hold.position.col
+            self._slot_by_id[hold.id] = slot
+            self._by_pos[(r, c)] = hold
+            self._buckets.setdefault((r // BUCKET_SIZE, c // BUCKET_SIZE), []).append(hold)
+            if hold.active:
+                self._active_by_level.setdefault(hold.level, []).append((slot, hold))
+                self._tag_profiles.setdefault(hold.level, Counter())[frozenset(hold.tags)] += 1
+
+    def __len__(self) -> int:
+        return len(self.holds)
+
+    def __contains__(self, hold_id: object) -> bool:
+        return hold_id in self._slot_by_id
+
+    # --- Recherche -------------------------------------------------------
+
+    def get(self, hold_id: str) -> Hold | None:
+        """Prise d'id ``hold_id``, ou None."""
+        slot = self._slot_by_id.get(hold_id)
+        return self.holds[slot] if slot is not None else None
+
+    def bit(self, hold_id: str) -> int:
+        """Masque ``1 << rang`` de la prise (0 si absente) — voir HoldSet."""
+        slot = self._slot_by_id.get(hold_id)
+        return 1 << slot if slot is not None else 0
+
+    def hold_set(self, hold_ids: Iterable[str] = ()) -> HoldSet:
+        """HoldSet du catalogue indexé, initialisé avec ``hold_ids``."""
+        return HoldSet.from_ids(self, hold_ids)
+
+    def slot_of(self, hold_id: str) -> int:
+        """Rang de la prise dans ``catalog.holds`` ; -1 si absente."""
+        return self._slot_by_id.get(hold_id, -1)
+
+    def at(self, row: int, col: int) -> Hold | None:
+        """Prise à la position (row, col), ou None."""
+        return self._by_pos.get((row, col))
+
+    def is_occupied(self, row: int, col: int) -> bool:
+        """True si une prise occupe (row, col)."""
+        return (row, col) in self._by_pos
+
+    def positions(self) -> dict[tuple[int, int], Hold]:
+        """Vue position → prise (ne pas modifier)."""
+        return self._by_pos
+
+    def free_positions(self) -> Iterator[tuple[int, int]]:
+        """Positions libres de la grille (ordre ligne puis colonne)."""
+        occupied = self._by_pos
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if (r, c) not in occupied:
+                    yield (r, c)
+
+    # --- Voisinage -------------------------------------------------------
+
+    def neighbors(self, row: int, col: int, radius: int = 1) -> list[Hold]:
+        """Prises à distance de Chebyshev ≤ radius de (row, col), case centrale exclue.
+
+        Seuls les seaux recouvrant le carré de recherche sont parcourus.
+        """
+        r0, r1 = row - radius, row + radius
+        c0, c1 = col - radius, col + radius
+        found: list[Hold] = []
+        for br in range(max(0, r0) // BUCKET_SIZE, max(0, r1) // BUCKET_SIZE + 1):
+            for bc in range(max(0, c0) // BUCKET_SIZE, max(0, c1) // BUCKET_SIZE + 1):
+                for hold in self._buckets.get((br, bc), ()):
+                    hr, hc = hold.position.row, hold.position.col
+                    if r0 <= hr <= r1 and c0 <= hc <= c1 and (hr, hc) != (row, col):
+                        found.append(hold)
+        return found
+
+    # --- Niveaux ---------------------------------------------------------
+
+    def active_by_level(self, level: int) -> list[Hold]:
+        """Prises actives d'un niveau donné, dans l'ordre du catalogue."""
+        return [h for _, h in self._active_by_level.get(level, ())]
+
+    def active_in_levels(self, min_level: int, max_level: int) -> list[Hold]:
+        """Prises actives de niveau dans [min_level, max_level], dans l'ordre du catalogue.
+
+        Fusion des seaux par niveau : aucun parcours des prises hors plage.
+        """
+        buckets = [
+            self._active_by_level[lev]
+            for lev in range(min_level, max_level + 1)
+            if lev in self._active_by_level
+        ]
+        if len(buckets) == 1:
+            return [h for _, h in buckets[0]]
+        return [h for _, h in heapq.merge(*buckets, key=lambda item: item[0])]
+
+    def count_active(
+        self,
+        min_level: int,
+        max_level: int,
+        required_tags: Iterable[str] = (),
+        excluded_tags: Iterable[str] = (),
+    ) -> int:
+        """Nombre de prises actives de niveau dans [min_level, max_level] ayant au
+        moins un tag requis (si fournis) et aucun tag exclu.
+
+        Parcourt les combinaisons de tags distinctes par niveau, pas les prises.
+        """
+        req = frozenset(required_tags)
+        exc = frozenset(excluded_tags)
+        total = 0
+        for lev in range(min_level, max_level + 1):
+            for tags, count in self._tag_profiles.get(lev, {}).items():
+                if (not req or tags & req) and not tags & exc:
+                    total += count
+        return total
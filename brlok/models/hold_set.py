@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Ensembles de prises en bitset (int) indexés par catalogue.
+
+Chaque prise d'un catalogue reçoit un rang (son indice dans ``catalog.holds``,
+voir ``HoldIndex.bit``) ; un ``HoldSet`` est un entier dont le bit ``i`` vaut 1
+si la prise de rang ``i`` appartient à l'ensemble. Union, intersection,
+recouvrement et Jaccard se réduisent à une opération entière.
+
+Un HoldSet n'a de sens que pour le catalogue (liste de prises) qui l'a produit.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from brlok.models.hold import Hold
+    from brlok.models.hold_index import HoldIndex
+
+
+_HAS_BIT_COUNT = hasattr(int, "bit_count")  # Python ≥ 3.10
+
+
+def popcount(bits: int) -> int:
+    """Nombre de bits à 1."""
+    return bits.bit_count() if _HAS_BIT_COUNT else bin(bits).count("1")
+
+
+class HoldSet:
+    """Ensemble de prises d'un catalogue, stocké comme un bitset entier."""
+
+    __slots__ = ("_index", "bits")
+
+    def __init__(self, index: "HoldIndex", bits: int = 0) -> None:
+        self._index = index
+        self.bits = bits
+
+    @classmethod
+    def from_ids(cls, index: "HoldIndex", hold_ids: Iterable[str]) -> "HoldSet":
+        """Construit l'ensemble à partir d'IDs ; les IDs absents du catalogue sont ignorés."""
+        bit = index.bit
+        bits = 0
+        for hold_id in hold_ids:
+            bits |= bit(hold_id)
+        return cls(index, bits)
+
+    @classmethod
+    def from_holds(cls, index: "HoldIndex", holds: Iterable["Hold"]) -> "HoldSet":
+        """Construit l'ensemble à partir de prises (ex. ``block.holds``)."""
+        return cls.from_ids(index, (h.id for h in holds))
+
+    # --- Appartenance ----------------------------------------------------
+
+    def __contains__(self, hold_id: object) -> bool:
+        if not isinstance(hold_id, str):
+            return False
+        return bool(self.bits & self._index.bit(hold_id))
+
+    def __len__(self) -> int:
+        return popcount(self.bits)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __iter__(self) -> Iterator[str]:
+        """IDs des prises, dans l'ordre du catalogue."""
+        holds = self._index.holds
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield holds[low.bit_length() - 1].id
+            bits ^= low
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HoldSet):
+            return self.bits == other.bits
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return f"HoldSet({list(self)!r})"
+
+    # --- Modification (en place) -----------------------------------------
+
+    def add(self, hold_id: str) -> None:
+        """Ajoute une prise (ignorée si absente du catalogue)."""
+        self.bits |= self._index.bit(hold_id)
+
+    def discard(self, hold_id: str) -> None:
+        """Retire une prise si présente."""
+        self.bits &= ~self._index.bit(hold_id)
+
+    # --- Opérations ensemblistes -----------------------------------------
+    # Les deux opérandes doivent venir du même HoldIndex : les rangs d'un
+    # autre catalogue désignent d'autres prises.
+
+    def _same_index(self, other: "HoldSet") -> int:
+        """Bits de ``other`` ; ValueError s'il vient d'un autre HoldIndex."""
+        if other._index is not self._index:
+            raise ValueError("HoldSet d'un autre catalogue (HoldIndex différent)")
+        return other.bits
+
+    def __or__(self, other: "HoldSet") -> "HoldSet":
+        return HoldSet(self._index, self.bits | self._same_index(other))
+
+    def __and__(self, other: "HoldSet") -> "HoldSet":
+        return HoldSet(self._index, self.bits & self._same_index(other))
+
+    def __sub__(self, other: "HoldSet") -> "HoldSet":
+        return HoldSet(self._index, self.bits & ~self._same_index(other))
+
+    def __xor__(self, other: "HoldSet") -> "HoldSet":
+        return HoldSet(self._index, self.bits ^ self._same_index(other))
+
+    def isdisjoint(self, other: "HoldSet") -> bool:
+        return not self.bits & self._same_index(other)
+
+    def overlap(self, other: "HoldSet") -> int:
+        """Nombre de prises communes."""
+        return popcount(self.bits & self._same_index(other))
+
+    def jaccard(self, other: "HoldSet") -> float:
+        """Similarité de Jaccard |A ∩ B| / |A ∪ B| (1.0 si les deux sont vides)."""
+        union = self.bits | self._same_index(other)
+        if not union:
+            return 1.0
+        return popcount(self.bits & other.bits) / popcount(union)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Distances et atteignabilité entre prises (mains et pieds) d'un catalogue.
+
+Unité : la case de la grille. Les prises de main sont en (row, col) ; la
+grille pieds (4 × 6) est placée sous le pan, la ligne pieds ``r`` à la
+hauteur ``grid.rows + r`` (même disposition que PanWidget).
+
+Les lignes de la matrice (distances d'une prise à toutes les autres) sont
+calculées à la première demande puis conservées ; les masques
+d'atteignabilité sont des bitsets au format HoldSet (bit = rang de la prise
+dans le catalogue), de sorte que le générateur filtre les candidates par un
+simple ET binaire.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+
+from brlok.models.hold_index import HoldIndex
+
+
+class ReachMatrix:
+    """Matrice de distances main-main et main-pied, calculée paresseusement par ligne."""
+
+    __slots__ = ("index", "foot_origin", "_rows", "_masks", "_xs", "_ys")
+
+    def __init__(self, index: HoldIndex) -> None:
+        self.index = index
+        # Hauteur (en cases) de la ligne 0 de la grille pieds
+        self.foot_origin = index.rows
+        self._xs = array("d", (h.position.col for h in index.holds))
+        self._ys = array("d", (h.position.row for h in index.holds))
+        self._rows: dict[int, array] = {}
+        self._masks: dict[tuple[int, float | None, float | None], int] = {}
+
+    def distances_from(self, slot: int) -> array:
+        """Distances (euclidiennes) de la prise de rang ``slot`` à chaque prise."""
+        row = self._rows.get(slot)
+        if row is None:
+            x0, y0 = self._xs[slot], self._ys[slot]
+            row = array("d", map(math.hypot, (x - x0 for x in self._xs), (y - y0 for y in self._ys)))
+            self._rows[slot] = row
+        return row
+
+    def distance(self, hold_a: str, hold_b: str) -> float:
+        """Distance entre deux prises de main (inf si l'une est absente)."""
+        a, b = self.index.slot_of(hold_a), self.index.slot_of(hold_b)
+        if a < 0 or b < 0:
+            return math.inf
+        return self.distances_from(a)[b]
+
+    def foot_distance(self, hold_id: str, foot: tuple[int, int]) -> float:
+        """Distance entre une prise de main et une position de la grille pieds (r, c)."""
+        slot = self.index.slot_of(hold_id)
+        if slot < 0:
+            return math.inf
+        return math.hypot(foot[1] - self._xs[slot], self.foot_origin + foot[0] - self._ys[slot])
+
+    def reach_mask(self, slot: int, min_reach: float | None, max_reach: float | None) -> int:
+        """Bitset des prises à distance dans [min_reach, max_reach] de ``slot`` (elle-même exclue)."""
+        key = (slot, min_reach, max_reach)
+        mask = self._masks.get(key)
+        if mask is None:
+            lo = min_reach if min_reach is not None else 0.0
+            hi = max_reach if max_reach is not None else math.inf
+            mask = 0
+            for other, dist in enumerate(self.distances_from(slot)):
+                if other != slot and lo <= dist <= hi:
+                    mask |= 1 << other
+            self._masks[key] = mask
+        return mask
+
+    def feet_within(self, hold_id: str, feet: list[tuple[int, int]], max_reach: float) -> list[tuple[int, int]]:
+        """Positions pieds de ``feet`` à distance ≤ max_reach de la prise (ordre conservé)."""
+        return [f for f in feet if self.foot_distance(hold_id, f) <= max_reach]
@@ -7,6 +7,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from brlok.models.session import Session
+from brlok.models.session_timings import SessionTimings
 
 
 class CompletedSession(BaseModel):
@@ -22,3 +23,11 @@ class CompletedSession(BaseModel):
         default_factory=dict,
         description="Statut par index de bloc (success, fail)",
     )
+    catalog_id: str | None = Field(
+        default=None,
+        description="Catalogue sur lequel la séance a été grimpée (None : entrées antérieures)",
+    )
+    timings: SessionTimings | None = Field(
+        default=None,
+        description="Chronologie compacte par bloc et par round (début, fin, pauses, statuts)",
+    )
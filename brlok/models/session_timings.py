@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Modèle SessionTimings - chronologie compacte d'une séance (par bloc et par round).
+
+Les événements sont stockés en colonnes : ``kinds`` (un caractère par
+événement), ``deltas`` (temps écoulé depuis l'événement précédent, en
+dixièmes de seconde) et ``blocks`` (index du bloc de chaque début de bloc).
+Les colonnes numériques sont des entiers varint encodés en base64 : un
+événement coûte 2 à 3 octets, soit quelques dizaines d'octets par bloc dans
+``sessions_history.json``.
+"""
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from pydantic import BaseModel, Field
+
+# Résolution des deltas (s)
+TIMING_UNIT_S = 0.1
+
+EVENT_BLOCK_START = "B"
+EVENT_BLOCK_END = "E"
+EVENT_WORK = "W"
+EVENT_REST = "R"
+EVENT_PAUSE = "P"
+EVENT_RESUME = "U"
+EVENT_TIMER_STOP = "X"
+EVENT_SUCCESS = "S"
+EVENT_FAIL = "F"
+
+STATUS_EVENTS = {"success": EVENT_SUCCESS, "fail": EVENT_FAIL}
+
+
+@dataclass(frozen=True)
+class TimingEvent:
+    """Événement décodé : type, instant depuis le début (s), bloc concerné."""
+
+    kind: str
+    t_s: float
+    block: int
+
+
+def encode_varints(values: Iterable[int]) -> str:
+    """Entiers positifs → varints (7 bits par octet) en base64."""
+    out = bytearray()
+    for v in values:
+        while v >= 0x80:
+            out.append((v & 0x7F) | 0x80)
+            v >>= 7
+        out.append(v)
+    return base64.b64encode(bytes(out)).decode("ascii")
+
+
+def decode_varints(data: str) -> list[int]:
+    """Inverse de ``encode_varints``."""
+    values: list[int] = []
+    value = shift = 0
+    for byte in base64.b64decode(data):
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+class SessionTimings(BaseModel):
+    """Chronologie d'une séance en colonnes (voir docstring du module)."""
+
+    started_at: datetime = Field(..., description="Début de la séance")
+    kinds: str = Field(default="", description="Type de chaque événement (EVENT_*)")
+    deltas: str = Field(default="", description="Deltas en dixièmes de seconde (varints base64)")
+    blocks: str = Field(default="", description="Index de bloc des débuts de bloc (varints base64)")
+
+    @classmethod
+    def from_events(
+        cls, started_at: datetime, events: Iterable[tuple[str, float, int]]
+    ) -> "SessionTimings":
+        """Encode des événements (type, instant en s depuis le début, bloc)."""
+        kinds: list[str] = []
+        deltas: list[int] = []
+        blocks: list[int] = []
+        prev_units = 0
+        for kind, t_s, block in events:
+            units = max(prev_units, round(t_s / TIMING_UNIT_S))
+            kinds.append(kind)
+            deltas.append(units - prev_units)
+            prev_units = units
+            if kind == EVENT_BLOCK_START:
+                blocks.append(block)
+        return cls(
+            started_at=started_at,
+            kinds="".join(kinds),
+            deltas=encode_varints(deltas),
+            blocks=encode_varints(blocks),
+        )
+
+    def events(self) -> list[TimingEvent]:
+        """Événements décodés, dans l'ordre."""
+        block_iter = iter(decode_varints(self.blocks))
+        units = 0
+        block = 0
+        result = []
+        for kind, delta in zip(self.kinds, decode_varints(self.deltas)):
+            units += delta
+            if kind == EVENT_BLOCK_START:
+                block = next(block_iter, block)
+            result.append(TimingEvent(kind, units * TIMING_UNIT_S, block))
+        return result
+
+    def block_durations(self) -> dict[int, float]:
+        """Temps passé sur chaque bloc (s), pauses entre blocs exclues, cumulé si revisité."""
+        durations: dict[int, float] = {}
+        open_at: float | None = None
+        paused_at: float | None = None
+        block = 0
+        for ev in self.events():
+            if ev.kind == EVENT_BLOCK_START:
+                open_at, block = ev.t_s, ev.block
+            elif ev.kind == EVENT_PAUSE and open_at is not None:
+                paused_at = ev.t_s
+            elif ev.kind == EVENT_RESUME and open_at is not None and paused_at is not None:
+                open_at += ev.t_s - paused_at
+                paused_at = None
+            elif ev.kind == EVENT_BLOCK_END and open_at is not None:
+                end = paused_at if paused_at is not None else ev.t_s
+                durations[block] = durations.get(block, 0.0) + end - open_at
+                open_at = paused_at = None
+        return durations
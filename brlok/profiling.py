@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""Instrumentation légère : spans, compteurs et histogrammes.
+
+Désactivée par défaut : ``span`` retourne un contexte vide partagé et une
+fonction décorée par ``profiled`` est appelée directement (coût : un test).
+Activée (``BRLOK_PROFILE=1``, ``brlok --profile``), chaque span ajoute sa
+durée à l'histogramme de son nom et, si une trace est demandée, un événement
+au format Chrome trace (chrome://tracing, Perfetto). À la sortie du
+programme, un tableau récapitulatif est écrit sur stderr et la trace dans le
+fichier demandé.
+
+Variables d'environnement :
+    BRLOK_PROFILE=1             : active l'instrumentation ;
+    BRLOK_PROFILE_TRACE=f.json  : écrit aussi la trace Chrome dans f.json.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+ENV_PROFILE = "BRLOK_PROFILE"
+ENV_TRACE = "BRLOK_PROFILE_TRACE"
+
+# Événements de trace conservés au plus (au-delà : compteur profiling.dropped_events)
+MAX_TRACE_EVENTS = 200_000
+
+
+# Échantillons conservés au plus par histogramme (au-delà : un sur deux, puis un sur quatre…)
+MAX_HISTOGRAM_SAMPLES = 10_000
+
+
+class Histogram:
+    """Valeurs observées (secondes pour les spans).
+
+    Nombre, total et maximum sont exacts. Les percentiles sont calculés sur
+    au plus ``MAX_HISTOGRAM_SAMPLES`` échantillons : une fois la limite
+    atteinte, un échantillon sur deux est gardé et le pas d'échantillonnage
+    double, si bien que la mémoire reste bornée pendant une longue session
+    GUI (percentiles alors approchés, échantillons répartis sur toute la durée).
+    """
+
+    __slots__ = ("count", "total", "max", "samples", "_stride")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = array("d")
+        self._stride = 1
+
+    def observe(self, value: float) -> None:
+        if self.count % self._stride == 0:
+            self.samples.append(value)
+            if len(self.samples) > MAX_HISTOGRAM_SAMPLES:
+                self.samples = self.samples[::2]
+                self._stride *= 2
+        self.count += 1
+        self.total += value
+        if value > self.max or self.count == 1:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        """Percentile ``p`` (0-100), rang le plus proche ; 0 si vide."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+class _State:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.summary = True
+        self.trace_path: Path | None = None
+        self.exit_hooked = False
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+        # (nom, début, durée, thread) en secondes depuis origin
+        self.events: list[tuple[str, float, float, int]] = []
+
+
+_state = _State()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        _record(self.name, self.start, time.perf_counter())
+
+
+def is_enabled() -> bool:
+    """True si l'instrumentation est active."""
+    return _state.enabled
+
+
+def enable(*, trace_path: Path | str | None = None, summary: bool = True) -> None:
+    """Active l'instrumentation ; le rapport est écrit à la sortie du programme.
+
+    Args:
+        trace_path: Fichier de trace Chrome (JSON) à écrire, None pour aucun.
+        summary: Écrire le tableau récapitulatif sur stderr.
+    """
+    _state.enabled = True
+    _state.summary = summary
+    _state.trace_path = Path(trace_path) if trace_path else None
+    if not _state.exit_hooked:
+        atexit.register(_dump)
+        _state.exit_hooked = True
+
+
+def disable() -> None:
+    """Désactive l'instrumentation (les mesures déjà faites sont conservées)."""
+    _state.enabled = False
+
+
+def reset() -> None:
+    """Efface compteurs, histogrammes et événements."""
+    with _state.lock:
+        _state.counters.clear()
+        _state.histograms.clear()
+        _state.events.clear()
+        _state.origin = time.perf_counter()
+
+
+def span(name: str) -> _Span | _NullSpan:
+    """Contexte mesurant la durée du bloc sous ``name``."""
+    return _Span(name) if _state.enabled else _NULL_SPAN
+
+
+def profiled(name: str | F | None = None) -> Callable[[F], F] | F:
+    """Décorateur : chaque appel est un span (défaut : module.fonction sans ``brlok.``).
+
+    S'utilise avec ou sans argument : ``@profiled`` ou ``@profiled("nom")``.
+    """
+    def decorate(fn: F) -> F:
+        label = name if isinstance(name, str) else _default_name(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, start, time.perf_counter())
+        return wrapper  # type: ignore[return-value]
+
+    if callable(name):
+        return decorate(name)
+    return decorate
+
+
+def count(name: str, n: int = 1) -> None:
+    """Incrémente le compteur ``name``."""
+    if not _state.enabled:
+        return
+    with _state.lock:
+        _state.counters[name] = _state.counters.get(name, 0) + n
+
+
+def counters() -> dict[str, int]:
+    """Copie des compteurs."""
+    with _state.lock:
+        return dict(_state.counters)
+
+
+def histogram(name: str) -> Histogram | None:
+    """Histogramme ``name`` (None s'il n'a reçu aucune valeur)."""
+    return _state.histograms.get(name)
+
+
+def _default_name(fn: Callable) -> str:
+    module = fn.__module__.removeprefix("brlok.")
+    return f"{module}.{fn.__qualname__}"
+
+
+def _histogram(name: str) -> Histogram:
+    hist = _state.histograms.get(name)
+    if hist is None:
+        hist = _state.histograms[name] = Histogram()
+    return hist
+
+
+def _record(name: str, start: float, end: float) -> None:
+    with _state.lock:
+        _histogram(name).observe(end - start)
+        if _state.trace_path is not None:
+            if len(_state.events) < MAX_TRACE_EVENTS:
+                _state.events.append((name, start - _state.origin, end - start, threading.get_ident()))
+            else:
+                _state.counters["profiling.dropped_events"] = _state.counters.get("profiling.dropped_events", 0) + 1
+
+
+def summary_table() -> str:
+    """Tableau des spans (par temps total décroissant) puis des compteurs."""
+    with _state.lock:
+        hists = sorted(_state.histograms.items(), key=lambda item: item[1].total, reverse=True)
+        ctrs = sorted(_state.counters.items())
+    width = max([len(n) for n, _ in hists] + [len(n) for n, _ in ctrs] + [20])
+    lines = [
+        f"{'Span':<{width}} {'Appels':>8} {'Total ms':>11} {'Moy. ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'Max ms':>9}"
+    ]
+    for name, h in hists:
+        total = h.total
+        lines.append(
+            f"{name:<{width}} {h.count:>8} {total * 1e3:>11.2f} {total / h.count * 1e3:>9.3f} "
+            f"{h.percentile(50) * 1e3:>9.3f} {h.percentile(95) * 1e3:>9.3f} {h.max * 1e3:>9.3f}"
+        )
+    if ctrs:
+        lines.append("")
+        lines.append(f"{'Compteur':<{width}} {'Valeur':>8}")
+        lines.extend(f"{name:<{width}} {value:>8}" for name, value in ctrs)
+    return "\n".join(lines)
+
+
+def chrome_trace() -> dict:
+    """Trace au format Chrome (événements complets « X », durées en µs)."""
+    pid = os.getpid()
+    with _state.lock:
+        events = [
+            {"name": name, "cat": name.split(".", 1)[0], "ph": "X",
+             "ts": round(start * 1e6, 3), "dur": round(dur * 1e6, 3), "pid": pid, "tid": tid}
+            for name, start, dur, tid in _state.events
+        ]
+        ctrs = dict(_state.counters)
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"counters": ctrs}}
+
+
+def write_chrome_trace(path: Path) -> None:
+    """Écrit la trace Chrome dans ``path``."""
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(chrome_trace(), f)
+    except OSError as e:
+        logger.error("Impossible d'écrire la trace dans %s: %s", path, e)
+
+
+def _dump() -> None:
+    """Rapport de sortie (atexit)."""
+    if _state.summary and (_state.histograms or _state.counters):
+        print(summary_table(), file=sys.stderr)
+    if _state.trace_path is not None:
+        write_chrome_trace(_state.trace_path)
+        print(f"Trace écrite dans {_state.trace_path}", file=sys.stderr)
+
+
+def _enable_from_env() -> None:
+    if os.environ.get(ENV_PROFILE, "").strip() not in ("", "0"):
+        enable(trace_path=os.environ.get(ENV_TRACE) or None)
+
+
+_enable_from_env()
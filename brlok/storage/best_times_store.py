@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 
 from brlok.models import Block
+from brlok.profiling import profiled
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ def _block_key(block: Block) -> str:
     return hashlib.sha256(seq.encode()).hexdigest()[:16]
 
 
+@profiled
 def load_best_times() -> dict[str, dict]:
     """Charge les meilleurs temps. {block_key: {seconds, date}}."""
     path = _get_path()
@@ -38,6 +40,7 @@ def load_best_times() -> dict[str, dict]:
         return {}
 
 
+@profiled
 def save_best_times(best_times: dict[str, dict]) -> None:
     """Sauvegarde les meilleurs temps."""
     path = _get_path()
@@ -10,8 +10,10 @@ from pathlib import Path
 from pydantic import ValidationError
 
 from brlok.models import Catalog, CatalogCollection, CatalogEntry
-from brlok.models.catalog import _default_foot_levels
+from brlok.profiling import profiled, span
 from brlok.storage.catalog_ops import ensure_full_grid
+from brlok.storage.catalog_store import _normalize_catalog_to_fixed_grid
+from brlok.storage.hold_usage_store import clear_usage
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,7 @@ def _migrate_from_legacy() -> CatalogCollection:
     return CatalogCollection(catalogs=[entry], active_id="default")
 
 
+@profiled
 def load_collection() -> CatalogCollection:
     """Charge la collection de catalogues. Migration si nécessaire."""
     col_path = _get_collection_path()
@@ -49,25 +52,11 @@ def load_collection() -> CatalogCollection:
         try:
             with open(col_path, encoding="utf-8") as f:
                 data = json.load(f)
-            coll = CatalogCollection.model_validate(data)
-            # Normaliser chaque catalogue à la grille fixe (évite import circulaire)
-            def _norm(c: Catalog) -> Catalog:
-                from brlok.models import DEFAULT_GRID
-                if c.grid.rows == DEFAULT_GRID.rows and c.grid.cols == DEFAULT_GRID.cols:
-                    return c
-                rows, cols = DEFAULT_GRID.rows, DEFAULT_GRID.cols
-                kept = [h for h in c.holds if 0 <= h.position.row < rows and 0 <= h.position.col < cols]
-                for h in c.holds:
-                    if h not in kept:
-                        logger.warning("Prise %s hors grille fixe — ignorée", h.id)
-                return Catalog(
-                    holds=kept,
-                    grid=DEFAULT_GRID,
-                    foot_grid=c.foot_grid,
-                    foot_levels=getattr(c, "foot_levels", None) or _default_foot_levels(),
-                )
+            with span("validate.CatalogCollection"):
+                coll = CatalogCollection.model_validate(data)
+            # Normaliser chaque catalogue à la grille fixe (sauf grille libre)
             coll.catalogs = [
-                CatalogEntry(id=e.id, name=e.name, catalog=_norm(e.catalog))
+                CatalogEntry(id=e.id, name=e.name, catalog=_normalize_catalog_to_fixed_grid(e.catalog))
                 for e in coll.catalogs
             ]
             return coll
@@ -85,22 +74,11 @@ def load_collection() -> CatalogCollection:
         try:
             with open(_bundled_data, encoding="utf-8") as f:
                 data = json.load(f)
-            coll = CatalogCollection.model_validate(data)
-            # Normaliser à la grille fixe
-            def _norm(c: Catalog) -> Catalog:
-                from brlok.models import DEFAULT_GRID
-                if c.grid.rows == DEFAULT_GRID.rows and c.grid.cols == DEFAULT_GRID.cols:
-                    return c
-                rows, cols = DEFAULT_GRID.rows, DEFAULT_GRID.cols
-                kept = [h for h in c.holds if 0 <= h.position.row < rows and 0 <= h.position.col < cols]
-                return Catalog(
-                    holds=kept,
-                    grid=DEFAULT_GRID,
-                    foot_grid=c.foot_grid,
-                    foot_levels=getattr(c, "foot_levels", None) or _default_foot_levels(),
-                )
+            with span("validate.CatalogCollection"):
+                coll = CatalogCollection.model_validate(data)
+            # Normaliser à la grille fixe (sauf grille libre)
             coll.catalogs = [
-                CatalogEntry(id=e.id, name=e.name, catalog=_norm(e.catalog))
+                CatalogEntry(id=e.id, name=e.name, catalog=_normalize_catalog_to_fixed_grid(e.catalog))
                 for e in coll.catalogs
             ]
             save_collection(coll)
@@ -117,6 +95,7 @@ def load_collection() -> CatalogCollection:
     return coll
 
 
+@profiled
 def save_collection(collection: CatalogCollection) -> None:
     """Sauvegarde la collection."""
     path = _get_collection_path()
@@ -224,6 +203,7 @@ def remove_catalog(catalog_id: str) -> bool:
     if coll.active_id == catalog_id:
         coll.active_id = coll.catalogs[0].id
     save_collection(coll)
+    clear_usage(catalog_id)
     return True
 
 
@@ -5,9 +5,37 @@ from __future__ import annotations
 from brlok.models import Catalog, Hold, Position
 
 
+def _column_letters(col: int) -> str:
+    """Lettres de colonne type tableur : 0=A … 25=Z, 26=AA (grilles larges)."""
+    letters = ""
+    col += 1
+    while col > 0:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
 def _position_to_id(row: int, col: int) -> str:
     """Génère un id type A1, B2 à partir de (row, col). Col 0=A, 1=B... Row 1-based."""
-    return chr(ord("A") + col) + str(row + 1)
+    return _column_letters(col) + str(row + 1)
+
+
+def _replace_hold(catalog: Catalog, hold_id: str, **changes: object) -> Catalog:
+    """Remplace une prise (lookup O(1) via l'index). Retourne un nouveau Catalog."""
+    slot = catalog.hold_index().slot_of(hold_id)
+    if slot < 0:
+        raise ValueError(f"Hold {hold_id!r} non trouvé")
+    hold = catalog.holds[slot]
+    new_hold = Hold(
+        id=hold.id,
+        level=changes.get("level", hold.level),
+        tags=changes.get("tags", hold.tags),
+        position=hold.position,
+        active=changes.get("active", hold.active),
+    )
+    new_holds = list(catalog.holds)
+    new_holds[slot] = new_hold
+    return catalog.model_copy(update={"holds": new_holds})
 
 
 def add_hold(
@@ -21,14 +49,14 @@ def add_hold(
     """Ajoute une prise au catalogue. Position (row,col) doit être libre et dans la grille."""
     if not (0 <= row < catalog.grid.rows and 0 <= col < catalog.grid.cols):
         raise ValueError(f"Position ({row},{col}) hors grille {catalog.grid.rows}×{catalog.grid.cols}")
-    occupied = {(h.position.row, h.position.col) for h in catalog.holds}
-    if (row, col) in occupied:
+    index = catalog.hold_index()
+    if index.is_occupied(row, col):
         raise ValueError(f"Position ({row},{col}) déjà occupée")
     hid = hold_id or _position_to_id(row, col)
-    if any(h.id == hid for h in catalog.holds):
+    if hid in index:
         base = hid
         i = 1
-        while any(h.id == f"{base}{i}" for h in catalog.holds):
+        while f"{base}{i}" in index:
             i += 1
         hid = f"{base}{i}"
     new_hold = Hold(
@@ -43,25 +71,22 @@ def add_hold(
 
 def ensure_full_grid(catalog: Catalog) -> Catalog:
     """Complète le catalogue avec des prises par défaut (level=1) pour les positions vides.
-    Ne s'applique qu'à la grille standard 7×6."""
+    Ne s'applique qu'à la grille standard 7×6 (jamais en grille libre)."""
     from brlok.models import DEFAULT_GRID
+    if catalog.free_grid:
+        return catalog
     if catalog.grid.rows != DEFAULT_GRID.rows or catalog.grid.cols != DEFAULT_GRID.cols:
         return catalog
-    occupied = {(h.position.row, h.position.col) for h in catalog.holds}
-    rows, cols = catalog.grid.rows, catalog.grid.cols
-    extra_holds: list[Hold] = []
-    for r in range(rows):
-        for c in range(cols):
-            if (r, c) not in occupied:
-                extra_holds.append(
-                    Hold(
-                        id=_position_to_id(r, c),
-                        level=1,
-                        tags=[],
-                        position=Position(row=r, col=c),
-                        active=True,
-                    )
-                )
+    extra_holds: list[Hold] = [
+        Hold(
+            id=_position_to_id(r, c),
+            level=1,
+            tags=[],
+            position=Position(row=r, col=c),
+            active=True,
+        )
+        for r, c in catalog.hold_index().free_positions()
+    ]
     if not extra_holds:
         return catalog
     return catalog.model_copy(update={"holds": list(catalog.holds) + extra_holds})
@@ -77,36 +102,12 @@ def remove_hold(catalog: Catalog, hold_id: str) -> Catalog:
 
 def update_hold_level(catalog: Catalog, hold_id: str, new_level: int) -> Catalog:
     """Met à jour le niveau d'une prise. Retourne un nouveau Catalog."""
-    for i, hold in enumerate(catalog.holds):
-        if hold.id == hold_id:
-            new_hold = Hold(
-                id=hold.id,
-                level=new_level,
-                tags=hold.tags,
-                position=hold.position,
-                active=hold.active,
-            )
-            new_holds = list(catalog.holds)
-            new_holds[i] = new_hold
-            return catalog.model_copy(update={"holds": new_holds})
-    raise ValueError(f"Hold {hold_id!r} non trouvé")
+    return _replace_hold(catalog, hold_id, level=new_level)
 
 
 def update_hold_active(catalog: Catalog, hold_id: str, active: bool) -> Catalog:
     """Met à jour le statut actif d'une prise. Retourne un nouveau Catalog."""
-    for i, hold in enumerate(catalog.holds):
-        if hold.id == hold_id:
-            new_hold = Hold(
-                id=hold.id,
-                level=hold.level,
-                tags=hold.tags,
-                position=hold.position,
-                active=active,
-            )
-            new_holds = list(catalog.holds)
-            new_holds[i] = new_hold
-            return catalog.model_copy(update={"holds": new_holds})
-    raise ValueError(f"Hold {hold_id!r} non trouvé")
+    return _replace_hold(catalog, hold_id, active=active)
 
 
 def _parse_tags_input(tags_str: str) -> list[str]:
@@ -117,16 +118,4 @@ def _parse_tags_input(tags_str: str) -> list[str]:
 
 def update_hold_tags(catalog: Catalog, hold_id: str, new_tags: list[str]) -> Catalog:
     """Met à jour les tags d'une prise. Retourne un nouveau Catalog."""
-    for i, hold in enumerate(catalog.holds):
-        if hold.id == hold_id:
-            new_hold = Hold(
-                id=hold.id,
-                level=hold.level,
-                tags=new_tags,
-                position=hold.position,
-                active=hold.active,
-            )
-            new_holds = list(catalog.holds)
-            new_holds[i] = new_hold
-            return catalog.model_copy(update={"holds": new_holds})
-    raise ValueError(f"Hold {hold_id!r} non trouvé")
+    return _replace_hold(catalog, hold_id, tags=new_tags)
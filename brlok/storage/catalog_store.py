@@ -9,14 +9,21 @@ from pathlib import Path
 
 from pydantic import ValidationError
 
-from brlok.models import Catalog, CatalogEntry, DEFAULT_GRID, Hold, Position
+from brlok.models import Catalog, CatalogEntry, DEFAULT_GRID, GridDimensions, Hold, Position
 from brlok.models.catalog import _default_foot_grid, _default_foot_levels
+from brlok.profiling import profiled, span
+from brlok.storage.catalog_ops import _position_to_id
 
 logger = logging.getLogger(__name__)
 
 
 def _normalize_catalog_to_fixed_grid(catalog: Catalog) -> Catalog:
-    """Force la grille à DEFAULT_GRID ; ignore les prises hors grille avec warning."""
+    """Force la grille à DEFAULT_GRID ; ignore les prises hors grille avec warning.
+
+    Les catalogues en grille libre (``free_grid``) sont laissés intacts.
+    """
+    if catalog.free_grid:
+        return catalog
     if catalog.grid.rows == DEFAULT_GRID.rows and catalog.grid.cols == DEFAULT_GRID.cols:
         return catalog
     rows, cols = DEFAULT_GRID.rows, DEFAULT_GRID.cols
@@ -37,11 +44,6 @@ def _normalize_catalog_to_fixed_grid(catalog: Catalog) -> Catalog:
     )
 
 
-def _position_to_id(row: int, col: int) -> str:
-    """Génère un id type A1, B2 à partir de (row, col). Col 0=A, 1=B... Row 1-based."""
-    return chr(ord("A") + col) + str(row + 1)
-
-
 def _default_catalog_holds(rows: int = 7, cols: int = 6) -> list[Hold]:
     """Prises par défaut : toutes les cases A1..F7 (level=1, active=True)."""
     holds: list[Hold] = []
@@ -74,11 +76,27 @@ def _default_catalog() -> Catalog:
     return Catalog(holds=_default_catalog_holds(DEFAULT_GRID.rows, DEFAULT_GRID.cols), grid=DEFAULT_GRID)
 
 
-def create_default_catalog() -> Catalog:
-    """Catalogue par défaut avec grille complète. Utilisé pour « Nouveau catalogue »."""
-    return _default_catalog()
+# Côté maximal d'une grille créée depuis la GUI ou la CLI (spray walls)
+MAX_GRID_SIZE = 100
+
+
+def create_default_catalog(grid: GridDimensions | None = None) -> Catalog:
+    """Catalogue par défaut avec grille complète. Utilisé pour « Nouveau catalogue ».
+
+    Args:
+        grid: Dimensions d'un pan non standard (board, spray wall). Si elles
+            diffèrent de DEFAULT_GRID, le catalogue est créé en grille libre.
+    """
+    if grid is None or (grid.rows == DEFAULT_GRID.rows and grid.cols == DEFAULT_GRID.cols):
+        return _default_catalog()
+    return Catalog(
+        holds=_default_catalog_holds(grid.rows, grid.cols),
+        grid=grid,
+        free_grid=True,
+    )
 
 
+@profiled
 def save_catalog(catalog: Catalog) -> None:
     """Sauvegarde le catalogue actif. Utilise la collection (7.1) si disponible."""
     from brlok.storage.catalog_collection_store import load_collection, save_collection
@@ -114,6 +132,7 @@ def _save_catalog_legacy(catalog: Catalog) -> None:
             "grid": data["grid"],
             "foot_grid": data.get("foot_grid", _default_foot_grid()),
             "foot_levels": data.get("foot_levels", _default_foot_levels()),
+            "free_grid": data.get("free_grid", False),
         }
         with open(path, "w", encoding="utf-8") as f:
             json.dump(file_data, f, ensure_ascii=False, indent=2)
@@ -121,6 +140,7 @@ def _save_catalog_legacy(catalog: Catalog) -> None:
         logger.error("Impossible de sauvegarder le catalogue dans %s: %s", path, e)
 
 
+@profiled
 def load_catalog() -> Catalog:
     """Charge le catalogue actif. Utilise la collection (7.1) si disponible, sinon legacy catalog.json."""
     from brlok.storage.catalog_collection_store import get_active_catalog, load_collection
@@ -144,6 +164,7 @@ def export_catalog_to_json(catalog: Catalog, path: Path) -> None:
         "grid": data["grid"],
         "foot_grid": data.get("foot_grid", _default_foot_grid()),
         "foot_levels": data.get("foot_levels", _default_foot_levels()),
+        "free_grid": data.get("free_grid", False),
     }
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
@@ -161,6 +182,7 @@ def load_catalog_from_json(path: Path) -> Catalog:
         "grid": data["grid"],
         "foot_grid": data.get("foot_grid", _default_foot_grid()),
         "foot_levels": data.get("foot_levels", _default_foot_levels()),
+        "free_grid": data.get("free_grid", False),
     }
     catalog = Catalog.model_validate(catalog_data)
     return _normalize_catalog_to_fixed_grid(catalog)
@@ -188,8 +210,10 @@ def _load_catalog_legacy() -> Catalog:
             "grid": data["grid"],
             "foot_grid": data.get("foot_grid", _default_foot_grid()),
             "foot_levels": data.get("foot_levels", _default_foot_levels()),
+            "free_grid": data.get("free_grid", False),
         }
-        catalog = Catalog.model_validate(catalog_data)
+        with span("validate.Catalog"):
+            catalog = Catalog.model_validate(catalog_data)
         if not catalog.holds:
             return _default_catalog()
         return _normalize_catalog_to_fixed_grid(catalog)
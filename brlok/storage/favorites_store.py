@@ -13,6 +13,8 @@ from pathlib import Path
 from pydantic import ValidationError
 
 from brlok.models import Block
+from brlok.profiling import profiled, span
+from brlok.storage.similarity_index import on_favorites_saved
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +74,7 @@ def _save_raw(data: dict) -> None:
         logger.error("Impossible de sauvegarder les favoris dans %s: %s", path, e)
 
 
+@profiled
 def load_favorites(catalog_id: str | None = None) -> list[Block]:
     """Charge la liste des blocs favoris pour un catalogue.
     Si catalog_id est None, utilise le catalogue actif."""
@@ -88,7 +91,8 @@ def load_favorites(catalog_id: str | None = None) -> list[Block]:
         return []
 
     try:
-        return [Block.model_validate(b) for b in raw]
+        with span("validate.Block"):
+            return [Block.model_validate(b) for b in raw]
     except ValidationError as e:
         logger.warning("Favoris corrompus pour %s: %s", cid, e)
         return []
@@ -109,6 +113,7 @@ def _migrate_to_by_catalog(data: dict, assign_to_catalog_id: str) -> None:
     _save_raw(data)
 
 
+@profiled
 def save_favorites(catalog_id: str | None, blocks: list[Block]) -> None:
     """Sauvegarde les blocs favoris pour un catalogue. Si catalog_id est None, utilise l'actif."""
     cid = catalog_id or _get_active_catalog_id()
@@ -119,6 +124,7 @@ def save_favorites(catalog_id: str | None, blocks: list[Block]) -> None:
     data["by_catalog"][cid] = [b.model_dump(mode="json") for b in blocks]
     data["updated_at"] = datetime.now().isoformat()
     _save_raw(data)
+    on_favorites_saved(cid, blocks)
 
 
 def _block_sequence_key(block: Block) -> tuple[str, ...]:
@@ -7,10 +7,15 @@ import logging
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator, TextIO
 
 from pydantic import ValidationError
 
-from brlok.models import CompletedSession, Session
+from brlok.models import CompletedSession, Session, SessionTimings
+from brlok.profiling import profiled, span
+from brlok.storage import recent_blocks
+from brlok.storage.hold_usage_store import record_session_usage
+from brlok.storage.similarity_index import invalidate_similarity_index, on_history_added
 
 logger = logging.getLogger(__name__)
 
@@ -21,33 +26,139 @@ def _get_history_path() -> Path:
     return get_history_path()
 
 
+@profiled
 def load_history() -> list[CompletedSession]:
     """Charge l'historique des séances depuis le fichier JSON."""
+    return list(iter_history())
+
+
+def iter_history() -> Iterator[CompletedSession]:
+    """Séances de l'historique validées une à une (exports en flux).
+
+    Le tableau ``sessions`` est décodé entrée par entrée : seule l'entrée
+    courante est en mémoire, quelle que soit la taille du fichier.
+    """
     path = _get_history_path()
     if not path.exists():
-        return []
+        return
 
     try:
         with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError, PermissionError) as e:
+            for item in _iter_json_array(f, "sessions"):
+                try:
+                    with span("validate.CompletedSession"):
+                        entry = CompletedSession.model_validate(item)
+                except ValidationError as e:
+                    logger.warning("Entrée historique corrompue : %s", e)
+                    continue
+                yield entry
+    except (ValueError, OSError) as e:  # JSONDecodeError dérive de ValueError
         logger.warning("Historique illisible (%s) : %s", path, e)
-        return []
 
-    if "sessions" not in data:
-        return []
 
-    result: list[CompletedSession] = []
-    for item in data["sessions"]:
-        try:
-            result.append(CompletedSession.model_validate(item))
-        except ValidationError as e:
-            logger.warning("Entrée historique corrompue : %s", e)
-    return result
+# Taille des lectures du décodage incrémental (caractères)
+_READ_CHUNK = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _JsonReader:
+    """Décodage incrémental d'un objet JSON : tampon de lecture et position."""
+
+    def __init__(self, f: TextIO) -> None:
+        self._f = f
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Lit la suite du fichier ; False en fin de fichier."""
+        if self._eof:
+            return False
+        # Lectures au moins aussi grandes que le tampon : coût linéaire même pour une grosse entrée
+        chunk = self._f.read(max(_READ_CHUNK, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Prochain caractère significatif (sans le consommer) ; "" en fin de fichier."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consomme le prochain caractère significatif, qui doit être dans ``chars``."""
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"JSON inattendu à la position {self._pos} : {c!r} au lieu de {chars!r}")
+        self._pos += 1
+        return c
+
+    def value(self) -> object:
+        """Décode la valeur JSON suivante."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Un nombre suivi de la fin du tampon ou d'un chiffre (« 1. » de « 1.5 ») peut être tronqué
+            if (end < len(self._buf) and self._buf[end] not in _NUMBER_CHARS) or not self._fill():
+                self._pos = end
+                return value
+
+
+def _iter_json_array(f: TextIO, key: str) -> Iterator[object]:
+    """Éléments du tableau ``key`` de l'objet JSON racine de ``f``, un par un.
+
+    Les autres clés de l'objet racine sont décodées puis ignorées ; une clé
+    absente ne produit aucun élément.
+    """
+    reader = _JsonReader(f)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        if not isinstance(name, str):
+            raise ValueError(f"Clé JSON attendue, obtenu {name!r}")
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            reader.value()
+        if reader.expect(",}") == "}":
+            return
 
 
 def save_history(sessions: list[CompletedSession]) -> None:
     """Sauvegarde l'historique en JSON."""
+    _write_history(sessions)
+    invalidate_similarity_index()
+    recent_blocks.invalidate_recent_blocks()
+
+
+@profiled
+def _write_history(sessions: list[CompletedSession]) -> None:
+    """Écrit le fichier historique."""
     path = _get_history_path()
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -62,17 +173,35 @@ def save_history(sessions: list[CompletedSession]) -> None:
         logger.error("Impossible de sauvegarder l'historique dans %s: %s", path, e)
 
 
-def add_to_history(session: Session, block_statuses: dict[int, str]) -> CompletedSession:
-    """Ajoute une séance terminée à l'historique. Retourne l'entrée créée."""
+def add_to_history(
+    session: Session,
+    block_statuses: dict[int, str],
+    catalog_id: str | None = None,
+    timings: SessionTimings | None = None,
+) -> CompletedSession:
+    """Ajoute une séance terminée à l'historique. Retourne l'entrée créée.
+
+    ``timings`` : chronologie compacte de la séance (TimingRecorder), facultative.
+
+    Si catalog_id est fourni, il est enregistré dans l'entrée et l'usage des
+    prises de ce catalogue est mis à jour (hold_usage_store, variété
+    inter-séances).
+    """
     sessions = load_history()
     entry = CompletedSession(
         id=str(uuid.uuid4()),
         date=datetime.now(),
         session=session,
         block_statuses=dict(block_statuses),
+        catalog_id=catalog_id,
+        timings=timings,
     )
     sessions.insert(0, entry)
-    save_history(sessions)
+    _write_history(sessions)
+    on_history_added(entry)
+    recent_blocks.on_history_added(entry)
+    if catalog_id:
+        record_session_usage(catalog_id, session, entry.block_statuses, when=entry.date)
     return entry
 
 
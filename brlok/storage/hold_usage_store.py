@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Usage des prises par catalogue, avec décroissance temporelle (variété inter-séances).
+
+Agrégat mis à jour par ``history_store.add_to_history`` : pour chaque prise,
+un score et la date de sa dernière mise à jour. Le score décroît de moitié
+tous les ``HALF_LIFE_DAYS`` jours ; la décroissance est appliquée à la
+lecture et à l'écriture de la prise concernée, sans relire l'historique.
+Le générateur reçoit les scores courants comme poids a priori
+(``generate_session(..., usage_prior=...)``).
+"""
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from brlok.models import Session
+from brlok.profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+HALF_LIFE_DAYS = 21.0
+# En deçà, une prise est considérée comme non utilisée (absente des poids a priori)
+_MIN_SCORE = 0.01
+
+
+def _get_path() -> Path:
+    from brlok.config.paths import get_hold_usage_path
+    return get_hold_usage_path()
+
+
+def _decayed(score: float, since: datetime, now: datetime) -> float:
+    """Score après décroissance exponentielle entre ``since`` et ``now``."""
+    days = max(0.0, (now - since).total_seconds() / 86400.0)
+    return score * 0.5 ** (days / HALF_LIFE_DAYS)
+
+
+@profiled
+def _load_raw() -> dict:
+    path = _get_path()
+    if not path.exists():
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Usage des prises illisible (%s): %s", path, e)
+        return {}
+
+
+@profiled
+def _save_raw(data: dict) -> None:
+    path = _get_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data["version"] = 1
+        data["updated_at"] = datetime.now().isoformat()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    except (OSError, PermissionError) as e:
+        logger.error("Impossible de sauvegarder l'usage des prises dans %s: %s", path, e)
+
+
+def used_hold_ids(session: Session, block_statuses: dict[int, str]) -> list[str]:
+    """Prises grimpées : blocs marqués (réussi/échec), ou tous si aucun statut."""
+    blocks = session.blocks
+    if block_statuses:
+        blocks = [b for i, b in enumerate(blocks) if block_statuses.get(i)]
+    return [h.id for b in blocks for h in b.holds]
+
+
+def record_usage(
+    catalog_id: str,
+    hold_ids: list[str],
+    *,
+    when: datetime | None = None,
+) -> None:
+    """Ajoute une utilisation par occurrence de prise. Coût proportionnel à ``hold_ids``."""
+    if not hold_ids:
+        return
+    now = when or datetime.now()
+    data = _load_raw()
+    by_catalog = data.get("by_catalog")
+    if not isinstance(by_catalog, dict):
+        by_catalog = data["by_catalog"] = {}
+    holds = by_catalog.get(catalog_id)
+    if not isinstance(holds, dict):
+        if holds is not None:
+            logger.warning("Usage des prises corrompu pour %s, réinitialisé", catalog_id)
+        holds = by_catalog[catalog_id] = {}
+    for hold_id in hold_ids:
+        score = 0.0
+        value = holds.get(hold_id)
+        if value is not None:
+            try:
+                score = _decayed(float(value[0]), datetime.fromisoformat(value[1]), now)
+            except (TypeError, ValueError, IndexError, KeyError) as e:
+                logger.warning("Usage de la prise %s corrompu (%r), ignoré : %s", hold_id, value, e)
+        holds[hold_id] = [round(score + 1.0, 4), now.isoformat()]
+    _save_raw(data)
+
+
+def record_session_usage(
+    catalog_id: str,
+    session: Session,
+    block_statuses: dict[int, str],
+    *,
+    when: datetime | None = None,
+) -> None:
+    """Met à jour l'usage avec les prises grimpées d'une séance terminée."""
+    record_usage(catalog_id, used_hold_ids(session, block_statuses), when=when)
+
+
+def load_usage_prior(catalog_id: str | None, *, now: datetime | None = None) -> dict[str, float]:
+    """Scores d'usage courants (décroissance appliquée) : {hold_id: score}."""
+    if not catalog_id:
+        return {}
+    now = now or datetime.now()
+    by_catalog = _load_raw().get("by_catalog")
+    holds = by_catalog.get(catalog_id) if isinstance(by_catalog, dict) else None
+    if not isinstance(holds, dict):
+        if holds is not None:
+            logger.warning("Usage des prises corrompu pour %s, ignoré", catalog_id)
+        return {}
+    prior: dict[str, float] = {}
+    for hold_id, value in holds.items():
+        try:
+            score, stamp = float(value[0]), datetime.fromisoformat(value[1])
+        except (TypeError, ValueError, IndexError, KeyError):
+            continue
+        current = _decayed(score, stamp, now)
+        if current >= _MIN_SCORE:
+            prior[hold_id] = current
+    return prior
+
+
+def clear_usage(catalog_id: str) -> None:
+    """Réinitialise l'usage d'un catalogue (appelé à la suppression du catalogue)."""
+    data = _load_raw()
+    by_catalog = data.get("by_catalog")
+    if isinstance(by_catalog, dict) and by_catalog.pop(catalog_id, None) is not None:
+        _save_raw(data)
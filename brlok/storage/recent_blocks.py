@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Blocs récemment grimpés : filtre de Bloom sur les séquences de l'historique.
+
+Sert à ``generate_session(..., avoid_recent_days=N)`` : un bloc généré dont
+la séquence (ou le même ensemble de prises dans un autre ordre) figure dans
+l'historique des N derniers jours est re-tiré. Le test d'appartenance coûte
+``k`` hachages, quel que soit le nombre de blocs passés ; faux positifs
+possibles (≈ ``FALSE_POSITIVE_RATE``), jamais de faux négatifs.
+
+Les filtres sont construits à la première demande puis tenus à jour par
+``history_store.add_to_history`` ; un filtre est reconstruit quand sa plus
+ancienne séance sort de la fenêtre, ou après ``save_history``.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Sequence
+
+from brlok.models import CompletedSession
+from brlok.profiling import count
+
+FALSE_POSITIVE_RATE = 0.01
+# Capacité minimale d'un filtre (nombre de clés)
+_MIN_CAPACITY = 256
+
+
+def sequence_keys(hold_ids: Sequence[str]) -> tuple[str, str]:
+    """Clés d'un bloc : séquence ordonnée et ensemble de prises (ordre ignoré)."""
+    return ("s:" + ">".join(hold_ids), "u:" + ",".join(sorted(set(hold_ids))))
+
+
+class BloomFilter:
+    """Filtre de Bloom (bytearray) à double hachage blake2b."""
+
+    __slots__ = ("capacity", "size", "hashes", "_bits", "count")
+
+    def __init__(self, capacity: int, error_rate: float = FALSE_POSITIVE_RATE) -> None:
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+@dataclass
+class RecentBlocksFilter:
+    """Blocs de l'historique depuis ``since`` ; valide jusqu'à ``expires_at``."""
+
+    days: int
+    since: datetime
+    expires_at: datetime
+    bloom: BloomFilter
+
+    def add_session(self, completed: CompletedSession) -> None:
+        """Ajoute les blocs d'une séance ; avance l'échéance si elle est plus ancienne."""
+        if completed.date < self.since:
+            return
+        for block in completed.session.blocks:
+            if block.holds:
+                for key in sequence_keys([h.id for h in block.holds]):
+                    self.bloom.add(key)
+        self.expires_at = min(self.expires_at, completed.date + timedelta(days=self.days))
+
+    def contains(self, hold_ids: Sequence[str]) -> bool:
+        """True si la séquence ou le même ensemble de prises a été grimpé récemment."""
+        return any(key in self.bloom for key in sequence_keys(hold_ids))
+
+
+_filters: dict[int, RecentBlocksFilter] = {}
+
+
+def _build_filter(days: int, now: datetime) -> RecentBlocksFilter:
+    from brlok.storage.history_store import load_history
+
+    since = now - timedelta(days=days)
+    recent = [c for c in load_history() if c.date >= since]
+    n_blocks = sum(len(c.session.blocks) for c in recent)
+    # 2 clés par bloc ; marge ×2 pour les séances ajoutées ensuite
+    flt = RecentBlocksFilter(
+        days=days,
+        since=since,
+        expires_at=datetime.max,
+        bloom=BloomFilter(max(_MIN_CAPACITY, 4 * n_blocks)),
+    )
+    for completed in recent:
+        flt.add_session(completed)
+    return flt
+
+
+def recent_blocks_filter(days: int, *, now: datetime | None = None) -> RecentBlocksFilter:
+    """Filtre des blocs grimpés dans les ``days`` derniers jours (mis en cache)."""
+    now = now or datetime.now()
+    flt = _filters.get(days)
+    # Reconstruit si une séance sort de la fenêtre ou si le filtre est saturé
+    if flt is None or now >= flt.expires_at or flt.bloom.count > flt.bloom.capacity:
+        flt = _build_filter(days, now)
+        _filters[days] = flt
+        count("recent_blocks.rebuild")
+    return flt
+
+
+def invalidate_recent_blocks() -> None:
+    """Oublie les filtres (reconstruits à la prochaine demande)."""
+    _filters.clear()
+
+
+def on_history_added(completed: CompletedSession) -> None:
+    """Hook history_store.add_to_history : ajoute la séance aux filtres construits."""
+    for flt in _filters.values():
+        flt.add_session(completed)
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""Recherche de blocs similaires (favoris + historique) par MinHash/LSH.
+
+Un bloc est représenté par ses « shingles » : ses prises (recouvrement) et
+ses paires de prises consécutives (ordre). Une signature MinHash de
+``NUM_PERM`` valeurs est découpée en bandes ; deux blocs partageant une bande
+sont candidats, puis classés par similarité de Jaccard exacte des shingles.
+
+L'index est construit à la première requête puis maintenu en mémoire :
+``favorites_store.save_favorites`` (donc ``add_favorite``) et
+``history_store.add_to_history`` le mettent à jour s'il est déjà construit.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable
+
+from brlok.models import Block, CompletedSession
+from brlok.profiling import count
+
+NUM_PERM = 64
+# Deux découpages de la même signature : strict (16 bandes × 4, seuil Jaccard ≈ 0,5)
+# puis large (21 bandes × 3, seuil ≈ 0,36) si le premier donne moins de k candidats.
+_BAND_ROWS = (4, 3)
+# Candidats re-classés par Jaccard exact : max(_RERANK_MIN, _RERANK_FACTOR × k)
+_RERANK_MIN = 32
+_RERANK_FACTOR = 4
+_PRIME = (1 << 61) - 1
+_perm_rng = random.Random(0x62726C6F6B)  # graine fixe : signatures stables entre sessions
+_PERMS = tuple((_perm_rng.randrange(1, _PRIME), _perm_rng.randrange(0, _PRIME)) for _ in range(NUM_PERM))
+
+SOURCE_FAVORITE = "favorite"
+SOURCE_HISTORY = "history"
+
+# (source, catalog_id ou "", séquence d'ids)
+_EntryKey = tuple[str, str, tuple[str, ...]]
+
+
+def block_shingles(block: Block) -> frozenset[str]:
+    """Prises du bloc + paires consécutives (l'ordre compte)."""
+    ids = [h.id for h in block.holds]
+    shingles = {f"h:{hid}" for hid in ids}
+    shingles.update(f"p:{a}>{b}" for a, b in zip(ids, ids[1:]))
+    return frozenset(shingles)
+
+
+@lru_cache(maxsize=65536)
+def _shingle_hashes(shingle: str) -> tuple[int, ...]:
+    """Les NUM_PERM hachages d'un shingle (blake2b stable, puis a·x + b mod p)."""
+    x = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+    return tuple((a * x + b) % _PRIME for a, b in _PERMS)
+
+
+def minhash_signature(shingles: Iterable[str]) -> tuple[int, ...]:
+    """Signature MinHash (minimum colonne par colonne). Vide si aucun shingle."""
+    vectors = [_shingle_hashes(s) for s in shingles]
+    if not vectors:
+        return ()
+    return tuple(map(min, zip(*vectors)))
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(frozen=True)
+class SimilarBlock:
+    """Résultat de recherche : bloc, score (Jaccard des shingles) et provenance."""
+
+    block: Block
+    score: float
+    source: str
+    catalog_id: str | None = None
+    session_id: str | None = None
+    block_index: int | None = None
+    date: datetime | None = None
+
+
+@dataclass
+class _Entry:
+    block: Block
+    shingles: frozenset[str]
+    signature: tuple[int, ...]
+    source: str
+    catalog_id: str | None = None
+    session_id: str | None = None
+    block_index: int | None = None
+    date: datetime | None = None
+
+
+class SimilarityIndex:
+    """Index MinHash/LSH en mémoire ; un bloc identique n'est indexé qu'une fois par source."""
+
+    def __init__(self) -> None:
+        self._entries: dict[_EntryKey, _Entry] = {}
+        self._tables: tuple[dict[tuple[int, tuple[int, ...]], set[_EntryKey]], ...] = tuple(
+            {} for _ in _BAND_ROWS
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _bands(signature: tuple[int, ...], rows: int) -> Iterable[tuple[int, tuple[int, ...]]]:
+        # Bandes complètes uniquement (64 = 21 × 3 + 1 : la valeur restante est ignorée)
+        for band, start in enumerate(range(0, len(signature) - rows + 1, rows)):
+            yield band, signature[start:start + rows]
+
+    def add(
+        self,
+        block: Block,
+        source: str,
+        *,
+        catalog_id: str | None = None,
+        session_id: str | None = None,
+        block_index: int | None = None,
+        date: datetime | None = None,
+    ) -> None:
+        """Indexe un bloc. Une séquence déjà indexée pour la même source est
+        remplacée (l'historique garde l'occurrence la plus récente)."""
+        if not block.holds:
+            return
+        key: _EntryKey = (source, catalog_id or "", tuple(h.id for h in block.holds))
+        if key in self._entries:
+            self.remove(key)
+        shingles = block_shingles(block)
+        entry = _Entry(
+            block=block,
+            shingles=shingles,
+            signature=minhash_signature(shingles),
+            source=source,
+            catalog_id=catalog_id,
+            session_id=session_id,
+            block_index=block_index,
+            date=date,
+        )
+        self._entries[key] = entry
+        for table, rows in zip(self._tables, _BAND_ROWS):
+            for band in self._bands(entry.signature, rows):
+                table.setdefault(band, set()).add(key)
+
+    def remove(self, key: _EntryKey) -> None:
+        """Retire une entrée (no-op si absente)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for table, rows in zip(self._tables, _BAND_ROWS):
+            for band in self._bands(entry.signature, rows):
+                bucket = table.get(band)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del table[band]
+
+    def add_completed_session(self, completed: CompletedSession) -> None:
+        """Indexe les blocs d'une séance de l'historique."""
+        for i, block in enumerate(completed.session.blocks):
+            self.add(
+                block,
+                SOURCE_HISTORY,
+                catalog_id=completed.catalog_id,
+                session_id=completed.id,
+                block_index=i,
+                date=completed.date,
+            )
+
+    def sync_favorites(self, catalog_id: str, blocks: list[Block]) -> None:
+        """Aligne les favoris indexés d'un catalogue sur ``blocks`` (ajouts, retraits, titres)."""
+        current = {
+            key for key in self._entries if key[0] == SOURCE_FAVORITE and key[1] == catalog_id
+        }
+        wanted: set[_EntryKey] = set()
+        for block in blocks:
+            key: _EntryKey = (SOURCE_FAVORITE, catalog_id, tuple(h.id for h in block.holds))
+            wanted.add(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.add(block, SOURCE_FAVORITE, catalog_id=catalog_id)
+            elif entry.block != block:
+                entry.block = block  # titre / commentaire modifié : signature inchangée
+        for key in current - wanted:
+            self.remove(key)
+
+    def query(
+        self,
+        block: Block,
+        k: int = 5,
+        *,
+        catalog_id: str | None = None,
+        exclude_identical: bool = False,
+    ) -> list[SimilarBlock]:
+        """Les k blocs les plus similaires (score décroissant, puis plus récents).
+
+        Args:
+            catalog_id: Si fourni, ne garde que les blocs (favoris et historique)
+                de ce catalogue ; les séances d'historique antérieures à
+                l'enregistrement du catalogue ne sont gardées que sans catalog_id.
+            exclude_identical: Exclut les blocs de même séquence que ``block``.
+        """
+        if not block.holds or k <= 0:
+            return []
+        shingles = block_shingles(block)
+        signature = minhash_signature(shingles)
+        sequence = tuple(h.id for h in block.holds)
+        hits: Counter[_EntryKey] = Counter()
+        for table, rows in zip(self._tables, _BAND_ROWS):
+            for band in self._bands(signature, rows):
+                hits.update(table.get(band, ()))
+            for key in list(hits):
+                if (exclude_identical and key[2] == sequence) or (catalog_id and key[1] != catalog_id):
+                    del hits[key]
+            if len(hits) >= k:
+                break
+        # Score exact uniquement pour les candidats partageant le plus de bandes
+        scored = []
+        for key, _ in hits.most_common(max(_RERANK_MIN, _RERANK_FACTOR * k)):
+            entry = self._entries[key]
+            scored.append((_jaccard(shingles, entry.shingles), entry.date or datetime.min, entry))
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [
+            SimilarBlock(
+                block=entry.block,
+                score=score,
+                source=entry.source,
+                catalog_id=entry.catalog_id,
+                session_id=entry.session_id,
+                block_index=entry.block_index,
+                date=entry.date,
+            )
+            for score, _, entry in scored[:k]
+        ]
+
+
+_index: SimilarityIndex | None = None
+
+
+def _build_index() -> SimilarityIndex:
+    """Construit l'index depuis les fichiers favoris (tous catalogues) et historique."""
+    from brlok.storage.favorites_store import _load_raw, load_favorites
+    from brlok.storage.history_store import load_history
+
+    index = SimilarityIndex()
+    # Historique du plus ancien au plus récent : l'occurrence la plus récente l'emporte
+    for completed in reversed(load_history()):
+        index.add_completed_session(completed)
+    for cid in _load_raw().get("by_catalog", {}):
+        index.sync_favorites(cid, load_favorites(cid))
+    return index
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """Index partagé, construit à la première utilisation."""
+    global _index
+    if _index is None:
+        _index = _build_index()
+        count("similarity_index.rebuild")
+    return _index
+
+
+def invalidate_similarity_index() -> None:
+    """Oublie l'index (reconstruit à la prochaine requête)."""
+    global _index
+    _index = None
+
+
+def find_similar_blocks(
+    block: Block,
+    k: int = 5,
+    *,
+    catalog_id: str | None = None,
+    exclude_identical: bool = False,
+) -> list[SimilarBlock]:
+    """Les k blocs passés (favoris, historique) les plus proches de ``block``."""
+    return get_similarity_index().query(
+        block, k, catalog_id=catalog_id, exclude_identical=exclude_identical
+    )
+
+
+def on_favorites_saved(catalog_id: str, blocks: list[Block]) -> None:
+    """Hook favorites_store : met à jour l'index s'il est construit."""
+    if _index is not None:
+        _index.sync_favorites(catalog_id, blocks)
+
+
+def on_history_added(completed: CompletedSession) -> None:
+    """Hook history_store.add_to_history : indexe la séance si l'index est construit."""
+    if _index is not None:
+        _index.add_completed_session(completed)
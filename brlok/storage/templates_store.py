@@ -10,21 +10,42 @@ from pathlib import Path
 from pydantic import ValidationError
 
 from brlok.models.session_template import SessionTemplate
+from brlok.profiling import profiled, span
 
 logger = logging.getLogger(__name__)
 
+# Dernière lecture : ((chemin, mtime_ns, taille), templates validés)
+_cache: tuple[tuple[str, int, int], list[SessionTemplate]] | None = None
+
 
 def _get_path() -> Path:
     from brlok.config.paths import get_templates_path
     return get_templates_path()
 
 
+def _file_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+@profiled
 def load_templates() -> list[SessionTemplate]:
-    """Charge la liste des templates. Crée un template 40/20 par défaut si vide."""
+    """Charge la liste des templates. Crée un template 40/20 par défaut si vide.
+
+    Le fichier n'est relu (et revalidé) que si sa date de modification ou sa
+    taille a changé depuis la dernière lecture.
+    """
+    global _cache
     path = _get_path()
     if not path.exists():
         _ensure_default_templates()
         return load_templates()
+    key = _file_key(path)
+    if _cache is not None and _cache[0] == key:
+        return list(_cache[1])
     try:
         with open(path, encoding="utf-8") as f:
             data = json.load(f)
@@ -34,12 +55,14 @@ def load_templates() -> list[SessionTemplate]:
     result = []
     for item in data.get("templates", []):
         try:
-            result.append(SessionTemplate.model_validate(item))
+            with span("validate.SessionTemplate"):
+                result.append(SessionTemplate.model_validate(item))
         except ValidationError:
             pass
     if not result:
         _ensure_default_templates()
         return load_templates()
+    _cache = (key, list(result)) if key else None
     return result
 
 
@@ -121,9 +144,12 @@ def export_templates_to_file(path: Path) -> None:
         }, f, ensure_ascii=False, indent=2)
 
 
+@profiled
 def save_templates(templates: list[SessionTemplate]) -> None:
     """Sauvegarde les templates."""
+    global _cache
     path = _get_path()
+    _cache = None
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         from datetime import datetime
@@ -133,6 +159,9 @@ def save_templates(templates: list[SessionTemplate]) -> None:
                 "updated_at": datetime.now().isoformat(),
                 "templates": [t.model_dump(mode="json") for t in templates],
             }, f, ensure_ascii=False, indent=2)
+        key = _file_key(path)
+        if key and templates:
+            _cache = (key, list(templates))
     except (OSError, PermissionError) as e:
         logger.error("Impossible de sauvegarder templates: %s", e)
 
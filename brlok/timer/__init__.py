@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""Moteur de timer par intervalles (indépendant de Qt)."""
+from brlok.timer.engine import IntervalEngine, TimerState
+from brlok.timer.recorder import TimingRecorder
+from brlok.timer.schedule import Schedule, Segment, build_schedule, schedule_from_blocks
+
+__all__ = [
+    "IntervalEngine",
+    "Schedule",
+    "Segment",
+    "TimerState",
+    "TimingRecorder",
+    "build_schedule",
+    "schedule_from_blocks",
+]
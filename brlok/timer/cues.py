@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Signaux sonores du timer : synthèse des sons et planification sur le programme.
+
+Les sons (début de travail, début de repos, décompte 3-2-1, fin de séance)
+sont des bips sinusoïdaux dont la fréquence divise la fréquence
+d'échantillonnage : une période est calculée une fois puis répétée par
+concaténation d'``array`` (opération en C), sans boucle Python par
+échantillon. ``CueTrack`` précalcule les instants de tous les signaux d'un
+``Schedule`` ; le widget arme un unique minuteur sur le prochain signal dès
+qu'il entre dans les ``CUE_LOOKAHEAD_S`` secondes à venir, pour qu'il tombe
+sur la borne de l'intervalle et non au tick suivant.
+"""
+from __future__ import annotations
+
+import math
+import sys
+import wave
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+from brlok.timer.schedule import PHASE_REST, PHASE_WORK, Schedule
+
+CUE_WORK = "work"
+CUE_REST = "rest"
+CUE_COUNTDOWN = "countdown"
+CUE_END = "end"
+
+SAMPLE_RATE = 22050
+AMPLITUDE = 0.3
+# Fondu d'entrée / sortie (échantillons) pour éviter les clics
+FADE_SAMPLES = 64
+# Décompte avant chaque changement de phase (secondes avant la borne)
+COUNTDOWN_S = (3, 2, 1)
+# Fenêtre de planification anticipée (s), supérieure à la période de rafraîchissement
+CUE_LOOKAHEAD_S = 0.5
+
+# Son : (fréquence Hz — diviseur de SAMPLE_RATE, durée s)
+CUE_TONES: dict[str, tuple[int, float]] = {
+    CUE_WORK: (1470, 0.25),
+    CUE_REST: (630, 0.25),
+    CUE_COUNTDOWN: (882, 0.08),
+    CUE_END: (1225, 0.6),
+}
+
+_PHASE_CUES = {PHASE_WORK: CUE_WORK, PHASE_REST: CUE_REST}
+
+
+def synthesize(freq: int, duration_s: float, rate: int = SAMPLE_RATE) -> array:
+    """Échantillons PCM 16 bits d'un bip ``freq`` Hz (``rate`` multiple de ``freq``)."""
+    period = rate // freq
+    n = int(rate * duration_s)
+    peak = 32767 * AMPLITUDE
+    cycle = array("h", (int(peak * math.sin(2 * math.pi * i / period)) for i in range(period)))
+    samples = cycle * (n // period + 1)
+    del samples[n:]
+    fade = min(FADE_SAMPLES, n // 2)
+    for i in range(fade):
+        samples[i] = samples[i] * i // fade
+        samples[n - 1 - i] = samples[n - 1 - i] * i // fade
+    return samples
+
+
+def write_wav(path: Path, samples: array, rate: int = SAMPLE_RATE) -> None:
+    """Écrit des échantillons 16 bits mono en WAV."""
+    if sys.byteorder == "big":
+        samples = array("h", samples)
+        samples.byteswap()
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+def ensure_cue_files(directory: Path) -> dict[str, Path]:
+    """Fichiers WAV de chaque signal dans ``directory`` (générés s'ils manquent)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for cue, (freq, duration) in CUE_TONES.items():
+        path = directory / f"cue_{cue}_{freq}.wav"
+        if not path.exists():
+            write_wav(path, synthesize(freq, duration))
+        paths[cue] = path
+    return paths
+
+
+class CueTrack:
+    """Instants (s) des signaux d'un programme, consommés dans l'ordre."""
+
+    __slots__ = ("_times", "_cues", "_cursor")
+
+    def __init__(self, schedule: Schedule) -> None:
+        events: list[tuple[float, int, str]] = []
+        for i, seg in enumerate(schedule):
+            start, end = schedule.start_of(i), schedule.end_of(i)
+            events.append((start, 1, _PHASE_CUES.get(seg.phase, CUE_WORK)))
+            for before in COUNTDOWN_S:
+                if end - before > start:
+                    events.append((end - before, 0, CUE_COUNTDOWN))
+        if len(schedule):
+            events.append((schedule.total_s, 1, CUE_END))
+        events.sort()
+        self._times = array("d", (t for t, _, _ in events))
+        self._cues = [cue for _, _, cue in events]
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._cues)
+
+    def peek(self) -> tuple[float, str] | None:
+        """Prochain signal pas encore rendu (instant, signal), None à la fin."""
+        if self._cursor >= len(self._cues):
+            return None
+        return self._times[self._cursor], self._cues[self._cursor]
+
+    def seek(self, t: float) -> None:
+        """Ignore les signaux antérieurs à ``t`` (après un saut ou une reprise)."""
+        self._cursor = bisect_right(self._times, t - 1e-9)
+
+    def take_until(self, t: float) -> list[tuple[float, str]]:
+        """Signaux pas encore rendus dont l'instant est ≤ ``t`` (instant, signal)."""
+        end = bisect_right(self._times, t)
+        due = [(self._times[i], self._cues[i]) for i in range(self._cursor, end)]
+        self._cursor = max(self._cursor, end)
+        return due
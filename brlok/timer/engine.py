@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Moteur de timer sans dérive, piloté par une horloge monotone.
+
+L'état (phase, round, temps restant) n'est jamais accumulé tick après tick :
+il est recalculé à chaque lecture à partir du temps écoulé depuis le départ
+(``time.monotonic()``, pauses déduites) et du programme compilé
+(``Schedule``, recherche dichotomique). Un retard de la boucle d'événements ne décale donc ni le chrono ni les records ;
+le widget se contente d'afficher ``state()`` à intervalle régulier.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from brlok.timer.schedule import Schedule
+
+PHASE_COUNTUP = "countup"
+
+# Intervalle : (phase, durée en secondes, round 1-based)
+Interval = tuple[str, float, int]
+
+
+@dataclass(frozen=True)
+class TimerState:
+    """État du timer à un instant donné."""
+
+    phase: str  # PHASE_* ou "" (arrêté / terminé)
+    round: int
+    remaining_s: float
+    elapsed_s: float
+    interval: int  # rang de l'intervalle courant (-1 hors intervalle)
+    finished: bool = False
+    block: int = 0
+
+
+class IntervalEngine:
+    """Parcourt un programme d'intervalles d'après une horloge monotone.
+
+    ``schedule`` est un ``Schedule`` ou une suite de tuples (phase, durée,
+    round). Sans programme, le moteur est un chronomètre (phase
+    ``PHASE_COUNTUP``). ``clock`` est injectable pour les tests.
+    """
+
+    def __init__(
+        self,
+        schedule: Schedule | Sequence[Interval] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if schedule is not None and not isinstance(schedule, Schedule):
+            schedule = Schedule.from_intervals(schedule)
+        self._schedule = schedule
+        self._clock = clock
+        self._started_at: float | None = None
+        self._paused_at: float | None = None
+        self._paused_s = 0.0
+
+    @property
+    def schedule(self) -> Schedule | None:
+        """Programme parcouru (None pour un chronomètre)."""
+        return self._schedule
+
+    @property
+    def total_s(self) -> float | None:
+        """Durée totale du programme (None pour un chronomètre)."""
+        return self._schedule.total_s if self._schedule is not None else None
+
+    @property
+    def running(self) -> bool:
+        """True entre ``start`` et ``stop`` (y compris en pause)."""
+        return self._started_at is not None
+
+    @property
+    def paused(self) -> bool:
+        """True si le timer est en pause."""
+        return self._paused_at is not None
+
+    def start(self) -> None:
+        """Démarre (ou redémarre) depuis le début."""
+        self._started_at = self._clock()
+        self._paused_at = None
+        self._paused_s = 0.0
+
+    def stop(self) -> None:
+        """Arrête le timer."""
+        self._started_at = None
+        self._paused_at = None
+        self._paused_s = 0.0
+
+    def pause(self) -> None:
+        """Suspend le décompte (sans effet si arrêté ou déjà en pause)."""
+        if self._started_at is not None and self._paused_at is None:
+            self._paused_at = self._clock()
+
+    def resume(self) -> None:
+        """Reprend après ``pause``."""
+        if self._paused_at is not None:
+            self._paused_s += self._clock() - self._paused_at
+            self._paused_at = None
+
+    def seek(self, t: float) -> None:
+        """Place le timer (démarré) à l'instant ``t`` du programme, pause conservée."""
+        if self._started_at is None:
+            return
+        now = self._paused_at if self._paused_at is not None else self._clock()
+        self._started_at = now - max(0.0, t)
+        self._paused_s = 0.0
+
+    def elapsed(self) -> float:
+        """Temps écoulé hors pauses depuis ``start`` (0 si arrêté)."""
+        if self._started_at is None:
+            return 0.0
+        now = self._paused_at if self._paused_at is not None else self._clock()
+        return max(0.0, now - self._started_at - self._paused_s)
+
+    def state(self) -> TimerState:
+        """Phase, round et temps restant à l'instant présent."""
+        elapsed = self.elapsed()
+        if self._started_at is None:
+            return TimerState(phase="", round=0, remaining_s=0.0, elapsed_s=0.0, interval=-1)
+        schedule = self._schedule
+        if schedule is None:
+            return TimerState(
+                phase=PHASE_COUNTUP, round=0, remaining_s=0.0, elapsed_s=elapsed, interval=-1
+            )
+        i = schedule.locate(elapsed)
+        if i < len(schedule):
+            seg = schedule[i]
+            return TimerState(
+                phase=seg.phase,
+                round=seg.round,
+                remaining_s=schedule.end_of(i) - elapsed,
+                elapsed_s=elapsed,
+                interval=i,
+                block=seg.block,
+            )
+        last = schedule[-1] if len(schedule) else None
+        return TimerState(
+            phase="",
+            round=last.round if last else 0,
+            remaining_s=0.0,
+            elapsed_s=schedule.total_s,
+            interval=-1,
+            finished=True,
+            block=last.block if last else 0,
+        )
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Enregistrement de la chronologie d'une séance (blocs, rounds, pauses, statuts).
+
+Les instants viennent d'une horloge monotone ; la chronologie est encodée
+en colonnes compactes (``SessionTimings``) au moment de l'enregistrement
+dans l'historique.
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Callable
+
+from brlok.models.session_timings import (
+    EVENT_BLOCK_END,
+    EVENT_BLOCK_START,
+    SessionTimings,
+)
+
+
+class TimingRecorder:
+    """Accumule des événements (type, instant, bloc) depuis ``start``."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._started_at: datetime | None = None
+        self._t0 = 0.0
+        self._events: list[tuple[str, float, int]] = []
+        self._block: int | None = None
+
+    @property
+    def started(self) -> bool:
+        """True après ``start``."""
+        return self._started_at is not None
+
+    def start(self, block: int = 0) -> None:
+        """Démarre une nouvelle chronologie sur le bloc ``block``."""
+        self._started_at = datetime.now()
+        self._t0 = self._clock()
+        self._events = []
+        self._block = None
+        self.enter_block(block)
+
+    def reset(self) -> None:
+        """Abandonne la chronologie en cours."""
+        self._started_at = None
+        self._events = []
+        self._block = None
+
+    def mark(self, kind: str) -> None:
+        """Ajoute l'événement ``kind`` (EVENT_*) sur le bloc courant."""
+        if self._started_at is None or self._block is None:
+            return
+        self._events.append((kind, self._clock() - self._t0, self._block))
+
+    def enter_block(self, block: int) -> None:
+        """Clôt le bloc courant et ouvre ``block``."""
+        if self._started_at is None:
+            return
+        if self._block is not None:
+            self.mark(EVENT_BLOCK_END)
+        self._block = block
+        self.mark(EVENT_BLOCK_START)
+
+    def timings(self) -> SessionTimings | None:
+        """Chronologie encodée, bloc courant clos (None si non démarrée)."""
+        if self._started_at is None:
+            return None
+        events = list(self._events)
+        if self._block is not None:
+            events.append((EVENT_BLOCK_END, self._clock() - self._t0, self._block))
+        return SessionTimings.from_events(self._started_at, events)
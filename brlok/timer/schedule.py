@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Programmes d'intervalles compilés (40/20, pyramide, EMOM, Tabata, échelle).
+
+Chaque mode est compilé une fois en un ``Schedule`` immuable : la suite des
+segments (phase, durée, round, bloc) et leurs bornes cumulées. La chronologie
+complète est connue d'avance ; retrouver le segment d'un instant donné (pause,
+reprise, saut) est une recherche dichotomique sur les fins de segments.
+``schedule_from_blocks`` convertit la configuration des blocs d'un template
+sans passer par le widget.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterator, Sequence
+
+from brlok.models.session_template import BlockConfig
+
+PHASE_WORK = "work"
+PHASE_REST = "rest"
+
+MODE_40_20 = "40/20"
+MODE_PYRAMIDE = "pyramide"
+MODE_EMOM = "emom"
+MODE_TABATA = "tabata"
+MODE_ECHELLE = "echelle"
+
+# Durées minimales d'un segment (bornes des spin-boxes)
+MIN_SEGMENT_S = 5
+# EMOM : période d'une minute, travail plafonné pour laisser du repos
+EMOM_PERIOD_S = 60
+EMOM_MAX_WORK_S = 55
+# Tabata : 20 s / 10 s
+TABATA_WORK_S = 20
+TABATA_REST_S = 10
+# Échelle : travail allongé de ce pas à chaque round
+ECHELLE_STEP_S = 10
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Segment du programme : phase, durée (s), round (1-based), bloc (0-based)."""
+
+    phase: str
+    duration_s: float
+    round: int
+    block: int = 0
+
+
+class Schedule:
+    """Suite immuable de segments avec bornes cumulées (recherche en O(log n))."""
+
+    __slots__ = ("_segments", "_ends")
+
+    def __init__(self, segments: Sequence[Segment]) -> None:
+        self._segments = tuple(segments)
+        self._ends = array("d")
+        total = 0.0
+        for seg in self._segments:
+            total += seg.duration_s
+            self._ends.append(total)
+
+    @classmethod
+    def from_intervals(cls, intervals: Sequence[tuple[str, float, int]]) -> "Schedule":
+        """Programme à partir de tuples (phase, durée, round)."""
+        return cls([Segment(phase, duration, round_) for phase, duration, round_ in intervals])
+
+    @property
+    def total_s(self) -> float:
+        """Durée totale (s)."""
+        return self._ends[-1] if self._ends else 0.0
+
+    @property
+    def rounds(self) -> int:
+        """Round du dernier segment (0 si vide)."""
+        return self._segments[-1].round if self._segments else 0
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return iter(self._segments)
+
+    def __getitem__(self, index: int) -> Segment:
+        return self._segments[index]
+
+    def start_of(self, index: int) -> float:
+        """Instant de début du segment ``index`` (s)."""
+        return self._ends[index - 1] if index > 0 else 0.0
+
+    def end_of(self, index: int) -> float:
+        """Instant de fin du segment ``index`` (s)."""
+        return self._ends[index]
+
+    def locate(self, t: float) -> int:
+        """Rang du segment en cours à l'instant ``t`` (len(self) si terminé)."""
+        return bisect_right(self._ends, t)
+
+
+def fixed_schedule(work_s: int, rest_s: int, rounds: int, block: int = 0) -> Schedule:
+    """Travail / repos constants (40/20 et blocs de template)."""
+    return Schedule(_fixed_segments(work_s, rest_s, rounds, block))
+
+
+def _fixed_segments(work_s: int, rest_s: int, rounds: int, block: int = 0) -> list[Segment]:
+    segments = []
+    for r in range(1, rounds + 1):
+        segments.append(Segment(PHASE_WORK, work_s, r, block))
+        segments.append(Segment(PHASE_REST, rest_s, r, block))
+    return segments
+
+
+def pyramid_schedule(work_min: int, work_max: int, rounds: int) -> Schedule:
+    """Travail croissant de ``work_min`` à ``work_max``, repos = moitié du travail."""
+    segments = []
+    for r in range(1, rounds + 1):
+        if rounds <= 1:
+            work, rest = work_max, work_max // 2
+        else:
+            work = int(work_min + (work_max - work_min) * (r - 1) / (rounds - 1))
+            work, rest = max(MIN_SEGMENT_S, work), max(MIN_SEGMENT_S, work // 2)
+        segments.append(Segment(PHASE_WORK, work, r))
+        segments.append(Segment(PHASE_REST, rest, r))
+    return Schedule(segments)
+
+
+def emom_schedule(work_s: int, rounds: int) -> Schedule:
+    """Une minute par round : travail (plafonné) puis repos jusqu'à la minute."""
+    work = min(work_s, EMOM_MAX_WORK_S)
+    return fixed_schedule(work, EMOM_PERIOD_S - work, rounds)
+
+
+def tabata_schedule(rounds: int = 8) -> Schedule:
+    """Tabata : 20 s de travail, 10 s de repos."""
+    return fixed_schedule(TABATA_WORK_S, TABATA_REST_S, rounds)
+
+
+def ladder_schedule(work_s: int, rest_s: int, rounds: int, step_s: int = ECHELLE_STEP_S) -> Schedule:
+    """Échelle : travail allongé de ``step_s`` à chaque round, repos constant."""
+    segments = []
+    for r in range(1, rounds + 1):
+        segments.append(Segment(PHASE_WORK, work_s + (r - 1) * step_s, r))
+        segments.append(Segment(PHASE_REST, rest_s, r))
+    return Schedule(segments)
+
+
+def build_schedule(
+    mode: str,
+    *,
+    work_s: int = 40,
+    rest_s: int = 20,
+    rounds: int = 3,
+    work_min: int = 20,
+    work_max: int = 60,
+) -> Schedule:
+    """Programme du mode ``mode`` (MODE_*) ; mode inconnu → travail / repos constants."""
+    if mode == MODE_PYRAMIDE:
+        return pyramid_schedule(work_min, work_max, rounds)
+    if mode == MODE_EMOM:
+        return emom_schedule(work_s, rounds)
+    if mode == MODE_TABATA:
+        return tabata_schedule(rounds)
+    if mode == MODE_ECHELLE:
+        return ladder_schedule(work_s, rest_s, rounds)
+    return fixed_schedule(work_s, rest_s, rounds)
+
+
+def schedule_from_blocks(blocks_config: Sequence[BlockConfig]) -> Schedule:
+    """Programme d'une séance de template : les rounds de chaque bloc à la suite."""
+    segments: list[Segment] = []
+    for block, cfg in enumerate(blocks_config):
+        segments.extend(_fixed_segments(cfg.work_s, cfg.rest_s, cfg.rounds, block))
+    return Schedule(segments)
@@ -1,2 +1,17 @@
 # -*- coding: utf-8 -*-
 """Fixtures pytest pour Brlok."""
+import os
+from unittest.mock import patch
+
+import pytest
+
+# Widgets Qt testables sans serveur d'affichage (CI, headless)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_export_cache(tmp_path_factory):
+    """Cache des exports dans un répertoire temporaire (jamais dans les données utilisateur)."""
+    cache_dir = tmp_path_factory.mktemp("export_cache")
+    with patch("brlok.exports.cache._get_cache_dir", return_value=cache_dir):
+        yield cache_dir
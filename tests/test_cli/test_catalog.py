@@ -159,3 +159,20 @@ def test_catalog_list_grille_positions() -> None:
         assert "(2,6)" in result.output
         # Tri par position : A1 (0,0) avant C7 (2,6)
         assert result.output.index("A1") < result.output.index("C7")
+
+
+def test_catalog_new_grille_libre() -> None:
+    """catalog new --rows/--cols crée un catalogue en grille libre rempli."""
+    from brlok.models import CatalogEntry
+
+    with patch(
+        "brlok.cli.commands.add_catalog",
+        side_effect=lambda name, catalog: CatalogEntry(id="abc", name=name, catalog=catalog),
+    ) as mock_add:
+        result = runner.invoke(app, ["catalog", "new", "Spray", "--rows", "12", "--cols", "10"])
+    assert result.exit_code == 0
+    assert "120 prises" in result.output
+    name, catalog = mock_add.call_args[0]
+    assert name == "Spray"
+    assert catalog.free_grid
+    assert (catalog.grid.rows, catalog.grid.cols) == (12, 10)
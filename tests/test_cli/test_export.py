@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """Tests de la sous-commande export."""
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 from typer.testing import CliRunner
 
 from brlok.cli.commands import app
-from brlok.models import Block, Hold, Position, Session, SessionConstraints
+from brlok.models import Block, Catalog, CompletedSession, GridDimensions, Hold, Position, Session, SessionConstraints
 
 runner = CliRunner()
 
@@ -71,3 +73,41 @@ def test_export_file_not_found() -> None:
     result = runner.invoke(app, ["export", "txt", "absent.json", "-o", "out.txt"])
     assert result.exit_code == 1
     assert "introuvable" in result.output
+
+
+def test_export_pdf_history_since(tmp_path: Path) -> None:
+    """export pdf --history --since : livret des séances de la période."""
+    session = Session(
+        blocks=[Block(holds=[Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0))])],
+    )
+    now = datetime.now()
+    history = [
+        CompletedSession(id="r", date=now - timedelta(days=1), session=session),
+        CompletedSession(id="w", date=now - timedelta(days=5), session=session),
+        CompletedSession(id="o", date=now - timedelta(days=40), session=session),
+    ]
+    out = tmp_path / "livret.pdf"
+    with patch("brlok.cli.commands.iter_history", side_effect=lambda: iter(history)), \
+            patch("brlok.cli.commands.load_catalog", return_value=Catalog(holds=[], grid=GridDimensions(rows=7, cols=6))):
+        result = runner.invoke(app, ["export", "pdf", "--history", "--since", "7d", "-o", str(out)])
+        assert result.exit_code == 0
+        assert "2 séance(s)" in result.output
+        assert out.read_bytes().startswith(b"%PDF")
+        result = runner.invoke(app, ["export", "pdf", "--history", "--since", "hier", "-o", str(out)])
+        assert result.exit_code == 1
+    result = runner.invoke(app, ["export", "pdf", "-o", str(out)])
+    assert result.exit_code == 1
+
+
+def test_export_jsonl_stdout() -> None:
+    """export jsonl écrit l'historique sur la sortie standard (une séance par ligne)."""
+    session = Session(
+        blocks=[Block(holds=[Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0))])],
+    )
+    history = [CompletedSession(id=str(n), session=session) for n in range(3)]
+    with patch("brlok.cli.commands.iter_history", return_value=iter(history)):
+        result = runner.invoke(app, ["export", "jsonl", "--blocks"])
+    assert result.exit_code == 0
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    assert len(lines) == 3
+    assert "3 enregistrement(s)" in result.output
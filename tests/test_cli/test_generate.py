@@ -133,10 +133,13 @@ def test_generate_with_variety() -> None:
         ],
         grid=GridDimensions(rows=4, cols=8),
     )
-    with patch("brlok.cli.commands.load_catalog", return_value=catalog):
+    with patch("brlok.cli.commands.load_catalog", return_value=catalog), patch(
+        "brlok.cli.commands.load_collection"
+    ), patch("brlok.cli.commands.load_usage_prior", return_value={"A1": 3.0}) as prior:
         result = runner.invoke(app, ["generate", "--level", "2", "--variety"])
         assert result.exit_code == 0
         assert "variété" in result.output
+        prior.assert_called_once()
 
 
 def test_generate_constraints_too_strict() -> None:
@@ -199,3 +202,35 @@ def test_generate_with_template(tmp_path: Path) -> None:
             templates_path.write_text(orig_data)
         elif templates_path.exists():
             templates_path.unlink()
+
+
+def test_generate_template_niveaux_par_bloc() -> None:
+    """generate --template applique le niveau de chaque bloc du template (même plan que la GUI)."""
+    from brlok.generator import generate_session
+    from brlok.models.session_template import BlockConfig, SessionTemplate
+
+    tpl = SessionTemplate(
+        id="t", name="Montée", blocks_count=2, holds_per_block=4,
+        blocks_config=[BlockConfig(level=1), BlockConfig(level=5)],
+    )
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"H{r}{c}", level=r + 1, tags=[], position=Position(row=r, col=c))
+            for r in range(5)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=5, cols=6),
+    )
+    with (
+        patch("brlok.cli.commands.load_catalog", return_value=catalog),
+        patch("brlok.cli.commands.get_template_by_name", return_value=tpl),
+        patch("brlok.cli.commands.load_favorites", return_value=[]),
+        patch("brlok.cli.commands.generate_session", wraps=generate_session) as gen,
+    ):
+        result = runner.invoke(app, ["generate", "--template", "Montée", "--seed", "3"])
+    assert result.exit_code == 0, result.output
+    assert gen.call_args.kwargs["plan"].per_block_levels == ((1, 1), (5, 1))
+    blocks = [line.split(": ", 1)[1].split(" → ") for line in result.output.splitlines() if "Bloc " in line]
+    level_of = {h.id: h.level for h in catalog.holds}
+    assert {level_of[h] for h in blocks[0]} <= {1, 2}
+    assert {level_of[h] for h in blocks[1]} <= {4, 5}
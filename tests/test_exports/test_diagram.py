@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests du schéma du pan dans les exports."""
+from pathlib import Path
+
+import pytest
+
+from brlok.exports import export_markdown, export_pdf_booklet
+from brlok.exports import diagram
+from brlok.exports.diagram import RENDER_COUNTS, text_diagram
+from brlok.models import Block, Catalog, GridDimensions, Hold, Position, Session
+
+
+@pytest.fixture
+def catalog() -> Catalog:
+    """Pan 7×6 complet."""
+    return Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=1 + (r + c) % 5, tags=[], position=Position(row=r, col=c))
+            for r in range(7)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=7, cols=6),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches() -> None:
+    diagram._text_bases.clear()
+    RENDER_COUNTS.update(text=0, pdf=0)
+
+
+def test_text_diagram(catalog: Catalog) -> None:
+    """Numéros d'ordre à la place des prises, pieds du bloc marqués."""
+    hold_b3 = catalog.hold_index().get("B3")
+    hold_f1 = catalog.hold_index().get("F1")
+    block = Block(holds=[hold_b3, hold_f1], foot_positions=[(1, 0)])
+    lines = text_diagram(catalog, block)
+    assert lines[0].split() == ["A", "B", "C", "D", "E", "F"]
+    assert lines[1].split() == ["1", "·", "·", "·", "·", "·", "2"]
+    assert lines[3].split() == ["3", "·", "1", "·", "·", "·", "·"]
+    assert "*25" in lines[10]
+
+
+def test_fond_rendu_une_fois(tmp_path: Path, catalog: Catalog) -> None:
+    """30 blocs : un seul rendu du fond, en texte comme en PDF (Form XObject)."""
+    holds = catalog.holds
+    sessions = [
+        Session(blocks=[Block(holds=holds[i + j:i + j + 4]) for j in range(5)]) for i in range(6)
+    ]
+    export_markdown(sessions[0], tmp_path / "s.md", catalog=catalog)
+    export_markdown(sessions[1], tmp_path / "s2.md", catalog=catalog)
+    assert RENDER_COUNTS["text"] == 1
+    assert "```text" in (tmp_path / "s.md").read_text(encoding="utf-8")
+    out = tmp_path / "livret.pdf"
+    assert export_pdf_booklet(sessions, out, catalog=catalog) == 6
+    assert RENDER_COUNTS["pdf"] == 1
+    content = out.read_bytes()
+    assert content.count(b"/Subtype /Form") == 1
+
+
+def test_entetes_grille_large() -> None:
+    """Au-delà de Z, les colonnes sont AA, AB… comme les IDs des prises."""
+    catalog = Catalog(
+        holds=[Hold(id="AB1", level=2, tags=[], position=Position(row=0, col=27))],
+        grid=GridDimensions(rows=1, cols=28),
+        free_grid=True,
+    )
+    header = text_diagram(catalog, Block(holds=catalog.holds))[0].split()
+    assert header[25:] == ["Z", "AA", "AB"]
+
+
+def test_forme_pdf_par_taille_de_case(tmp_path: Path, catalog: Catalog) -> None:
+    """Deux tailles de case dans un même document : deux Form XObjects."""
+    from reportlab.platypus import SimpleDocTemplate
+
+    block = Block(holds=catalog.holds[:3])
+    story = [diagram.pdf_diagram_flowable(catalog, block, cell=size) for size in (26.0, 12.5, 26.0)]
+    out = tmp_path / "tailles.pdf"
+    SimpleDocTemplate(str(out)).build(story)
+    assert out.read_bytes().count(b"/Subtype /Form") == 2
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Tests du cache des exports."""
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from brlok.exports import export_pdf, export_session
+from brlok.exports.cache import evict, export_cache_key
+from brlok.models import Block, Catalog, GridDimensions, Hold, Position, Session
+
+
+@pytest.fixture
+def session() -> Session:
+    return Session(
+        blocks=[
+            Block(holds=[
+                Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0)),
+                Hold(id="B2", level=3, tags=[], position=Position(row=1, col=1)),
+            ]),
+        ],
+    )
+
+
+def _catalog(rows: int) -> Catalog:
+    return Catalog(
+        holds=[Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0))],
+        grid=GridDimensions(rows=rows, cols=6),
+    )
+
+
+def test_second_export_from_cache(tmp_path: Path, session: Session, _isolated_export_cache: Path) -> None:
+    """Le second export d'une séance identique est recopié depuis le cache."""
+    first, second = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    with patch("brlok.exports.cache.export_pdf", wraps=export_pdf) as render, \
+            patch("brlok.exports.cache.count") as count:
+        assert export_session(session, first) is False
+        assert export_session(session, second) is True
+    assert render.call_count == 1
+    assert [c.args for c in count.call_args_list] == [("export_cache.miss",), ("export_cache.hit",)]
+    assert second.read_bytes() == first.read_bytes()
+    assert len(list(_isolated_export_cache.iterdir())) == 1
+
+
+def test_cache_key_varies(session: Session) -> None:
+    """Format, catalogue et contenu de la séance changent la clé."""
+    base = export_cache_key(session, "pdf", _catalog(7))
+    assert export_cache_key(session, "pdf", _catalog(7)) == base
+    assert export_cache_key(session, "txt", _catalog(7)) != base
+    assert export_cache_key(session, "pdf", _catalog(8)) != base
+    other = session.model_copy(update={"blocks": session.blocks[:0]})
+    assert export_cache_key(other, "pdf", _catalog(7)) != base
+
+
+def test_miss_on_other_format(tmp_path: Path, session: Session) -> None:
+    """Un autre format est rendu, pas recopié."""
+    assert export_session(session, tmp_path / "s.txt") is False
+    assert export_session(session, tmp_path / "s.md") is False
+    assert export_session(session, tmp_path / "s2.txt") is True
+    assert "A1" in (tmp_path / "s2.txt").read_text(encoding="utf-8")
+
+
+def test_without_cache(tmp_path: Path, session: Session, _isolated_export_cache: Path) -> None:
+    """use_cache=False rend toujours et n'écrit rien dans le cache."""
+    assert export_session(session, tmp_path / "s.json", use_cache=False) is False
+    assert (tmp_path / "s.json").exists()
+    assert not list(_isolated_export_cache.iterdir())
+
+
+def test_evict_oldest_first(tmp_path: Path) -> None:
+    """L'éviction supprime les fichiers les moins récemment utilisés."""
+    for i, name in enumerate(("old.pdf", "mid.pdf", "new.pdf")):
+        f = tmp_path / name
+        f.write_bytes(b"x" * 100)
+        os.utime(f, ns=(i * 10**9, i * 10**9))
+    assert evict(tmp_path, max_bytes=150) == 2
+    assert [f.name for f in tmp_path.iterdir()] == ["new.pdf"]
@@ -6,7 +6,7 @@ import pytest
 
 from brlok.models import Block, Hold, Position, Session, SessionConstraints
 
-from brlok.exports import export_pdf
+from brlok.exports import export_pdf, export_pdf_booklet
 
 
 @pytest.fixture
@@ -34,3 +34,42 @@ def test_export_pdf(tmp_path: Path, sample_session: Session) -> None:
     content = out.read_bytes()
     assert content.startswith(b"%PDF")
     assert len(content) > 500
+
+
+def test_export_pdf_booklet(tmp_path: Path, sample_session: Session) -> None:
+    """Livret : une page par séance, séances lues depuis un itérateur."""
+    out = tmp_path / "livret.pdf"
+    count = export_pdf_booklet((sample_session for _ in range(40)), out)
+    assert count == 40
+    content = out.read_bytes()
+    assert content.startswith(b"%PDF")
+    assert content.count(b"/Type /Page\n") >= 40
+
+
+def test_lazy_story_consommee_par_la_tete(tmp_path: Path) -> None:
+    """Hypothèse sur reportlab : build consomme la story par la tête, jamais plus de lookahead d'avance."""
+    from reportlab.platypus import Spacer
+
+    from brlok.exports.exporters import _LazyStory, _pdf_doc
+
+    pulled = 0
+    peak = 0
+
+    class Story(_LazyStory):
+        def __len__(self) -> int:
+            nonlocal peak
+            n = super().__len__()
+            peak = max(peak, n)
+            return n
+
+    def source():
+        nonlocal pulled
+        for _ in range(500):
+            pulled += 1
+            yield Spacer(1, 40)
+
+    story = Story(source(), lookahead=8)
+    _pdf_doc(tmp_path / "lazy.pdf").build(story)
+    assert pulled == 500
+    assert story.drained
+    assert peak <= 8
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Tests des exports en flux (JSON Lines, tableau JSON, gzip)."""
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+from brlok.exports import export_stream
+from brlok.models import Block, CompletedSession, Hold, Position, Session
+
+
+def _session(ids: list[str]) -> Session:
+    return Session(
+        blocks=[Block(holds=[Hold(id=i, level=2, tags=[], position=Position(row=0, col=n))]) for n, i in enumerate(ids)]
+    )
+
+
+def test_jsonl_depuis_generateur(tmp_path: Path) -> None:
+    """Une séance par ligne, relue à l'identique ; l'itérateur est consommé une fois."""
+    out = tmp_path / "sessions.jsonl"
+    count = export_stream((_session([f"A{n}", "B1"]) for n in range(1, 51)), out)
+    assert count == 50
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 50
+    assert Session.model_validate_json(lines[3]).blocks[0].holds[0].id == "A4"
+
+
+def test_blocs_gzip_et_tableau(tmp_path: Path) -> None:
+    """Un bloc par ligne avec la séance d'origine ; gzip par suffixe ; tableau JSON."""
+    entry = CompletedSession(
+        id="s1", date=datetime(2026, 3, 1, 18, 30), session=_session(["A1", "B1"]), block_statuses={1: "fail"}
+    )
+    out = tmp_path / "blocs.jsonl.gz"
+    assert export_stream([entry], out, unit="block") == 2
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["index"] for r in records] == [0, 1]
+    assert records[1]["session_id"] == "s1" and records[1]["status"] == "fail"
+    assert "status" not in records[0]
+    array_out = tmp_path / "favoris.json"
+    assert export_stream([entry.session.blocks[0]], array_out, fmt="json") == 1
+    assert json.loads(array_out.read_text(encoding="utf-8"))[0]["holds"][0]["id"] == "A1"
+    empty = tmp_path / "vide.json"
+    assert export_stream([], empty, fmt="json") == 0
+    assert json.loads(empty.read_text(encoding="utf-8")) == []
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Tests de la vérification de faisabilité (check_feasibility)."""
+from brlok.generator import check_feasibility, generate_session
+from brlok.generator.feasibility import (
+    BINDING_EXCLUDED_TAGS,
+    BINDING_LEVEL,
+    BINDING_REQUIRED_TAGS,
+    BINDING_TAGS_CONFLICT,
+)
+from brlok.models import Catalog, GridDimensions, Hold, Position, SessionConstraints
+
+
+def _catalog() -> Catalog:
+    # 6 prises niveau 2 (3 crimp dont 1 pocket), 2 prises niveau 4, 1 inactive
+    holds = [
+        Hold(id="A1", level=2, tags=["crimp"], position=Position(row=0, col=0)),
+        Hold(id="B1", level=2, tags=["crimp"], position=Position(row=0, col=1)),
+        Hold(id="C1", level=2, tags=["crimp", "pocket"], position=Position(row=0, col=2)),
+        Hold(id="D1", level=2, tags=[], position=Position(row=0, col=3)),
+        Hold(id="E1", level=2, tags=["sloper"], position=Position(row=0, col=4)),
+        Hold(id="F1", level=2, tags=[], position=Position(row=0, col=5)),
+        Hold(id="A2", level=4, tags=["crimp"], position=Position(row=1, col=0)),
+        Hold(id="B2", level=4, tags=[], position=Position(row=1, col=1)),
+        Hold(id="C2", level=2, tags=["crimp"], position=Position(row=1, col=2), active=False),
+    ]
+    return Catalog(holds=holds, grid=GridDimensions(rows=7, cols=6))
+
+
+def test_count_active_par_tags() -> None:
+    """Comptages de l'index : niveau, tags requis (au moins un), tags exclus."""
+    index = _catalog().hold_index()
+    assert index.count_active(2, 2) == 6
+    assert index.count_active(1, 5) == 8
+    assert index.count_active(2, 2, ["crimp"]) == 3
+    assert index.count_active(2, 2, ["crimp", "sloper"], ["pocket"]) == 3
+
+
+def test_check_feasibility_contrainte_limitante() -> None:
+    """Blocs réduits et contrainte limitante, cohérents avec generate_session."""
+    catalog = _catalog()
+    ok = check_feasibility(
+        catalog, SessionConstraints(target_level=2, enchainements=4), level_tolerance=0, blocks_count=2
+    )
+    assert ok.ok and ok.eligible == 6 and ok.blocks[0].per_position == [6, 6, 6, 6]
+
+    level = check_feasibility(
+        catalog, SessionConstraints(target_level=2, enchainements=8), level_tolerance=0, blocks_count=1
+    )
+    assert not level.ok and level.blocks[0].holds_possible == 6
+    assert level.blocks[0].binding == BINDING_LEVEL
+
+    constraints = SessionConstraints(target_level=2, required_tags=["crimp"], enchainements=4)
+    req = check_feasibility(catalog, constraints, level_tolerance=0, blocks_count=1)
+    assert req.blocks[0].binding == BINDING_REQUIRED_TAGS
+    session = generate_session(
+        catalog, target_level=2, level_tolerance=0, blocks_count=1, holds_per_block=4,
+        required_tags=["crimp"], seed=1,
+    )
+    assert len(session.blocks[0].holds) == req.blocks[0].holds_possible == 3
+
+    exc = check_feasibility(
+        catalog,
+        SessionConstraints(target_level=2, excluded_tags=["crimp", "sloper"], enchainements=3),
+        level_tolerance=0,
+        blocks_count=1,
+    )
+    assert exc.blocks[0].holds_possible == 2 and exc.blocks[0].binding == BINDING_EXCLUDED_TAGS
+    assert "Bloc 1 : 2 prises sur 3" in exc.summary()
+
+    conflict = check_feasibility(
+        catalog, SessionConstraints(target_level=2, required_tags=["crimp"], excluded_tags=["crimp"])
+    )
+    assert conflict.binding == BINDING_TAGS_CONFLICT and not conflict.ok
+
+    empty = check_feasibility(catalog, SessionConstraints(target_level=5), level_tolerance=0)
+    assert empty.eligible == 0 and empty.binding == BINDING_LEVEL
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Tests des plans de génération (templates compilés)."""
+from brlok.generator import generate_session
+from brlok.generator.plan import PLAN_CACHE_SIZE, clear_plan_cache, compile_template
+from brlok.models import Catalog, GridDimensions, Hold, Position
+from brlok.models.session_template import BlockConfig, SessionTemplate
+
+
+def _template(**kwargs) -> SessionTemplate:
+    data = dict(
+        id="t1",
+        name="Pyramide",
+        blocks_config=[
+            BlockConfig(level="facile", work_s=30, rest_s=15, rounds=2),
+            BlockConfig(level="difficile"),
+        ],
+        blocks_count=2,
+        holds_per_block=5,
+        distribution_pattern="pyramide",
+    )
+    data.update(kwargs)
+    return SessionTemplate(**data)
+
+
+def test_compile_template_et_cache() -> None:
+    """Niveaux par bloc et par position pré-calculés ; cache par id + contenu."""
+    template = _template()
+    plan = compile_template(template)
+    assert plan.per_block_levels == ((2, 1), (4, 1))
+    assert plan.position_levels[1] == (3, 4, 5, 4, 3)
+    assert plan.first_timing == (30, 15, 2)
+    assert plan.levels_for(0, 5) == [1, 2, 3, 2, 1]
+    assert plan.levels_for(0, 4) is None
+    assert compile_template(_template()) is plan
+    changed = compile_template(_template(holds_per_block=6))
+    assert changed is not plan and changed.content_hash != plan.content_hash
+    # Template ne couvrant pas tous les blocs : pas de niveaux par bloc
+    assert compile_template(template, blocks_count=3).per_block_levels is None
+
+
+def test_cache_des_plans_borne() -> None:
+    """Au-delà de PLAN_CACHE_SIZE plans, le moins récemment utilisé est oublié."""
+    clear_plan_cache()
+    plans = [compile_template(_template(id=f"t{i}")) for i in range(PLAN_CACHE_SIZE)]
+    assert compile_template(_template(id="t0")) is plans[0]  # t0 devient le plus récent
+    compile_template(_template(id="extra"))
+    assert compile_template(_template(id="t0")) is plans[0]
+    assert compile_template(_template(id="t1")) is not plans[1]  # t1 a été oublié
+
+
+def test_generate_session_avec_plan() -> None:
+    """Avec un plan, même séance qu'avec les niveaux par bloc explicites."""
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=1 + (r + c) % 5, tags=[], position=Position(row=r, col=c))
+            for r in range(7)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=7, cols=6),
+    )
+    plan = compile_template(_template())
+    kwargs = dict(target_level=3, blocks_count=2, holds_per_block=5, distribution_pattern="pyramide", seed=11)
+    with_plan = generate_session(catalog, plan=plan, **kwargs)
+    explicit = generate_session(catalog, per_block_levels=[(2, 1), (4, 1)], **kwargs)
+    assert with_plan == explicit
+    assert all(1 <= h.level <= 3 for h in with_plan.blocks[0].holds)
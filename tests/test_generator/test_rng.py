@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Tests du générateur aléatoire versionné (Pcg32)."""
+import random
+
+import pytest
+
+from brlok.generator import generate_session
+from brlok.generator.rng import Pcg32, make_rng
+from brlok.models import Catalog, GridDimensions, Hold, Position
+
+
+def test_pcg32_vecteur_de_reference() -> None:
+    """Sorties identiques à l'implémentation de référence (pcg32_srandom_r(42, 54))."""
+    rng = Pcg32(42, stream=54)
+    assert [rng.next_u32() for _ in range(6)] == [
+        0xA15C02B7, 0x7B47F409, 0xBA1D3330, 0x83D2F293, 0xBFA4784B, 0xCBED606E,
+    ]
+
+
+def test_pcg32_routines_de_tirage() -> None:
+    """choice / choices / sample / randint : bornes, poids, unicité, flux indépendants."""
+    rng = Pcg32(7)
+    assert all(1 <= rng.randint(1, 6) <= 6 for _ in range(500))
+    assert all(0.0 <= rng.random() < 1.0 for _ in range(500))
+    assert rng.getrandbits(0) == 0 and rng.getrandbits(100) < 1 << 100
+    assert set(rng.choices("ab", weights=[0.0, 1.0], k=50)) == {"b"}
+    sample = rng.sample(range(10), 10)
+    assert sorted(sample) == list(range(10))
+    with pytest.raises(ValueError):
+        rng.sample([1, 2], 3)
+    with pytest.raises(IndexError):
+        rng.choice([])
+    a, b = Pcg32(7).spawn(2)
+    assert [a.next_u32() for _ in range(4)] != [b.next_u32() for _ in range(4)]
+    assert isinstance(make_rng(1, 0), random.Random)
+    with pytest.raises(ValueError):
+        make_rng(1, 99)
+
+
+def test_generate_session_graine_stable() -> None:
+    """Même graine → même séance, valeurs figées (indépendantes de la version de Python)."""
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=1 + (r + c) % 3, tags=[], position=Position(row=r, col=c))
+            for r in range(4)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=4, cols=6),
+    )
+    session = generate_session(
+        catalog, target_level=2, blocks_count=2, holds_per_block=4, variety=True, seed=2024
+    )
+    assert [[h.id for h in b.holds] for b in session.blocks] == [
+        ["D3", "E1", "F3", "C3"],
+        ["D2", "A1", "C1", "A2"],
+    ]
+    assert [b.foot_positions for b in session.blocks] == [
+        [(0, 4), (1, 2)],
+        [(3, 0), (1, 0), (0, 2), (1, 3)],
+    ]
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Tests du score des séances candidates (meilleur de K)."""
+from brlok.generator import generate_session
+from brlok.generator.scoring import score_sessions
+from brlok.models import Block, Catalog, GridDimensions, Hold, Position, Session, SessionConstraints
+
+
+def _catalog() -> Catalog:
+    return Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=1 + (r + c) % 5, tags=["crimp"] if c % 2 else [],
+                 position=Position(row=r, col=c))
+            for r in range(4)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=4, cols=6),
+    )
+
+
+def _session(catalog: Catalog, *blocks: list[str]) -> Session:
+    index = catalog.hold_index()
+    return Session(
+        blocks=[Block(holds=[index.get(h) for h in ids]) for ids in blocks],
+        constraints=SessionConstraints(target_level=3),
+    )
+
+
+def test_score_sessions_criteres() -> None:
+    """Niveau juste, tags couverts, pas de réutilisation et blocs étendus → meilleur score."""
+    catalog = _catalog()
+    # C1, B2, A3 : niveau 3 ; A1 : niveau 1
+    good = _session(catalog, ["C1", "A3"], ["B2", "F4"])
+    off_level = _session(catalog, ["A1", "B1"], ["B2", "F4"])
+    reused = _session(catalog, ["C1", "A3"], ["C1", "A3"])
+    scores = score_sessions(catalog, [good, off_level, reused], target_level=3, required_tags=["crimp"])
+    assert scores[0] > scores[1]
+    assert scores[0] > scores[2]
+    assert score_sessions(catalog, [], target_level=3) == []
+
+
+def test_generate_session_best_of() -> None:
+    """best_of garde la candidate la mieux notée ; reproductible avec seed."""
+    catalog = _catalog()
+    kwargs = dict(target_level=3, blocks_count=3, holds_per_block=4, seed=7)
+    best = generate_session(catalog, best_of=32, **kwargs)
+    assert generate_session(catalog, best_of=32, **kwargs) == best
+    [best_score, single_score] = score_sessions(
+        catalog, [best, generate_session(catalog, **kwargs)], target_level=3
+    )
+    assert best_score >= single_score
+    assert len(best.blocks) == 3
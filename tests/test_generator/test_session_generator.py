@@ -290,6 +290,7 @@ def test_generate_session_distribution_progressive() -> None:
         holds_per_block=5,
         distribution_pattern="progressive",
         seed=42,
+        rng_version=0,  # tirage de référence (±1 autour de chaque niveau : dépend de la graine)
     )
     assert len(session.blocks) == 1
     block = session.blocks[0]
@@ -343,3 +344,79 @@ def test_generate_session_performance_nfr1() -> None:
     )
     elapsed = time.perf_counter() - start
     assert elapsed < 5.0, f"Génération trop lente : {elapsed:.2f} s (NFR1: < 5 s)"
+
+
+def test_generate_session_grand_catalogue() -> None:
+    """Spray wall 40×30 : génération par seaux de niveaux, prises uniques par bloc."""
+    from brlok.storage.catalog_store import create_default_catalog
+
+    base = create_default_catalog(GridDimensions(rows=40, cols=30))
+    holds = [h.model_copy(update={"level": 1 + i % 5}) for i, h in enumerate(base.holds)]
+    catalog = base.model_copy(update={"holds": holds})
+    session = generate_session(catalog, target_level=3, blocks_count=5, holds_per_block=12, seed=7)
+    assert len(session.blocks) == 5
+    for block in session.blocks:
+        ids = [h.id for h in block.holds]
+        assert len(ids) == 12 == len(set(ids))
+        assert all(2 <= h.level <= 4 for h in block.holds)
+
+
+def test_generate_session_usage_prior_variete() -> None:
+    """Avec variety, les prises très utilisées (usage_prior) sont rarement tirées."""
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}1", level=2, tags=[], position=Position(row=0, col=c))
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=1, cols=6),
+    )
+    prior = {"A1": 500.0, "B1": 500.0, "C1": 500.0}
+    picks: dict[str, int] = {}
+    for seed in range(40):
+        session = generate_session(
+            catalog, target_level=2, blocks_count=1, holds_per_block=1,
+            variety=True, usage_prior=prior, seed=seed,
+        )
+        hid = session.blocks[0].holds[0].id
+        picks[hid] = picks.get(hid, 0) + 1
+    assert sum(picks.get(h, 0) for h in prior) <= 2
+    # Sans variety, le prior est ignoré
+    plain = generate_session(catalog, target_level=2, blocks_count=1, holds_per_block=6, usage_prior=prior, seed=1)
+    assert len(plain.blocks[0].holds) == 6
+
+
+def test_regenerate_block_remplace_un_seul_bloc() -> None:
+    """regenerate_block : seul le bloc visé change ; variété vis-à-vis des autres blocs."""
+    import pytest
+
+    from brlok.generator import regenerate_block
+
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=2, tags=[], position=Position(row=r, col=c))
+            for r in range(2)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=2, cols=6),
+    )
+    session = generate_session(catalog, target_level=2, blocks_count=3, holds_per_block=4, variety=True, seed=3)
+    updated = regenerate_block(session, 1, catalog, seed=5)
+    assert updated.blocks[0] == session.blocks[0]
+    assert updated.blocks[2] == session.blocks[2]
+    assert [h.id for h in updated.blocks[1].holds] != [h.id for h in session.blocks[1].holds]
+    assert len(updated.blocks[1].holds) == 4
+    assert updated.constraints == session.constraints
+    assert regenerate_block(session, 1, catalog, seed=5) == updated
+    # Avec variété, le bloc refait réutilise moins les prises des autres blocs
+    others = {h.id for i in (0, 2) for h in session.blocks[i].holds}
+    plain = session.constraints.model_copy(update={"variety": False})
+
+    def _reused(constraints) -> int:
+        return sum(
+            len(others & {h.id for h in regenerate_block(session, 1, catalog, constraints, seed=s).blocks[1].holds})
+            for s in range(100)
+        )
+
+    assert _reused(session.constraints) < _reused(plain)
+    with pytest.raises(IndexError):
+        regenerate_block(session, 3, catalog)
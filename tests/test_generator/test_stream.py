@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Tests de la séance continue (iter_blocks, BlockStream)."""
+from itertools import islice
+
+from brlok.generator import BlockStream, iter_blocks
+from brlok.models import Catalog, GridDimensions, Hold, Position, SessionConstraints
+
+
+def _catalog() -> Catalog:
+    return Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=2, tags=[], position=Position(row=r, col=c))
+            for r in range(3)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=3, cols=6),
+    )
+
+
+def test_iter_blocks_sans_fin_et_reproductible() -> None:
+    """Flux sans fin, reproductible avec seed ; arrêt si aucune prise éligible."""
+    catalog = _catalog()
+    constraints = SessionConstraints(target_level=2, enchainements=4, variety=True)
+    blocks = list(islice(iter_blocks(catalog, constraints, seed=1), 200))
+    assert len(blocks) == 200
+    assert all(len(b.holds) == 4 for b in blocks)
+    assert list(islice(iter_blocks(catalog, constraints, seed=1), 5)) == blocks[:5]
+    assert list(iter_blocks(catalog, SessionConstraints(target_level=5, enchainements=4), seed=1)) == []
+
+
+def test_block_stream_prefetch() -> None:
+    """Le tampon garde `prefetch` blocs d'avance ; None quand le flux est épuisé."""
+    catalog = _catalog()
+    source = iter_blocks(catalog, SessionConstraints(target_level=2, enchainements=3), seed=2)
+    stream = BlockStream(islice(source, 4), prefetch=2)
+    assert len(stream) == 0
+    first = stream.next_block()
+    assert first is not None and len(stream) == 1
+    stream.fill()
+    assert len(stream) == 2
+    assert [stream.next_block() is not None for _ in range(3)] == [True, True, True]
+    assert not stream.has_next()
+    assert stream.next_block() is None
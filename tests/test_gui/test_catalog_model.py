@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Tests du modèle de table des prises et du proxy de recherche."""
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from brlok.gui.catalog_model import (
+    COL_ACTIVE,
+    COL_LEVEL,
+    COL_TAGS,
+    HoldFilterProxyModel,
+    HoldTableModel,
+)
+from brlok.gui.catalog_widget import CatalogWidget
+from brlok.models import Catalog, GridDimensions, Hold, Position
+from brlok.storage.catalog_ops import update_hold_level
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """QApplication nécessaire pour les modèles Qt."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _catalog() -> Catalog:
+    return Catalog(
+        holds=[
+            Hold(id="B1", level=3, tags=["réglette"], position=Position(row=1, col=0)),
+            Hold(id="A1", level=2, tags=["bac"], position=Position(row=0, col=0)),
+            Hold(id="A2", level=4, tags=[], position=Position(row=0, col=1), active=False),
+        ],
+        grid=GridDimensions(rows=2, cols=2),
+    )
+
+
+def test_model_tri_par_position_et_index_id(qapp) -> None:
+    """Lignes triées par (ligne, colonne) ; row_of en O(1)."""
+    model = HoldTableModel(_catalog())
+    assert model.rowCount() == 3
+    assert [model.hold_at(r).id for r in range(3)] == ["A1", "A2", "B1"]
+    assert model.row_of("B1") == 2
+    assert model.row_of("Z9") == -1
+    assert model.data(model.index(1, COL_ACTIVE), Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+
+
+def test_set_catalog_emet_datachanged_sur_ligne_modifiee(qapp) -> None:
+    """Modification d'une prise → dataChanged sur sa seule ligne, pas de reset."""
+    catalog = _catalog()
+    model = HoldTableModel(catalog)
+    changed: list[tuple[int, int]] = []
+    resets: list[bool] = []
+    model.dataChanged.connect(lambda tl, br, roles=None: changed.append((tl.row(), br.row())))
+    model.modelReset.connect(lambda: resets.append(True))
+    model.set_catalog(update_hold_level(catalog, "B1", 5))
+    assert changed == [(2, 2)]
+    assert not resets
+    assert model.data(model.index(2, COL_LEVEL)) == "5"
+
+
+def test_setdata_valide_et_emet_hold_edited(qapp) -> None:
+    """Saisie valide → holdEdited ; saisie invalide refusée."""
+    model = HoldTableModel(_catalog())
+    edits: list[tuple] = []
+    model.holdEdited.connect(lambda hid, col, val: edits.append((hid, col, val)))
+    assert not model.setData(model.index(0, COL_LEVEL), "9")
+    assert not model.setData(model.index(0, COL_LEVEL), "abc")
+    assert model.setData(model.index(0, COL_LEVEL), "4")
+    assert model.setData(model.index(0, COL_TAGS), "bac, Pince")
+    assert model.setData(model.index(0, COL_ACTIVE), Qt.CheckState.Unchecked.value, Qt.ItemDataRole.CheckStateRole)
+    assert edits == [("A1", COL_LEVEL, 4), ("A1", COL_TAGS, ["bac", "Pince"]), ("A1", COL_ACTIVE, False)]
+
+
+def test_proxy_filtre_id_et_tags(qapp) -> None:
+    """Recherche insensible à la casse sur l'ID et les tags."""
+    model = HoldTableModel(_catalog())
+    proxy = HoldFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.set_search("RÉG")
+    assert proxy.rowCount() == 1
+    proxy.set_search("a")
+    assert proxy.rowCount() == 2
+    proxy.set_search("a2")
+    assert proxy.rowCount() == 1
+    proxy.set_search("")
+    assert proxy.rowCount() == 3
+
+
+def test_catalog_widget_edition_sauvegarde(qapp) -> None:
+    """Édition via le modèle → catalogue mis à jour et on_save appelé."""
+    saved: list[Catalog] = []
+    widget = CatalogWidget(_catalog(), on_save=saved.append)
+    model = widget._model
+    assert model.setData(model.index(model.row_of("A1"), COL_LEVEL), "5")
+    assert saved and next(h for h in saved[-1].holds if h.id == "A1").level == 5
+    assert model.data(model.index(model.row_of("A1"), COL_LEVEL)) == "5"
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Tests de la table de styles des cellules (colors)."""
+from brlok.gui.colors import (
+    EMPTY_COLOR,
+    INACTIVE_COLOR,
+    LEVEL_COLORS_SATURATED,
+    get_cell_style,
+    rebuild_cell_styles,
+)
+
+
+def test_get_cell_style_memoise() -> None:
+    """Même clé → même objet str (aucun formatage sur le chemin de rafraîchissement)."""
+    s1 = get_cell_style("A1", 3, True, True)
+    s2 = get_cell_style("B2", 3, True, True)
+    assert s1 is s2
+    assert LEVEL_COLORS_SATURATED[3] in s1
+    assert "font-weight: bold" in s1
+
+
+def test_get_cell_style_first_hold_border() -> None:
+    """Première prise surlignée : bordure 4px ; sinon 2px."""
+    assert "border: 4px" in get_cell_style("A1", 2, True, True, first=True)
+    assert "border: 2px" in get_cell_style("A1", 2, True, True)
+    # first sans highlight : pas de bordure épaisse
+    assert "border: 2px" in get_cell_style("A1", 2, True, False, first=True)
+
+
+def test_get_cell_style_empty_and_inactive() -> None:
+    """Case vide et prise inactive."""
+    assert EMPTY_COLOR in get_cell_style("·", 2, True, False)
+    assert INACTIVE_COLOR in get_cell_style("A1", 2, False, False)
+
+
+def test_get_cell_style_level_hors_table() -> None:
+    """Niveau hors 1–6 : fallback gris, mémorisé."""
+    s1 = get_cell_style("A1", 9, True, False)
+    assert "#f5f5f5" in s1
+    assert get_cell_style("A1", 9, True, False) is s1
+
+
+def test_rebuild_cell_styles_invalide_la_table() -> None:
+    """Changement de thème : nouvelle table (nouveaux objets)."""
+    before = get_cell_style("A1", 1, True, False)
+    rebuild_cell_styles("dark")
+    try:
+        after = get_cell_style("A1", 1, True, False)
+        assert after == before
+        assert after is not before
+    finally:
+        rebuild_cell_styles("light")
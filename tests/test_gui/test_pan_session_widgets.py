@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """Tests d'instanciation des widgets Pan et Session (tests manuels complémentaires)."""
+from unittest.mock import patch
+
 import pytest
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 from brlok.gui.pan_widget import PanWidget
@@ -42,3 +45,193 @@ def test_timer_widget_instanciation(qapp) -> None:
     """IntervalTimerWidget s'instancie sans erreur (8.3)."""
     widget = IntervalTimerWidget(work_s=40, rest_s=20, rounds=3)
     assert widget is not None
+
+
+def test_timer_widget_temps_du_moteur(qapp) -> None:
+    """L'affichage suit l'horloge du moteur, même avec des ticks manqués."""
+    from brlok.timer import IntervalEngine
+    from brlok.timer.cues import CueTrack
+
+    clock = [0.0]
+    widget = IntervalTimerWidget(work_s=40, rest_s=20, rounds=2, compact=True)
+    played: list[str] = []
+    widget._cue_bank.play = played.append
+    totals: list[float] = []
+    widget.finished.connect(totals.append)
+    widget._on_start()
+    widget._timer.stop()
+    widget._cancel_cues()
+    widget._cue_track = CueTrack(widget._build_schedule())
+    widget._engine = IntervalEngine(widget._build_schedule(), clock=lambda: clock[0])
+    widget._engine.start()
+    clock[0] = 65.2  # un seul tick après 65 s : round 2, travail, 35 s restantes
+    widget._tick()
+    assert (widget._phase, widget._current_round, widget._remaining_s) == ("work", 2, 35)
+    # Signaux manqués pendant le blocage ignorés ; ceux des 0,5 s à venir programmés d'avance
+    assert not widget._cue_timer.isActive()
+    timers = len(widget.findChildren(QTimer))
+    clock[0] = 96.6  # décompte 3-2-1 avant le repos (97, 98, 99 s)
+    widget._tick()
+    assert widget._cue_timer.isActive() and widget._armed_cues == ["countdown"]
+    clock[0] = 97.0
+    widget._cue_timer.stop()
+    widget._on_cue_due()
+    assert played == ["countdown"]
+    # Un seul minuteur réarmé : aucun QTimer créé par signal
+    assert len(widget.findChildren(QTimer)) == timers
+    clock[0] = 500.0
+    widget._tick()
+    assert totals == [120.0]
+    assert widget._start_btn.isEnabled()
+
+
+def test_pan_widget_resize_regroupe(qapp) -> None:
+    """Rafale de redimensionnements → une seule passe de calcul des cellules."""
+    catalog = Catalog(
+        holds=[Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0))],
+        grid=GridDimensions(rows=4, cols=8),
+    )
+    widget = PanWidget(catalog)
+    widget.show()
+    qapp.processEvents()
+    widget._resize_timer.stop()
+    passes = widget._layout_passes
+    for i in range(50):
+        widget.resize(400 + i * 4, 300 + i * 3)
+        qapp.sendPostedEvents()
+    assert widget._resize_timer.isActive()
+    # Anti-rebond : minuteur relancé même s'il est déjà actif
+    with patch.object(widget._resize_timer, "start") as restart:
+        widget.schedule_cell_sizes_update()
+        widget.schedule_cell_sizes_update()
+    assert restart.call_count == 2
+    assert widget._layout_passes == passes
+    widget._resize_timer.timeout.emit()
+    assert widget._layout_passes - passes == 1
+    # Taille inchangée : aucun recalcul
+    before = widget._layout_passes
+    widget._update_cell_sizes()
+    assert widget._layout_passes == before
+    widget.close()
+
+
+def test_session_widget_regenere_bloc_courant(qapp) -> None:
+    """Refaire régénère le bloc courant sans toucher aux autres blocs."""
+    from brlok.generator import generate_session
+
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}1", level=2, tags=[], position=Position(row=0, col=c))
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=4, cols=8),
+    )
+    session = generate_session(catalog, target_level=2, blocks_count=2, holds_per_block=3, seed=1)
+    first = session.blocks[0]
+    widget = SessionWidget(catalog, session)
+    widget._block_index = 1
+    widget._block_statuses[1] = "fail"
+    old = [h.id for h in session.blocks[1].holds]
+    widget._on_refaire()
+    assert session.blocks[0] is first
+    assert [h.id for h in session.blocks[1].holds] != old
+    assert 1 not in widget._block_statuses
+
+
+def test_session_widget_regenere_bloc_template_progressif(qapp) -> None:
+    """Refaire garde le motif et le niveau propre au bloc (séance de template, favori en tête)."""
+    from brlok.config.difficulty import get_distribution_levels
+    from brlok.generator import GenerationParams, generate_session
+    from brlok.models import Block
+
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=r + 1, tags=[], position=Position(row=r, col=c))
+            for r in range(5)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=5, cols=6),
+    )
+    favorite = Block(holds=catalog.holds[:2])
+    levels = [(1, 0), (3, 2)]
+    session = generate_session(
+        catalog, target_level=3, blocks_count=2, holds_per_block=5, favorite_blocks=[favorite],
+        distribution_pattern="progressive", per_block_levels=levels, seed=3,
+    )
+    widget = SessionWidget(catalog)
+    widget.set_session(session, params=GenerationParams(
+        level_tolerance=1, distribution_pattern="progressive",
+        per_block_levels=tuple(levels), favorites_count=1,
+    ))
+    for _ in range(10):
+        widget._block_index = 1
+        widget._on_regenerate_block()
+        assert {h.level for h in session.blocks[1].holds} == {1}
+        widget._block_index = 2
+        widget._on_regenerate_block()
+        expected = get_distribution_levels("progressive", 5, 3)
+        assert all(abs(h.level - lev) <= 1 for h, lev in zip(session.blocks[2].holds, expected))
+    assert session.blocks[0] is favorite
+
+
+def test_session_widget_generer_garde_parametres_template(qapp) -> None:
+    """« Générer » conserve les paramètres retournés : Refaire reprend le niveau du bloc du template."""
+    from brlok.generator import GenerationParams, generate_session
+    from brlok.generator.plan import compile_template
+    from brlok.models.session_template import BlockConfig, SessionTemplate
+
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}{r + 1}", level=r + 1, tags=[], position=Position(row=r, col=c))
+            for r in range(5)
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=5, cols=6),
+    )
+    template = SessionTemplate(
+        id="t", name="T", blocks_count=2, holds_per_block=4,
+        blocks_config=[BlockConfig(level=1), BlockConfig(level=5)],
+    )
+    plan = compile_template(template, 2)
+    params = GenerationParams(level_tolerance=1, distribution_pattern=plan.distribution_pattern, plan=plan)
+
+    def on_generate(level, tolerance, blocks, enchainements, template_id):
+        session = generate_session(
+            catalog, target_level=level, level_tolerance=tolerance, blocks_count=2,
+            enchainements=4, plan=plan, seed=1,
+        )
+        return session, template, params
+
+    widget = SessionWidget(catalog, on_generate=on_generate)
+    widget._on_generate_clicked()
+    assert widget._generation_params is params
+    for _ in range(10):
+        widget._block_index = 1
+        widget._on_regenerate_block()
+        assert {h.level for h in widget._session.blocks[1].holds} <= {4, 5}
+
+
+def test_session_widget_seance_continue(qapp) -> None:
+    """Avec un flux, « Suivant » sur le dernier bloc ajoute un bloc à la séance."""
+    from brlok.generator import BlockStream, iter_blocks
+    from brlok.models import Session, SessionConstraints
+
+    catalog = Catalog(
+        holds=[
+            Hold(id=f"{chr(65 + c)}1", level=2, tags=[], position=Position(row=0, col=c))
+            for c in range(6)
+        ],
+        grid=GridDimensions(rows=4, cols=8),
+    )
+    constraints = SessionConstraints(target_level=2, enchainements=3)
+    stream = BlockStream(iter_blocks(catalog, constraints, seed=4))
+    session = Session(blocks=[stream.next_block()], constraints=constraints)
+    widget = SessionWidget(catalog)
+    widget.set_session(session, stream=stream)
+    widget._pause_between_spin.setValue(0)
+    assert widget._next_btn.isEnabled()
+    for _ in range(5):
+        widget._on_next()
+    assert len(session.blocks) == 6
+    assert widget._block_index == 5
+    assert "∞" in widget._block_label.text()
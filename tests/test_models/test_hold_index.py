@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tests de l'index spatial des prises (HoldIndex, Catalog.hold_index)."""
+from brlok.models import Catalog, GridDimensions, Hold, Position
+from brlok.storage.catalog_ops import update_hold_level
+from brlok.storage.catalog_store import create_default_catalog
+
+
+def _board(rows: int = 18, cols: int = 11) -> Catalog:
+    return create_default_catalog(GridDimensions(rows=rows, cols=cols))
+
+
+def test_lookup_par_id_et_position() -> None:
+    """get / at / is_occupied en O(1)."""
+    catalog = _board()
+    index = catalog.hold_index()
+    assert len(index) == 18 * 11
+    assert index.get("K18").position == Position(row=17, col=10)
+    assert index.at(0, 0).id == "A1"
+    assert index.get("Z99") is None
+    assert index.at(30, 30) is None
+    assert "B2" in index
+
+
+def test_neighbors_chebyshev() -> None:
+    """Voisinage : carré de rayon r, case centrale exclue, bords de grille respectés."""
+    index = _board().hold_index()
+    assert len(index.neighbors(5, 5, radius=1)) == 8
+    assert len(index.neighbors(5, 5, radius=2)) == 24
+    assert {h.id for h in index.neighbors(0, 0, radius=1)} == {"B1", "A2", "B2"}
+
+
+def test_active_in_levels_ordre_catalogue() -> None:
+    """Seaux par niveau : inactives exclues, ordre du catalogue conservé."""
+    catalog = Catalog(
+        holds=[
+            Hold(id="A1", level=3, tags=[], position=Position(row=0, col=0)),
+            Hold(id="B1", level=1, tags=[], position=Position(row=0, col=1)),
+            Hold(id="C1", level=2, tags=[], position=Position(row=0, col=2), active=False),
+            Hold(id="D1", level=2, tags=[], position=Position(row=0, col=3)),
+            Hold(id="E1", level=5, tags=[], position=Position(row=0, col=4)),
+        ],
+        grid=GridDimensions(rows=1, cols=5),
+    )
+    index = catalog.hold_index()
+    assert [h.id for h in index.active_in_levels(1, 3)] == ["A1", "B1", "D1"]
+    assert [h.id for h in index.active_by_level(2)] == ["D1"]
+
+
+def test_index_cache_et_invalidation() -> None:
+    """Même instance → même index ; catalogue modifié → index reconstruit."""
+    catalog = _board(7, 6)
+    index = catalog.hold_index()
+    assert catalog.hold_index() is index
+    updated = update_hold_level(catalog, "A1", 4)
+    assert updated.hold_index() is not index
+    assert updated.hold_index().get("A1").level == 4
+    assert catalog.hold_index().get("A1").level == 1
+
+
+def test_index_invalide_par_modification_en_place() -> None:
+    """Niveau, état actif, position ou prise remplacée en place → index reconstruit."""
+    catalog = _board(7, 6)
+    index = catalog.hold_index()
+    catalog.holds[0].level = 4
+    assert [h.id for h in catalog.hold_index().active_by_level(4)] == ["A1"]
+    catalog.holds[1].active = False
+    assert "B1" not in {h.id for h in catalog.hold_index().active_by_level(1)}
+    catalog.holds[2].position.row = 6
+    assert catalog.hold_index().at(0, 2) is None
+    catalog.holds[3] = Hold(id="X1", level=2, tags=[], position=Position(row=0, col=3))
+    assert catalog.hold_index().get("X1") is catalog.holds[3]
+    assert catalog.hold_index() is not index
+    rebuilt = catalog.hold_index()
+    assert catalog.hold_index() is rebuilt
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests des ensembles de prises en bitset (HoldSet)."""
+import pytest
+
+from brlok.models import GridDimensions, HoldSet
+from brlok.models.hold_set import popcount
+from brlok.storage.catalog_store import create_default_catalog
+
+
+def _index():
+    return create_default_catalog(GridDimensions(rows=18, cols=11)).hold_index()
+
+
+def test_holdset_appartenance_et_ordre() -> None:
+    """Membership par id, taille, itération dans l'ordre du catalogue, ids inconnus ignorés."""
+    index = _index()
+    hs = index.hold_set(["C2", "A1", "ZZ99"])
+    assert "A1" in hs and "C2" in hs
+    assert "B1" not in hs and "ZZ99" not in hs
+    assert len(hs) == 2
+    assert list(hs) == ["A1", "C2"]
+    hs.add("K18")
+    hs.discard("A1")
+    assert list(hs) == ["C2", "K18"]
+
+
+def test_holdset_operations() -> None:
+    """Union, intersection, différence, recouvrement, Jaccard."""
+    index = _index()
+    a = index.hold_set(["A1", "B1", "C1", "D1"])
+    b = index.hold_set(["C1", "D1", "E1"])
+    assert list(a | b) == ["A1", "B1", "C1", "D1", "E1"]
+    assert list(a & b) == ["C1", "D1"]
+    assert list(a - b) == ["A1", "B1"]
+    assert a.overlap(b) == 2
+    assert a.jaccard(b) == 2 / 5
+    assert a.jaccard(a) == 1.0
+    assert HoldSet(index).jaccard(HoldSet(index)) == 1.0
+    assert a.isdisjoint(index.hold_set(["K18"]))
+    assert a == index.hold_set(["D1", "C1", "B1", "A1"])
+
+
+def test_holdset_autre_catalogue() -> None:
+    """Combiner des ensembles de deux HoldIndex différents lève ValueError."""
+    a = _index().hold_set(["A1"])
+    b = _index().hold_set(["A1"])
+    for op in (lambda: a | b, lambda: a & b, lambda: a - b, lambda: a ^ b,
+               lambda: a.overlap(b), lambda: a.jaccard(b), lambda: a.isdisjoint(b)):
+        with pytest.raises(ValueError):
+            op()
+
+
+def test_popcount() -> None:
+    """popcount compatible Python < 3.10."""
+    assert popcount(0) == 0
+    assert popcount(0b1011) == 3
+    assert popcount(1 << 500 | 1) == 2
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests de la matrice de distances (ReachMatrix) et des contraintes de portée."""
+import math
+
+from brlok.generator import generate_session
+from brlok.models import Catalog, GridDimensions, Hold, Position
+from brlok.storage.catalog_store import create_default_catalog
+
+
+def _catalog() -> Catalog:
+    return Catalog(
+        holds=[
+            Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0)),
+            Hold(id="D1", level=2, tags=[], position=Position(row=0, col=3)),
+            Hold(id="D5", level=2, tags=[], position=Position(row=4, col=3)),
+        ],
+        grid=GridDimensions(rows=7, cols=6),
+    )
+
+
+def test_reach_matrix_distances_et_cache() -> None:
+    """Distances main-main et main-pied ; matrice mise en cache avec l'index."""
+    catalog = _catalog()
+    reach = catalog.reach_matrix()
+    assert reach is catalog.reach_matrix()
+    assert reach.distance("A1", "D1") == 3.0
+    assert reach.distance("D1", "D5") == 4.0
+    assert reach.distance("A1", "D5") == 5.0
+    assert reach.distance("A1", "Z9") == math.inf
+    # Pied (0, 3) : sous le pan, à la hauteur 7
+    assert reach.foot_distance("D5", (0, 3)) == 3.0
+    assert reach.feet_within("D5", [(0, 3), (3, 0)], 3.5) == [(0, 3)]
+    index = catalog.hold_index()
+    assert reach.reach_mask(index.slot_of("A1"), None, 3.5) == index.bit("D1")
+    assert reach.reach_mask(index.slot_of("A1"), 4.0, None) == index.bit("D5")
+    moved = catalog.model_copy(update={"holds": catalog.holds[:2]})
+    assert moved.reach_matrix() is not reach
+
+
+def test_generate_session_max_min_reach() -> None:
+    """Prises consécutives dans [min_reach, max_reach] ; pieds à portée du départ."""
+    catalog = create_default_catalog()
+    catalog = catalog.model_copy(
+        update={"holds": [h.model_copy(update={"level": 2}) for h in catalog.holds]}
+    )
+    reach = catalog.reach_matrix()
+    for seed in range(20):
+        session = generate_session(
+            catalog, target_level=2, blocks_count=3, holds_per_block=6,
+            max_reach=2.0, min_reach=1.5, seed=seed,
+        )
+        for block in session.blocks:
+            assert len(block.holds) >= 2
+            for a, b in zip(block.holds, block.holds[1:]):
+                assert 1.5 <= reach.distance(a.id, b.id) <= 2.0
+            for foot in block.foot_positions:
+                assert reach.foot_distance(block.holds[0].id, foot) <= 2.0
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Tests SessionTimings et TimingRecorder."""
+from datetime import datetime
+
+import pytest
+
+from brlok.models.session_timings import (
+    EVENT_BLOCK_END,
+    EVENT_BLOCK_START,
+    EVENT_PAUSE,
+    EVENT_REST,
+    EVENT_RESUME,
+    EVENT_SUCCESS,
+    EVENT_WORK,
+    SessionTimings,
+    decode_varints,
+    encode_varints,
+)
+from brlok.timer import TimingRecorder
+
+
+def test_varints_aller_retour() -> None:
+    """Encodage varint base64 réversible, 1 octet sous 128."""
+    values = [0, 1, 127, 128, 400, 16384, 10**9]
+    assert decode_varints(encode_varints(values)) == values
+    assert len(encode_varints([5, 6, 7])) == 4  # 3 octets → 4 caractères base64
+
+
+def test_recorder_chronologie() -> None:
+    """Blocs, rounds, pauses et statuts enregistrés ; durées par bloc hors pauses."""
+    now = [10.0]
+    rec = TimingRecorder(clock=lambda: now[0])
+    assert rec.timings() is None
+    rec.start(0)
+    now[0] = 12.0
+    rec.mark(EVENT_WORK)
+    now[0] = 52.0
+    rec.mark(EVENT_REST)
+    now[0] = 70.0
+    rec.mark(EVENT_SUCCESS)
+    rec.mark(EVENT_PAUSE)
+    now[0] = 100.0
+    rec.mark(EVENT_RESUME)
+    rec.enter_block(1)
+    now[0] = 145.55
+    timings = rec.timings()
+    assert isinstance(timings.started_at, datetime)
+    assert timings.kinds == "BWRSPUEBE"
+    events = timings.events()
+    assert [(e.kind, e.block) for e in events][-3:] == [
+        (EVENT_BLOCK_END, 0), (EVENT_BLOCK_START, 1), (EVENT_BLOCK_END, 1),
+    ]
+    assert events[2].t_s == pytest.approx(42.0)
+    assert timings.block_durations() == pytest.approx({0: 60.0, 1: 45.6})
+
+
+def test_taille_par_bloc() -> None:
+    """Chronologie d'un bloc de 3 rounds (8 événements) : quelques dizaines d'octets."""
+    events = []
+    t = 0.0
+    for block in range(10):
+        events.append((EVENT_BLOCK_START, t, block))
+        for _ in range(3):
+            events.append((EVENT_WORK, t, block))
+            t += 40
+            events.append((EVENT_REST, t, block))
+            t += 20
+        events.append((EVENT_BLOCK_END, t, block))
+    timings = SessionTimings.from_events(datetime(2026, 1, 1), events)
+    payload = len(timings.kinds) + len(timings.deltas) + len(timings.blocks)
+    assert payload / 10 < 40
+    assert [e.t_s for e in timings.events()] == pytest.approx([t for _, t, _ in events])
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Tests de l'instrumentation (spans, compteurs, histogrammes, rapports)."""
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from brlok import profiling
+
+
+@pytest.fixture(autouse=True)
+def _profiling_state():
+    """Mesure désactivée et vide avant et après chaque test ; pas de rapport atexit."""
+    profiling.disable()
+    profiling.reset()
+    with patch("brlok.profiling.atexit.register"):
+        yield
+    profiling.disable()
+    profiling.reset()
+    profiling._state.trace_path = None
+    profiling._state.exit_hooked = False
+
+
+@profiling.profiled
+def _work(x: int) -> int:
+    return x * 2
+
+
+def test_disabled_records_nothing() -> None:
+    """Désactivée : contexte vide partagé, aucun enregistrement."""
+    assert profiling.span("a") is profiling.span("b")
+    with profiling.span("a"):
+        pass
+    assert _work(2) == 4
+    profiling.count("c")
+    assert profiling.histogram("a") is None
+    assert profiling.counters() == {}
+
+
+def test_spans_counters_and_summary() -> None:
+    """Spans (contexte et décorateur) dans les histogrammes ; compteurs dans le tableau."""
+    profiling.enable()
+    for _ in range(3):
+        with profiling.span("storage.load"):
+            pass
+    assert _work(3) == 6
+    profiling.count("cache.hit", 2)
+    assert profiling.histogram("storage.load").count == 3
+    assert profiling.histogram("tests.test_profiling._work").count == 1
+    assert profiling.counters() == {"cache.hit": 2}
+    table = profiling.summary_table()
+    assert "storage.load" in table and "tests.test_profiling._work" in table
+    assert "cache.hit" in table
+
+
+def test_chrome_trace(tmp_path: Path) -> None:
+    """La trace Chrome contient un événement complet par span."""
+    out = tmp_path / "trace.json"
+    profiling.enable(trace_path=out, summary=False)
+    with profiling.span("generator.pick"):
+        pass
+    profiling._dump()
+    data = json.loads(out.read_text(encoding="utf-8"))
+    (event,) = data["traceEvents"]
+    assert event["name"] == "generator.pick"
+    assert event["ph"] == "X" and event["cat"] == "generator"
+    assert event["dur"] >= 0
+
+
+def test_histogram_percentile() -> None:
+    """Percentile au rang le plus proche."""
+    hist = profiling.Histogram()
+    for v in range(1, 101):
+        hist.observe(float(v))
+    assert hist.percentile(50) == 50.0
+    assert hist.percentile(95) == 95.0
+    assert hist.percentile(100) == 100.0
+
+
+def test_histogram_borne() -> None:
+    """Échantillons bornés ; nombre, total et maximum restent exacts."""
+    hist = profiling.Histogram()
+    n = profiling.MAX_HISTOGRAM_SAMPLES * 5 + 7
+    for v in range(n):
+        hist.observe(float(v))
+    assert len(hist.samples) <= profiling.MAX_HISTOGRAM_SAMPLES
+    assert hist.count == n
+    assert hist.total == sum(range(n))
+    assert hist.max == n - 1
+    assert hist.percentile(50) == pytest.approx(n / 2, rel=0.01)
+
+
+def test_plan_cache_counters() -> None:
+    """Succès et échecs du cache des plans comptés."""
+    from brlok.generator.plan import clear_plan_cache, compile_template
+    from brlok.models.session_template import SessionTemplate
+
+    clear_plan_cache()
+    profiling.enable(summary=False)
+    template = SessionTemplate(id="t1", name="T")
+    compile_template(template)
+    compile_template(template)
+    assert profiling.counters() == {"plan_cache.miss": 1, "plan_cache.hit": 1}
+
+
+def test_main_profile_args() -> None:
+    """``python -m brlok --profile`` active la mesure et laisse la GUI sans argument."""
+    from brlok.main import _has_cli_args, _take_profile_args
+
+    with patch.object(sys, "argv", ["python", "-m", "brlok", "--profile"]):
+        _take_profile_args()
+        assert profiling.is_enabled()
+        assert not _has_cli_args()
+
+
+def test_generator_stages() -> None:
+    """Une génération mesure la séance et ses étapes (filtrage, pieds, tirage)."""
+    from brlok.generator import generate_session
+    from brlok.models import Catalog, GridDimensions, Hold, Position
+
+    catalog = Catalog(
+        holds=[Hold(id=f"A{i}", level=2, tags=[], position=Position(row=i, col=0)) for i in range(4)],
+        grid=GridDimensions(rows=4, cols=8),
+    )
+    profiling.enable(summary=False)
+    generate_session(catalog, target_level=2, blocks_count=2, seed=1)
+    for name in ("generator.session_generator.generate_session", "generator.filter", "generator.feet", "generator.pick"):
+        assert profiling.histogram(name).count == 1
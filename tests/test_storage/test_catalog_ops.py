@@ -139,3 +139,25 @@ def test_update_hold_active_persistance(tmp_path: Path) -> None:
         save_catalog(catalog)
         loaded = load_catalog()
         assert loaded.holds[0].active is False
+
+
+def test_position_to_id_colonnes_larges() -> None:
+    """Au-delà de Z, ids type tableur (AA1, AB2…) pour les grandes grilles."""
+    from brlok.storage.catalog_ops import _position_to_id
+
+    assert _position_to_id(0, 0) == "A1"
+    assert _position_to_id(9, 25) == "Z10"
+    assert _position_to_id(0, 26) == "AA1"
+    assert _position_to_id(1, 27) == "AB2"
+
+
+def test_ensure_full_grid_ignore_grille_libre() -> None:
+    """Grille libre : aucune prise ajoutée même si les dimensions valent 7×6."""
+    from brlok.storage.catalog_ops import ensure_full_grid
+
+    catalog = Catalog(
+        holds=[Hold(id="A1", level=2, tags=[], position=Position(row=0, col=0))],
+        grid=GridDimensions(rows=7, cols=6),
+        free_grid=True,
+    )
+    assert ensure_full_grid(catalog) is catalog
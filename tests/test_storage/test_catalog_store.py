@@ -108,3 +108,19 @@ def test_load_invalid_catalog_data_returns_default(tmp_path: Path) -> None:
         assert len(catalog.holds) >= 1
         assert catalog.grid.rows == 7
         assert catalog.grid.cols == 6
+
+
+def test_grille_libre_round_trip(tmp_path: Path) -> None:
+    """free_grid : dimensions et prises hors 7×6 conservées au save/load."""
+    from brlok.storage.catalog_store import create_default_catalog
+
+    p1, p2, p3 = _patch_collection_paths(tmp_path)
+    with p1, p2, p3:
+        catalog = create_default_catalog(GridDimensions(rows=18, cols=11))
+        assert catalog.free_grid
+        save_catalog(catalog)
+        loaded = load_catalog()
+        assert loaded.free_grid
+        assert (loaded.grid.rows, loaded.grid.cols) == (18, 11)
+        assert len(loaded.holds) == 18 * 11
+        assert loaded.hold_index().at(17, 10).id == "K18"
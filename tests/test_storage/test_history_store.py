@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 """Tests du stockage historique (7.4)."""
+import io
+import json
 from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
-from brlok.models import Block, CompletedSession, Hold, Position, Session, SessionConstraints
-from brlok.storage.history_store import add_to_history, get_by_id, load_history, save_history
+from brlok.models import Block, CompletedSession, Hold, Position, Session, SessionConstraints, SessionTimings
+from brlok.storage.history_store import (
+    _iter_json_array,
+    add_to_history,
+    get_by_id,
+    iter_history,
+    load_history,
+    save_history,
+)
 
 
 def _make_session(n_blocks: int = 2) -> Session:
@@ -61,3 +70,75 @@ def test_get_by_id(tmp_path: pytest.TempPathFactory) -> None:
         assert found is not None
         assert found.id == entry.id
         assert get_by_id("inexistant") is None
+
+
+def test_add_to_history_timings(tmp_path: pytest.TempPathFactory) -> None:
+    """La chronologie compacte est relue telle quelle ; quelques octets par bloc."""
+    from brlok.models.session_timings import EVENT_BLOCK_END, EVENT_BLOCK_START, EVENT_WORK
+
+    path = tmp_path / "sessions.json"
+    events = [
+        (EVENT_BLOCK_START, 0.0, 0), (EVENT_WORK, 2.0, 0), (EVENT_BLOCK_END, 95.3, 0),
+        (EVENT_BLOCK_START, 95.3, 1), (EVENT_WORK, 97.0, 1), (EVENT_BLOCK_END, 190.0, 1),
+    ]
+    timings = SessionTimings.from_events(datetime(2026, 1, 5, 18, 0), events)
+    with patch("brlok.storage.history_store._get_history_path", return_value=path):
+        add_to_history(_make_session(), {0: "success"}, timings=timings)
+        size_with = path.stat().st_size
+        save_history([s.model_copy(update={"timings": None}) for s in load_history()])
+        size_without = path.stat().st_size
+        save_history([s.model_copy(update={"timings": timings}) for s in load_history()])
+        loaded = load_history()[0].timings
+    assert loaded == timings
+    assert loaded.block_durations() == pytest.approx({0: 95.3, 1: 94.7})
+    assert size_with - size_without < 200
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 64, 65536])
+def test_iter_json_array_par_morceaux(chunk: int) -> None:
+    """Décodage incrémental identique à json.load, quelle que soit la taille des lectures."""
+    doc = {
+        "version": 1,
+        "avant": {"x": [1, 2.5, None]},
+        "sessions": [{"id": i, "v": -1.25e3, "t": "é\"\\", "ok": i % 2 == 0} for i in range(20)],
+        "apres": 12345,
+    }
+    with patch("brlok.storage.history_store._READ_CHUNK", chunk):
+        for indent in (None, 2):
+            text = json.dumps(doc, indent=indent, ensure_ascii=False)
+            assert list(_iter_json_array(io.StringIO(text), "sessions")) == doc["sessions"]
+        assert list(_iter_json_array(io.StringIO('{"version": 1}'), "sessions")) == []
+
+
+def test_iter_history_en_flux(tmp_path: pytest.TempPathFactory) -> None:
+    """Entrées lues au fil du fichier ; une entrée corrompue est ignorée, un JSON tronqué arrête la lecture."""
+    path = tmp_path / "sessions.json"
+    with patch("brlok.storage.history_store._get_history_path", return_value=path):
+        for _ in range(3):
+            add_to_history(_make_session(), {})
+        data = json.loads(path.read_text(encoding="utf-8"))
+        ids = [s["id"] for s in data["sessions"]]
+        data["sessions"].insert(1, {"id": "corrompue"})
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        size = len(path.read_text(encoding="utf-8"))
+        read_sizes: list[int] = []
+        real_open = open
+
+        def spy_open(*args, **kwargs):
+            f = real_open(*args, **kwargs)
+            real_read = f.read
+            f.read = lambda n=-1: read_sizes.append(n) or real_read(n)
+            return f
+
+        with patch("brlok.storage.history_store._READ_CHUNK", 256), \
+                patch("brlok.storage.history_store.open", spy_open, create=True):
+            it = iter_history()
+            assert next(it).id == ids[0]
+            # Première entrée produite sans lire tout le fichier
+            assert read_sizes and -1 not in read_sizes and sum(read_sizes) < size
+            assert [e.id for e in it] == ids[1:]
+
+        text = path.read_text(encoding="utf-8")
+        path.write_text(text[: text.index(ids[2]) - 20], encoding="utf-8")
+        assert [e.id for e in load_history()] == ids[:2]
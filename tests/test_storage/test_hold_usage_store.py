@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Tests de l'usage des prises (variété inter-séances, décroissance)."""
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from brlok.models import Block, Catalog, GridDimensions, Hold, Position, Session, SessionConstraints
+from brlok.storage.catalog_collection_store import add_catalog, load_collection, remove_catalog
+from brlok.storage.hold_usage_store import (
+    HALF_LIFE_DAYS,
+    clear_usage,
+    load_usage_prior,
+    record_usage,
+    used_hold_ids,
+)
+from brlok.storage.history_store import add_to_history
+
+
+def _session() -> Session:
+    def block(ids: list[str]) -> Block:
+        return Block(holds=[Hold(id=i, level=2, tags=[], position=Position(row=0, col=n)) for n, i in enumerate(ids)])
+
+    return Session(
+        blocks=[block(["A1", "B1"]), block(["B1", "C1"])],
+        constraints=SessionConstraints(target_level=2),
+    )
+
+
+@pytest.fixture
+def usage_path(tmp_path: Path):
+    path = tmp_path / "hold_usage.json"
+    with patch("brlok.storage.hold_usage_store._get_path", return_value=path):
+        yield path
+
+
+def test_record_usage_et_decroissance(usage_path: Path) -> None:
+    """Une utilisation vaut 1 ; divisée par 2 après une demi-vie ; cumul avec décroissance."""
+    t0 = datetime(2026, 1, 1, 12, 0)
+    record_usage("pan", ["A1", "A1", "B1"], when=t0)
+    assert load_usage_prior("pan", now=t0) == {"A1": 2.0, "B1": 1.0}
+    later = t0 + timedelta(days=HALF_LIFE_DAYS)
+    assert load_usage_prior("pan", now=later)["A1"] == pytest.approx(1.0)
+    record_usage("pan", ["B1"], when=later)
+    assert load_usage_prior("pan", now=later)["B1"] == pytest.approx(1.5)
+    assert load_usage_prior("autre", now=later) == {}
+    assert load_usage_prior(None) == {}
+
+
+def test_record_usage_entree_corrompue(usage_path: Path) -> None:
+    """Une entrée mal formée est ignorée (repart de zéro) au lieu de lever une exception."""
+    t0 = datetime(2026, 1, 1, 12, 0)
+    usage_path.write_text(
+        '{"by_catalog": {"pan": {"A1": 3, "B1": ["x"], "C1": [1.0, "2026-01-01T12:00:00"]}}}',
+        encoding="utf-8",
+    )
+    record_usage("pan", ["A1", "B1", "C1"], when=t0)
+    assert load_usage_prior("pan", now=t0) == {"A1": 1.0, "B1": 1.0, "C1": 2.0}
+    usage_path.write_text('{"by_catalog": {"pan": [1, 2]}}', encoding="utf-8")
+    record_usage("pan", ["A1"], when=t0)
+    assert load_usage_prior("pan", now=t0) == {"A1": 1.0}
+
+
+@pytest.mark.parametrize("content", [
+    '{"by_catalog": [1, 2]}',
+    '{"by_catalog": {"pan": [1, 2]}}',
+    '{"by_catalog": {"pan": {"A1": {"score": 1}}}}',
+])
+def test_load_usage_prior_fichier_corrompu(usage_path: Path, content: str) -> None:
+    """Structure inattendue : aucun prior (pas d'AttributeError à la génération)."""
+    usage_path.write_text(content, encoding="utf-8")
+    assert load_usage_prior("pan") == {}
+    clear_usage("pan")
+
+
+def test_remove_catalog_efface_usage(tmp_path: Path, usage_path: Path) -> None:
+    """Supprimer un catalogue efface l'usage de ses prises."""
+    with patch("brlok.storage.catalog_collection_store._get_collection_path", return_value=tmp_path / "coll.json"), \
+            patch("brlok.storage.catalog_collection_store._get_catalog_path", return_value=tmp_path / "catalog.json"):
+        load_collection()
+        entry = add_catalog("Second", Catalog(holds=[], grid=GridDimensions(rows=7, cols=6)))
+        record_usage(entry.id, ["A1"])
+        record_usage("default", ["A1"])
+        assert remove_catalog(entry.id)
+    assert load_usage_prior(entry.id) == {}
+    assert load_usage_prior("default") != {}
+
+
+def test_used_hold_ids_blocs_marques() -> None:
+    """Blocs marqués uniquement ; tous les blocs si aucun statut."""
+    session = _session()
+    assert used_hold_ids(session, {}) == ["A1", "B1", "B1", "C1"]
+    assert used_hold_ids(session, {1: "fail"}) == ["B1", "C1"]
+
+
+def test_add_to_history_alimente_usage(tmp_path: Path, usage_path: Path) -> None:
+    """add_to_history avec catalog_id met à jour l'usage ; sans catalog_id, non."""
+    with patch("brlok.storage.history_store._get_history_path", return_value=tmp_path / "sessions.json"):
+        add_to_history(_session(), {0: "success"})
+        assert not usage_path.exists()
+        add_to_history(_session(), {0: "success"}, catalog_id="pan")
+    prior = load_usage_prior("pan")
+    assert set(prior) == {"A1", "B1"}
+    assert prior["A1"] == pytest.approx(1.0, rel=1e-3)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Tests du filtre de Bloom des blocs récents (avoid_recent_days)."""
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from brlok.generator import generate_session
+from brlok.models import Block, Catalog, CompletedSession, GridDimensions, Hold, Position, Session, SessionConstraints
+from brlok.storage.history_store import add_to_history, save_history
+from brlok.storage.recent_blocks import BloomFilter, invalidate_recent_blocks, recent_blocks_filter
+
+
+def _hold(hid: str, col: int) -> Hold:
+    return Hold(id=hid, level=2, tags=[], position=Position(row=0, col=col))
+
+
+def _session(*sequences: list[str]) -> Session:
+    return Session(
+        blocks=[Block(holds=[_hold(h, i) for i, h in enumerate(seq)]) for seq in sequences],
+        constraints=SessionConstraints(target_level=2),
+    )
+
+
+@pytest.fixture
+def history_path(tmp_path: Path):
+    invalidate_recent_blocks()
+    path = tmp_path / "sessions.json"
+    with patch("brlok.storage.history_store._get_history_path", return_value=path):
+        yield path
+    invalidate_recent_blocks()
+
+
+def test_bloom_filter_sans_faux_negatif() -> None:
+    """Toutes les clés ajoutées sont trouvées ; faux positifs rares."""
+    bloom = BloomFilter(1000)
+    for i in range(1000):
+        bloom.add(f"k{i}")
+    assert all(f"k{i}" in bloom for i in range(1000))
+    false_positives = sum(f"x{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_recent_blocks_filter_fenetre_et_hook(history_path: Path) -> None:
+    """Fenêtre en jours, ensemble de prises sans ordre, mise à jour par add_to_history."""
+    now = datetime.now()
+    save_history([
+        CompletedSession(id="old", date=now - timedelta(days=30), session=_session(["A1", "B1"])),
+        CompletedSession(id="new", date=now - timedelta(days=2), session=_session(["C1", "D1"])),
+    ])
+    flt = recent_blocks_filter(7)
+    assert flt.contains(["C1", "D1"])
+    assert flt.contains(["D1", "C1"])
+    assert not flt.contains(["A1", "B1"])
+    add_to_history(_session(["E1", "F1"]), {})
+    assert recent_blocks_filter(7) is flt
+    assert flt.contains(["E1", "F1"])
+    # La séance de J-2 sort de la fenêtre : reconstruction
+    later = recent_blocks_filter(7, now=now + timedelta(days=6))
+    assert later is not flt
+    assert not later.contains(["C1", "D1"])
+    assert later.contains(["E1", "F1"])
+
+
+def test_generate_session_avoid_recent_days(history_path: Path) -> None:
+    """Avec avoid_recent_days, le seul bloc non grimpé récemment est choisi."""
+    catalog = Catalog(
+        holds=[_hold(h, i) for i, h in enumerate(["A1", "B1", "C1"])],
+        grid=GridDimensions(rows=1, cols=3),
+    )
+    add_to_history(_session(["A1", "B1"], ["A1", "C1"]), {})
+    for seed in range(10):
+        session = generate_session(
+            catalog, target_level=2, blocks_count=1, holds_per_block=2, seed=seed, avoid_recent_days=7
+        )
+        assert sorted(h.id for h in session.blocks[0].holds) == ["B1", "C1"]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Tests de la recherche de blocs similaires (MinHash/LSH)."""
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from brlok.models import Block, Hold, Position, Session, SessionConstraints
+from brlok.storage import similarity_index
+from brlok.storage.favorites_store import add_favorite
+from brlok.storage.history_store import add_to_history, save_history
+from brlok.storage.similarity_index import (
+    SOURCE_FAVORITE,
+    SOURCE_HISTORY,
+    SimilarityIndex,
+    block_shingles,
+    find_similar_blocks,
+)
+
+
+def _block(ids: list[str], title: str | None = None) -> Block:
+    holds = [
+        Hold(id=hid, level=2, tags=[], position=Position(row=i // 6, col=i % 6))
+        for i, hid in enumerate(ids)
+    ]
+    return Block(holds=holds, title=title)
+
+
+@pytest.fixture(autouse=True)
+def _index_vierge():
+    """Aucun index partagé entre les tests."""
+    similarity_index.invalidate_similarity_index()
+    yield
+    similarity_index.invalidate_similarity_index()
+
+
+def test_shingles_prises_et_ordre() -> None:
+    """Shingles : prises + paires consécutives ; l'ordre change les paires."""
+    assert block_shingles(_block(["A1", "B2", "C3"])) == {"h:A1", "h:B2", "h:C3", "p:A1>B2", "p:B2>C3"}
+    assert block_shingles(_block(["A1", "B2"])) != block_shingles(_block(["B2", "A1"]))
+
+
+def test_query_classement_et_exclusion() -> None:
+    """Le bloc le plus proche (recouvrement + ordre) sort en tête ; exclusion du bloc identique."""
+    index = SimilarityIndex()
+    rng = random.Random(1)
+    ids = [f"{chr(65 + c)}{r + 1}" for r in range(7) for c in range(6)]
+    for _ in range(300):
+        index.add(_block(rng.sample(ids, 8)), SOURCE_HISTORY)
+    target = ["A1", "B2", "C3", "D4", "E5", "F6", "A7", "B7"]
+    index.add(_block(target), SOURCE_FAVORITE, catalog_id="pan")
+    near = target[:7] + ["C7"]
+    index.add(_block(near), SOURCE_HISTORY)
+
+    results = index.query(_block(target), k=3)
+    assert [h.id for h in results[0].block.holds] == target
+    assert results[0].score == 1.0
+    assert [h.id for h in results[1].block.holds] == near
+    results = index.query(_block(target), k=3, exclude_identical=True)
+    assert [h.id for h in results[0].block.holds] == near
+    # Blocs d'un autre catalogue ignorés ; historique non rattaché gardé seulement sans catalogue
+    index.add(_block(near[:6]), SOURCE_HISTORY, catalog_id="autre")
+    assert [r.catalog_id for r in index.query(_block(target), k=3, catalog_id="autre")] == ["autre"]
+    assert [r.catalog_id for r in index.query(_block(target), k=3, catalog_id="pan")] == ["pan"]
+
+
+def test_doublons_historique_et_retrait() -> None:
+    """Même séquence dans l'historique : une seule entrée (la plus récente)."""
+    index = SimilarityIndex()
+    index.add(_block(["A1", "B2"]), SOURCE_HISTORY, session_id="old")
+    index.add(_block(["A1", "B2"]), SOURCE_HISTORY, session_id="new")
+    assert len(index) == 1
+    assert index.query(_block(["A1", "B2"]))[0].session_id == "new"
+    index.sync_favorites("pan", [_block(["C3", "D4"])])
+    assert len(index) == 2
+    index.sync_favorites("pan", [])
+    assert len(index) == 1
+
+
+def test_index_mis_a_jour_par_les_stores(tmp_path: Path) -> None:
+    """add_favorite / add_to_history alimentent l'index déjà construit ; save_history l'invalide."""
+    with (
+        patch("brlok.storage.favorites_store._get_favorites_path", return_value=tmp_path / "favorites.json"),
+        patch("brlok.storage.history_store._get_history_path", return_value=tmp_path / "sessions.json"),
+        patch("brlok.storage.hold_usage_store._get_path", return_value=tmp_path / "hold_usage.json"),
+    ):
+        assert find_similar_blocks(_block(["A1", "B2", "C3"])) == []
+        add_favorite(_block(["A1", "B2", "C3"], title="Fav"), catalog_id="pan")
+        session = Session(blocks=[_block(["A1", "B2", "D4"])], constraints=SessionConstraints(target_level=2))
+        add_to_history(session, {0: "done"}, catalog_id="pan")
+        add_to_history(session.model_copy(), {0: "done"}, catalog_id="autre")
+
+        results = find_similar_blocks(_block(["A1", "B2", "C3"]), catalog_id="pan")
+        assert [r.source for r in results] == [SOURCE_FAVORITE, SOURCE_HISTORY]
+        assert results[0].block.title == "Fav"
+        assert results[1].catalog_id == "pan"
+
+        save_history([])
+        assert similarity_index._index is None
+        results = find_similar_blocks(_block(["A1", "B2", "C3"]), catalog_id="pan")
+        assert [r.source for r in results] == [SOURCE_FAVORITE]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Tests du cache de lecture des templates."""
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from brlok.storage import templates_store
+from brlok.storage.templates_store import get_template, load_templates, rename_template
+
+
+def test_load_templates_cache_mtime(tmp_path: Path) -> None:
+    """Relecture seulement si le fichier change ; les sauvegardes restent visibles."""
+    path = tmp_path / "templates.json"
+    with patch("brlok.storage.templates_store._get_path", return_value=path):
+        templates = load_templates()
+        assert templates
+        tid = templates[0].id
+        with patch.object(templates_store.json, "load", wraps=json.load) as spy:
+            load_templates()
+            get_template(tid)
+            assert spy.call_count == 0
+            assert rename_template(tid, "Renommé")
+            assert get_template(tid).name == "Renommé"
+            assert spy.call_count == 0  # la sauvegarde met le cache à jour
+            # Modification externe : taille et mtime différents → relecture
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["templates"] = data["templates"][:1]
+            path.write_text(json.dumps(data), encoding="utf-8")
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert len(load_templates()) == 1
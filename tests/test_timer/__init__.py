@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Tests du moteur de timer."""
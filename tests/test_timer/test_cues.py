@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Tests des signaux sonores du timer."""
+import wave
+from pathlib import Path
+
+from brlok.timer import build_schedule
+from brlok.timer.cues import (
+    CUE_COUNTDOWN,
+    CUE_END,
+    CUE_REST,
+    CUE_TONES,
+    CUE_WORK,
+    SAMPLE_RATE,
+    CueTrack,
+    ensure_cue_files,
+    synthesize,
+)
+
+
+def test_synthesize_periode_exacte() -> None:
+    """Bip de la durée demandée, période répétée, fondu aux extrémités."""
+    samples = synthesize(882, 0.1)
+    assert len(samples) == int(SAMPLE_RATE * 0.1)
+    period = SAMPLE_RATE // 882
+    assert samples[500] == samples[500 + period]
+    assert samples[0] == 0 and abs(samples[-1]) < 100
+    assert max(samples) > 9000
+
+
+def test_ensure_cue_files(tmp_path: Path) -> None:
+    """Un WAV par signal, réutilisé s'il existe déjà."""
+    paths = ensure_cue_files(tmp_path / "sounds")
+    assert set(paths) == set(CUE_TONES)
+    with wave.open(str(paths[CUE_END]), "rb") as w:
+        assert w.getframerate() == SAMPLE_RATE
+        assert w.getnframes() == int(SAMPLE_RATE * CUE_TONES[CUE_END][1])
+    mtime = paths[CUE_WORK].stat().st_mtime_ns
+    assert ensure_cue_files(tmp_path / "sounds")[CUE_WORK].stat().st_mtime_ns == mtime
+
+
+def test_cue_track_planification() -> None:
+    """Instants des signaux connus d'avance et rendus une seule fois."""
+    track = CueTrack(build_schedule("40/20", work_s=40, rest_s=20, rounds=1))
+    assert track.take_until(0.5) == [(0.0, CUE_WORK)]
+    assert track.take_until(0.5) == []
+    assert track.peek() == (37.0, CUE_COUNTDOWN)
+    assert track.take_until(40.0) == [
+        (37.0, CUE_COUNTDOWN), (38.0, CUE_COUNTDOWN), (39.0, CUE_COUNTDOWN), (40.0, CUE_REST),
+    ]
+    track.seek(59.5)
+    assert track.take_until(60.0) == [(60.0, CUE_END)]
+    assert track.peek() is None
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Tests IntervalEngine (horloge simulée)."""
+import pytest
+
+from brlok.timer import IntervalEngine
+from brlok.timer.engine import PHASE_COUNTUP
+from brlok.timer.schedule import PHASE_REST, PHASE_WORK
+
+
+class FakeClock:
+    """Horloge monotone contrôlée par le test."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+INTERVALS = [(PHASE_WORK, 40, 1), (PHASE_REST, 20, 1), (PHASE_WORK, 40, 2), (PHASE_REST, 20, 2)]
+
+
+def test_state_depuis_horloge() -> None:
+    """Phase, round et restant calculés à partir du temps écoulé, sans ticks."""
+    clock = FakeClock()
+    engine = IntervalEngine(INTERVALS, clock=clock)
+    assert engine.state().phase == "" and not engine.running
+    engine.start()
+    clock.now += 12.5
+    st = engine.state()
+    assert (st.phase, st.round, st.interval) == (PHASE_WORK, 1, 0)
+    assert st.remaining_s == pytest.approx(27.5)
+    # Boucle d'événements bloquée 50 s : l'état saute directement au bon intervalle
+    clock.now += 50
+    st = engine.state()
+    assert (st.phase, st.round, st.interval) == (PHASE_WORK, 2, 2)
+    assert st.elapsed_s == pytest.approx(62.5)
+    clock.now += 1000
+    st = engine.state()
+    assert st.finished and st.elapsed_s == engine.total_s == 120
+
+
+def test_pause_resume() -> None:
+    """Les pauses ne sont pas décomptées."""
+    clock = FakeClock()
+    engine = IntervalEngine(INTERVALS, clock=clock)
+    engine.start()
+    clock.now += 30
+    engine.pause()
+    clock.now += 300
+    assert engine.paused and engine.elapsed() == pytest.approx(30)
+    engine.resume()
+    clock.now += 15
+    st = engine.state()
+    assert (st.phase, st.round) == (PHASE_REST, 1)
+    assert st.remaining_s == pytest.approx(15)
+    engine.stop()
+    assert engine.elapsed() == 0.0
+
+
+def test_chronometre() -> None:
+    """Sans intervalles : chronomètre qui ne se termine pas."""
+    clock = FakeClock()
+    engine = IntervalEngine(clock=clock)
+    engine.start()
+    clock.now += 3600.25
+    st = engine.state()
+    assert st.phase == PHASE_COUNTUP and not st.finished
+    assert st.elapsed_s == pytest.approx(3600.25)
+    assert engine.total_s is None
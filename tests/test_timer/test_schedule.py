@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Tests des programmes d'intervalles compilés."""
+import pytest
+
+from brlok.models.session_template import BlockConfig
+from brlok.timer import IntervalEngine, build_schedule, schedule_from_blocks
+from brlok.timer.schedule import (
+    MODE_40_20,
+    MODE_ECHELLE,
+    MODE_EMOM,
+    MODE_PYRAMIDE,
+    MODE_TABATA,
+    PHASE_REST,
+    PHASE_WORK,
+)
+
+
+def _durations(schedule) -> list[float]:
+    return [seg.duration_s for seg in schedule]
+
+
+def test_modes_compiles() -> None:
+    """Chaque mode donne la chronologie complète attendue."""
+    assert _durations(build_schedule(MODE_40_20, work_s=40, rest_s=20, rounds=2)) == [40, 20, 40, 20]
+    assert _durations(build_schedule(MODE_PYRAMIDE, rounds=3, work_min=20, work_max=60)) == [
+        20, 10, 40, 20, 60, 30,
+    ]
+    assert _durations(build_schedule(MODE_EMOM, work_s=58, rounds=2)) == [55, 5, 55, 5]
+    tabata = build_schedule(MODE_TABATA, work_s=99, rounds=8)
+    assert tabata.total_s == 240 and tabata.rounds == 8
+    assert _durations(build_schedule(MODE_ECHELLE, work_s=10, rest_s=30, rounds=3)) == [
+        10, 30, 20, 30, 30, 30,
+    ]
+
+
+def test_locate_et_bornes() -> None:
+    """Recherche du segment courant par dichotomie sur les fins de segments."""
+    schedule = build_schedule(MODE_40_20, work_s=40, rest_s=20, rounds=3)
+    assert schedule.locate(0) == 0
+    assert schedule.locate(39.9) == 0
+    assert schedule.locate(40) == 1
+    assert schedule.locate(125) == 4
+    assert schedule.locate(180) == len(schedule) == 6
+    assert (schedule.start_of(4), schedule.end_of(4)) == (120, 160)
+    assert (schedule[4].phase, schedule[4].round) == (PHASE_WORK, 3)
+
+
+def test_schedule_from_blocks_et_seek() -> None:
+    """Template converti sans widget ; saut direct dans le programme."""
+    schedule = schedule_from_blocks(
+        [BlockConfig(work_s=30, rest_s=15, rounds=2), BlockConfig(work_s=45, rest_s=15, rounds=1)]
+    )
+    assert [(s.phase, s.round, s.block) for s in schedule][-2:] == [(PHASE_WORK, 1, 1), (PHASE_REST, 1, 1)]
+    assert schedule.total_s == 150
+    now = [0.0]
+    engine = IntervalEngine(schedule, clock=lambda: now[0])
+    engine.start()
+    engine.seek(100)
+    st = engine.state()
+    assert (st.phase, st.block, st.round) == (PHASE_WORK, 1, 1)
+    assert st.remaining_s == pytest.approx(35)